@@ -0,0 +1,70 @@
+"""Audio buffer concatenation, WAV encoding, memory-mapped reads and take
+post-processing on synthetic signals.
+
+Input callbacks are simulated with fixed-size NumPy blocks, so no audio
+device (or sounddevice) is needed.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from typing import Dict, List
+
+from common import timeit
+
+
+BLOCK_FRAMES = 512
+
+
+def run(durations: List[float], samplerate: int = 48000, repeat: int = 3) -> Dict:
+    try:
+        import numpy as np
+        import soundfile as sf
+    except Exception as e:
+        return {"skipped": f"audio dependencies unavailable: {e}"}
+
+    import recordings
+
+    try:
+        import audio_processing
+    except ImportError:  # SciPy missing
+        audio_processing = None
+
+    results = []
+    rng = np.random.default_rng(0)
+    for seconds in durations:
+        frames = int(seconds * samplerate)
+        t = np.arange(frames, dtype=np.float32) / samplerate
+        signal = (0.3 * np.sin(2 * np.pi * 220 * t) + 0.01 * rng.standard_normal(frames)).astype(np.float32)
+        blocks = [signal[i : i + BLOCK_FRAMES].reshape(-1, 1).copy() for i in range(0, frames, BLOCK_FRAMES)]
+
+        concat = timeit(lambda: np.concatenate(blocks, axis=0), repeat)
+        data = np.concatenate(blocks, axis=0)
+        enhance = timeit(lambda: audio_processing.enhance(data, samplerate), repeat) if audio_processing else None
+
+        fd, path = tempfile.mkstemp(suffix=".wav")
+        os.close(fd)
+        try:
+            encode = timeit(lambda: sf.write(path, data, samplerate, subtype="PCM_16"), repeat)
+
+            def open_and_seek():
+                clip = recordings.open_recording(path)
+                clip.read(clip.frames // 2, BLOCK_FRAMES)
+                clip.close()
+
+            mapped = timeit(open_and_seek, repeat)
+        finally:
+            os.remove(path)
+
+        results.append(
+            {
+                "seconds": seconds,
+                "blocks": len(blocks),
+                "concatenate": concat,
+                "wav_encode_pcm16": encode,
+                "mapped_open_and_read": mapped,
+                "enhance": enhance,
+            }
+        )
+    return {"samplerate": samplerate, "block_frames": BLOCK_FRAMES, "runs": results}
@@ -0,0 +1,37 @@
+"""Essay analysis latency on synthetic essays built from the bundled word list."""
+
+from __future__ import annotations
+
+import random
+from typing import Dict, List
+
+from common import timeit
+
+
+def make_essay(words: int, seed: int = 0) -> str:
+    import essay_analysis
+
+    rng = random.Random(seed)
+    with open(essay_analysis.WORD_FREQ_PATH, encoding="utf-8") as f:
+        vocab = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+    sentences, total = [], 0
+    while total < words:
+        n = min(rng.randint(6, 28), words - total)
+        sentence = " ".join(rng.choice(vocab) for _ in range(n))
+        if rng.random() < 0.2:
+            sentence = rng.choice(essay_analysis.TRANSITIONS).capitalize() + ", " + sentence
+        sentences.append(sentence.capitalize() + ".")
+        total += n
+    return " ".join(sentences)
+
+
+def run(sizes: List[int], repeat: int = 3) -> Dict:
+    import essay_analysis
+
+    load = timeit(essay_analysis.FrequencyTable.load, repeat)
+    table = essay_analysis.frequency_table()
+    results = []
+    for words in sizes:
+        text = make_essay(words)
+        results.append({"words": words, "analyze": timeit(lambda: essay_analysis.analyze(text, table), repeat)})
+    return {"word_list": len(table), "load_word_list": load, "runs": results}
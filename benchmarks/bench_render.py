@@ -0,0 +1,49 @@
+"""_render_rows time and widget count of the section screens under a hidden Tk root."""
+
+from __future__ import annotations
+
+from typing import Dict, List
+
+from common import make_scored_items, make_speaking_items, timeit
+
+import storage
+
+
+def _count_widgets(widget) -> int:
+    return 1 + sum(_count_widgets(child) for child in widget.winfo_children())
+
+
+def run(sizes: List[int], repeat: int = 3) -> Dict:
+    try:
+        import tkinter as tk
+
+        root = tk.Tk()
+    except Exception as e:  # no display available
+        return {"skipped": f"Tk unavailable: {e}"}
+    root.withdraw()
+
+    from screens.listening import ListeningScreen
+    from screens.reading import ReadingScreen
+    from screens.speaking import SpeakingScreen
+
+    cases = {
+        "reading": (ReadingScreen, storage.save_reading_items, make_scored_items),
+        "listening": (ListeningScreen, storage.save_listening_items, make_scored_items),
+        "speaking": (SpeakingScreen, storage.save_speaking_items, make_speaking_items),
+    }
+    results = {}
+    try:
+        for section, (screen_cls, save, make) in cases.items():
+            rows = []
+            for n in sizes:
+                save(make(n))
+                screen = screen_cls(root, on_back=lambda: None)
+                root.update_idletasks()
+                timing = timeit(screen._render_rows, repeat)
+                root.update_idletasks()
+                rows.append({"rows": n, "render": timing, "widgets": _count_widgets(screen)})
+                screen.destroy()
+            results[section] = rows
+    finally:
+        root.destroy()
+    return results
@@ -0,0 +1,38 @@
+"""Load/save throughput of the CSV storage layer."""
+
+from __future__ import annotations
+
+from typing import Dict, List
+
+from common import make_scored_items, make_speaking_items, timeit
+
+import storage
+
+
+CASES = {
+    "reading": (storage.save_reading_items, storage.load_reading_items, make_scored_items),
+    "listening": (storage.save_listening_items, storage.load_listening_items, make_scored_items),
+    "speaking": (storage.save_speaking_items, storage.load_speaking_items, make_speaking_items),
+}
+
+
+def run(sizes: List[int], repeat: int = 3) -> Dict:
+    results = {}
+    for section, (save, load, make) in CASES.items():
+        rows = []
+        for n in sizes:
+            items = make(n)
+            reps = repeat if n <= 100_000 else 1
+            saved = timeit(lambda: save(items), reps)
+            loaded = timeit(load, reps)
+            rows.append(
+                {
+                    "rows": n,
+                    "save": saved,
+                    "load": loaded,
+                    "save_rows_per_s": n / saved["best_s"],
+                    "load_rows_per_s": n / loaded["best_s"],
+                }
+            )
+        results[section] = rows
+    return results
@@ -0,0 +1,33 @@
+"""Shared helpers for the benchmark suite."""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from typing import Callable, Dict, List
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+
+def timeit(fn: Callable[[], object], repeat: int = 3) -> Dict[str, float]:
+    """Run ``fn`` ``repeat`` times and return best/mean wall time in seconds."""
+    times: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return {"best_s": min(times), "mean_s": sum(times) / len(times)}
+
+
+def make_scored_items(n: int) -> List[Dict]:
+    return [
+        {"id": i, "url": f"https://example.com/questions/{i}", "right_answers": i % 11, "day": "2025-09-01"}
+        for i in range(1, n + 1)
+    ]
+
+
+def make_speaking_items(n: int) -> List[Dict]:
+    return [{"id": i, "url": f"https://example.com/speaking/{i}", "day": "2025-09-01"} for i in range(1, n + 1)]
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+"""Headless benchmark runner.
+
+Runs the storage, rendering, audio and essay-analysis benchmarks against a
+scratch data root and writes the results to JSON so regressions can be
+tracked over time:
+
+    python benchmarks/run.py --out bench.json
+    python benchmarks/run.py --only storage --max-rows 100000
+
+Rendering is skipped when no display is available; audio is skipped when
+NumPy/soundfile are not installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import shutil
+import sys
+import tempfile
+import time
+
+import common  # noqa: F401  (puts src/ on sys.path)
+import paths
+
+
+SUITES = ("storage", "render", "audio", "essay")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run TOEFL Prep benchmarks.")
+    parser.add_argument("--only", default=",".join(SUITES), help="comma-separated subset of: " + ", ".join(SUITES))
+    parser.add_argument("--max-rows", type=int, default=1_000_000, help="largest storage size (powers of ten from 100)")
+    parser.add_argument("--max-render-rows", type=int, default=10_000, help="largest table size for rendering")
+    parser.add_argument("--durations", default="10,60,600", help="comma-separated audio lengths in seconds")
+    parser.add_argument("--essay-words", default="500,2000,5000", help="comma-separated essay lengths in words")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--data-dir", default=None, help="scratch data root (default: a new temp dir, e.g. put it on a RAM disk)")
+    parser.add_argument("--out", default=None, help="write JSON results here (default: stdout)")
+    args = parser.parse_args()
+
+    suites = [s.strip() for s in args.only.split(",") if s.strip()]
+    scratch = args.data_dir or tempfile.mkdtemp(prefix="toefl-bench-")
+    paths.configure(scratch)
+
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "data_root": scratch,
+        "results": {},
+    }
+    try:
+        if "storage" in suites:
+            import bench_storage
+
+            report["results"]["storage"] = bench_storage.run(_powers_of_ten(args.max_rows), args.repeat)
+        if "render" in suites:
+            import bench_render
+
+            report["results"]["render"] = bench_render.run(_powers_of_ten(args.max_render_rows, start=10), args.repeat)
+        if "audio" in suites:
+            import bench_audio
+
+            durations = [float(d) for d in args.durations.split(",") if d.strip()]
+            report["results"]["audio"] = bench_audio.run(durations, repeat=args.repeat)
+        if "essay" in suites:
+            import bench_essay
+
+            sizes = [int(n) for n in args.essay_words.split(",") if n.strip()]
+            report["results"]["essay"] = bench_essay.run(sizes, args.repeat)
+    finally:
+        if args.data_dir is None:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+def _powers_of_ten(limit: int, start: int = 100):
+    sizes = []
+    n = start
+    while n <= limit:
+        sizes.append(n)
+        n *= 10
+    return sizes
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+"""Practice analytics built on the timing log and section items."""
+
+from __future__ import annotations
+
+import math
+from typing import Dict, List, Optional
+
+from timing_log import iter_segments
+
+
+# Recommended minutes per item, from the section tips
+TARGET_MINUTES = {"reading": 18.0}
+
+
+def time_per_item(section: str) -> Dict[int, Dict]:
+    """Return {item_id: {"seconds": total, "sessions": count}} from the timing log."""
+    totals: Dict[int, Dict] = {}
+    for seg in iter_segments(section):
+        item_id = seg.get("item_id")
+        if item_id is None:
+            continue
+        entry = totals.setdefault(int(item_id), {"seconds": 0.0, "sessions": 0})
+        entry["seconds"] += float(seg.get("seconds", 0) or 0)
+        entry["sessions"] += 1
+    return totals
+
+
+def pace_accuracy(section: str, items: List[Dict]) -> List[Dict]:
+    """Join time spent per item with its right answers, ordered by item id."""
+    times = time_per_item(section)
+    rows = []
+    for it in sorted(items, key=lambda x: x["id"]):
+        spent = times.get(it["id"])
+        if spent is None:
+            continue
+        rows.append(
+            {
+                "id": it["id"],
+                "minutes": spent["seconds"] / 60.0,
+                "sessions": spent["sessions"],
+                "right_answers": it.get("right_answers", 0),
+            }
+        )
+    return rows
+
+
+def correlation(xs: List[float], ys: List[float]) -> Optional[float]:
+    """Pearson correlation, or None when it is undefined."""
+    n = len(xs)
+    if n < 2 or n != len(ys):
+        return None
+    mx = sum(xs) / n
+    my = sum(ys) / n
+    sxy = sum((x - mx) * (y - my) for x, y in zip(xs, ys))
+    sxx = sum((x - mx) ** 2 for x in xs)
+    syy = sum((y - my) ** 2 for y in ys)
+    if sxx == 0 or syy == 0:
+        return None
+    return sxy / math.sqrt(sxx * syy)
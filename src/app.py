@@ -1,20 +1,36 @@
 import tkinter as tk
-from tkinter import ttk
+from tkinter import ttk, messagebox, simpledialog
 from typing import Dict
 
+import instrument
+import profiles
 from utils import center_window
 from screens.reading import ReadingScreen
 from screens.listening import ListeningScreen
 from screens.speaking import SpeakingScreen
+from screens.writing import WritingScreen
+from screens.mock_test import MockTestScreen
 
 
 APP_TITLE = "TOEFL Prep"
 
+# Screens are built on first visit, against the active profile's data
+SECTION_SCREENS = {
+    "reading": ReadingScreen,
+    "listening": ListeningScreen,
+    "speaking": SpeakingScreen,
+    "writing": WritingScreen,
+}
+SCREEN_FACTORIES = dict(
+    SECTION_SCREENS,
+    mock_test=lambda parent, on_back: MockTestScreen(parent, on_back, SECTION_SCREENS),
+)
+
 
 class MainWindow(tk.Tk):
     def __init__(self):
         super().__init__()
-        self.title(APP_TITLE)
+        self._update_title()
         self.minsize(800, 520)
         self.configure(padx=16, pady=16)
 
@@ -28,23 +44,29 @@ class MainWindow(tk.Tk):
         self.content.grid_columnconfigure(0, weight=1)
         self.content.grid_rowconfigure(0, weight=1)
 
-        # Initialize screens
+        # Initialize screens; sections are created lazily by show()
         self._screens = {}
         self._screens["main"] = self._build_main_menu(self.content)
-        self._screens["reading"] = ReadingScreen(self.content, on_back=lambda: self.show("main"))
-        self._screens["listening"] = ListeningScreen(self.content, on_back=lambda: self.show("main"))
-        self._screens["speaking"] = SpeakingScreen(self.content, on_back=lambda: self.show("main"))
 
         self.show("main")
 
         # Center after widgets are laid out
         self.after(0, lambda: center_window(self))
 
+    @instrument.timed("app.MainWindow.show")
     def show(self, name: str) -> None:
         for _, frame in self._screens.items():
             frame.grid_forget()
-        frame = self._screens[name]
+        if name == "mock_test":
+            # The mock test builds and saves through its own section screens;
+            # cached ones would keep stale items and overwrite its edits when
+            # they save the whole section file again
+            self._release_screens(SECTION_SCREENS)
+        frame = self._screens.get(name)
+        if frame is None:
+            frame = self._screens[name] = SCREEN_FACTORIES[name](self.content, on_back=lambda: self.show("main"))
         frame.grid(row=0, column=0, sticky="nsew")
+        instrument.until_idle(self, f"app.show_until_idle[{name}]")
 
     def _build_main_menu(self, parent: tk.Widget) -> tk.Frame:
         container = ttk.Frame(parent)
@@ -63,6 +85,18 @@ class MainWindow(tk.Tk):
         )
         title.grid(row=0, column=1, pady=(12, 8))
 
+        # Profile selector: each learner has an isolated data root
+        profile_bar = ttk.Frame(container)
+        profile_bar.grid(row=2, column=1, sticky="n", pady=(8, 0))
+        ttk.Label(profile_bar, text="Profile:").grid(row=0, column=0, padx=(0, 6))
+        self.profile_var = tk.StringVar(value=profiles.active())
+        self.profile_box = ttk.Combobox(
+            profile_bar, textvariable=self.profile_var, values=profiles.list_profiles(), state="readonly", width=20
+        )
+        self.profile_box.grid(row=0, column=1)
+        self.profile_box.bind("<<ComboboxSelected>>", lambda e: self._switch_profile(self.profile_var.get()))
+        ttk.Button(profile_bar, text="New Profile", command=self._new_profile).grid(row=0, column=2, padx=(6, 0))
+
         # Buttons block (2x2 grid) centered
         buttons_frame = ttk.Frame(container, padding=10)
         buttons_frame.grid(row=1, column=1)
@@ -76,11 +110,67 @@ class MainWindow(tk.Tk):
             ("Reading", 0, 0, lambda: self.show("reading")),
             ("Listening", 0, 1, lambda: self.show("listening")),
             ("Speaking", 1, 0, lambda: self.show("speaking")),
-            ("Writing", 1, 1, lambda: None),
+            ("Writing", 1, 1, lambda: self.show("writing")),
         ]
 
         for text, r, c, cmd in labels_positions:
             btn = ttk.Button(buttons_frame, text=text, command=cmd)
             btn.grid(row=r, column=c, padx=12, pady=12, ipadx=28, ipady=24, sticky="nsew")
 
+        mock_btn = ttk.Button(buttons_frame, text="Mock Test", command=lambda: self.show("mock_test"))
+        mock_btn.grid(row=2, column=0, columnspan=2, padx=12, pady=(4, 12), ipady=8, sticky="ew")
+
         return container
+
+    # ---------- Profiles ----------
+
+    def _update_title(self) -> None:
+        name = profiles.active()
+        self.title(APP_TITLE if name == profiles.DEFAULT_PROFILE else f"{APP_TITLE} - {name}")
+
+    def _new_profile(self) -> None:
+        name = simpledialog.askstring("New Profile", "Profile name:", parent=self)
+        if not name:
+            return
+        try:
+            name = profiles.create_profile(name)
+        except (profiles.ProfileError, OSError) as e:
+            messagebox.showerror("New Profile", str(e))
+            return
+        self.profile_box.configure(values=profiles.list_profiles())
+        self._switch_profile(name)
+
+    def _switch_profile(self, name: str) -> None:
+        if name == profiles.active():
+            return
+        if self._has_open_popups():
+            messagebox.showwarning("Switch Profile", "Close the open practice windows before switching profiles.")
+            self.profile_var.set(profiles.active())
+            return
+        self._release_screens()
+        try:
+            profiles.switch(name)
+        except (profiles.ProfileError, OSError) as e:
+            messagebox.showerror("Switch Profile", str(e))
+        self.profile_var.set(profiles.active())
+        self._update_title()
+
+    def _release_screens(self, names=None) -> None:
+        """Destroy cached screens (all but the menu by default); they are rebuilt from storage on the next visit."""
+        for name in list(self._screens):
+            if name == "main" or (names is not None and name not in names):
+                continue
+            frame = self._screens.pop(name)
+            timer = getattr(frame, "timer", None)
+            if timer is not None:
+                timer.pause()  # log the running segment against the profile it belongs to
+            frame.destroy()
+
+    def _has_open_popups(self) -> bool:
+        pending = list(self.content.winfo_children())
+        while pending:
+            widget = pending.pop()
+            if isinstance(widget, tk.Toplevel):
+                return True
+            pending.extend(widget.winfo_children())
+        return False
@@ -0,0 +1,280 @@
+"""Append-only history of scored attempts for Reading and Listening items.
+
+Every save that changes an item's result appends one row to ``attempts.csv``
+in the data root:
+
+    timestamp,section,item_id,day,right_answers
+    2025-09-01T10:02:11,reading,3,2025-09-01,7
+
+A row with an empty ``right_answers`` is a tombstone written when the item
+is deleted, so a later item reusing the id starts with a clean history.
+
+Per item, a summary (latest and best score, attempt count, and the
+(day, right_answers) history for the review scheduler) is kept in memory.
+It is updated on each append, so rendering never scans the log. The summary
+is also saved to ``attempts_summary.json`` together with the byte offset it
+covers, so the next start only parses rows appended after that offset.
+"""
+
+from __future__ import annotations
+
+import atexit
+import csv
+import io
+import json
+import os
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import paths
+
+
+FIELDS = ["timestamp", "section", "item_id", "day", "right_answers"]
+SUMMARY_VERSION = 1
+TAIL_CHECK_BYTES = 64  # bytes before the offset that must match for the saved summary to be reused
+
+
+class AttemptLog:
+    def __init__(self, registry: paths.DataPaths):
+        self.registry = registry
+        # (section, item_id) -> {"count", "latest", "best", "last_day", "history": [[day, right], ...]}
+        self._items: Dict[Tuple[str, int], Dict] = {}
+        self._offset = 0
+        self._dirty = False
+        self._load()
+
+    # ----- Queries -----
+
+    def summary(self, section: str, item_id: int) -> Optional[Dict]:
+        return self._items.get((section, int(item_id)))
+
+    def history(self, section: str, item_id: int) -> List[Tuple[str, int]]:
+        entry = self.summary(section, item_id)
+        return [(day, right) for day, right in entry["history"]] if entry else []
+
+    @property
+    def offset(self) -> int:
+        """Byte length of the log covered so far; pass to ``rows_since`` later."""
+        return self._offset
+
+    def rows_since(self, offset: int) -> List[Dict]:
+        """Rows appended after ``offset`` (e.g. during one mock-test section)."""
+        if offset >= self._offset:
+            return []
+        with open(self.registry.attempts_csv, "rb") as f:
+            f.seek(offset)
+            chunk = f.read(self._offset - offset).decode("utf-8")
+        reader = csv.DictReader(io.StringIO(chunk), fieldnames=None if offset == 0 else FIELDS)
+        return list(reader)
+
+    # ----- Appends -----
+
+    def record(self, section: str, item_id: int, day: str, right_answers: int, timestamp: Optional[str] = None) -> None:
+        row = {
+            "timestamp": timestamp or datetime.now().isoformat(timespec="seconds"),
+            "section": section,
+            "item_id": int(item_id),
+            "day": day,
+            "right_answers": int(right_answers),
+        }
+        self._append(row)
+
+    def forget(self, section: str, item_id: int) -> None:
+        """Write a tombstone so the id's history ends here."""
+        if (section, int(item_id)) not in self._items:
+            return
+        self._append(
+            {
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "section": section,
+                "item_id": int(item_id),
+                "day": "",
+                "right_answers": "",
+            }
+        )
+
+    def _append(self, row: Dict) -> None:
+        path = self.registry.attempts_csv
+        self.registry.ensure_dir(self.registry.root)
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        buf = io.StringIO()
+        writer = csv.DictWriter(buf, fieldnames=FIELDS)
+        if new_file:
+            writer.writeheader()
+        writer.writerow(row)
+        data = buf.getvalue().encode("utf-8")
+        with open(path, "ab") as f:
+            f.write(data)
+        if new_file:
+            self._offset = 0
+        self._offset += len(data)
+        self._apply(row)
+        self._dirty = True
+
+    def _apply(self, row: Dict) -> None:
+        try:
+            key = (str(row["section"]), int(row["item_id"]))
+        except (KeyError, TypeError, ValueError):
+            return
+        if str(row.get("right_answers", "")).strip() == "":
+            self._items.pop(key, None)
+            return
+        try:
+            right = int(row["right_answers"])
+        except (TypeError, ValueError):
+            return
+        entry = self._items.get(key)
+        if entry is None:
+            entry = self._items[key] = {"count": 0, "latest": right, "best": right, "last_day": "", "history": []}
+        entry["count"] += 1
+        entry["latest"] = right
+        entry["best"] = max(entry["best"], right)
+        entry["last_day"] = str(row.get("day", ""))
+        entry["history"].append([entry["last_day"], right])
+
+    # ----- Persistence -----
+
+    def _load(self) -> None:
+        path = self.registry.attempts_csv
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return
+        if not self._load_summary(size):
+            self._items, self._offset = {}, 0
+        if self._offset >= size:
+            return
+        with open(path, "rb") as f:
+            f.seek(self._offset)
+            tail = f.read().decode("utf-8")
+        if self._offset == 0:
+            rows = csv.DictReader(io.StringIO(tail))
+        else:
+            rows = csv.DictReader(io.StringIO(tail), fieldnames=FIELDS)
+        for row in rows:
+            self._apply(row)
+        self._offset = size
+        self._dirty = True
+
+    def _load_summary(self, size: int) -> bool:
+        try:
+            with open(self.registry.attempts_summary, encoding="utf-8") as f:
+                saved = json.load(f)
+            offset = int(saved["offset"])
+            if saved.get("version") != SUMMARY_VERSION or offset > size:
+                return False
+            if offset and _tail_bytes(self.registry.attempts_csv, offset) != saved.get("tail"):
+                return False  # the log was replaced or rewritten since
+            items = {}
+            for key, entry in saved["items"].items():
+                section, item_id = key.rsplit(":", 1)
+                items[(section, int(item_id))] = entry
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        self._items, self._offset = items, offset
+        return True
+
+    def save_summary(self) -> None:
+        if not self._dirty:
+            return
+        summary = {
+            "version": SUMMARY_VERSION,
+            "offset": self._offset,
+            "tail": _tail_bytes(self.registry.attempts_csv, self._offset) if self._offset else "",
+            "items": {f"{section}:{item_id}": entry for (section, item_id), entry in self._items.items()},
+        }
+        tmp = self.registry.attempts_summary + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(summary, f, separators=(",", ":"))
+            os.replace(tmp, self.registry.attempts_summary)
+        except OSError:
+            return  # the summary is a cache; it is rebuilt from the log next time
+        self._dirty = False
+
+
+def _tail_bytes(path: str, offset: int) -> str:
+    start = max(0, offset - TAIL_CHECK_BYTES)
+    try:
+        with open(path, "rb") as f:
+            f.seek(start)
+            return f.read(offset - start).hex()
+    except OSError:
+        return ""
+
+
+_log: Optional[AttemptLog] = None
+
+
+def log() -> AttemptLog:
+    """The active profile's attempt log, loaded on first use."""
+    global _log
+    if _log is None:
+        _log = AttemptLog(paths.current())
+    return _log
+
+
+def _release() -> None:
+    global _log
+    if _log is not None:
+        _log.save_summary()
+        _log = None
+
+
+def legacy_attempt(item: Dict) -> Optional[Tuple[str, int]]:
+    """The result stored on the row itself, for items saved before attempts were logged."""
+    day = str(item.get("day", "")).strip()
+    if not day or not str(item.get("url", "")).strip():
+        return None
+    return day, int(item.get("right_answers", 0) or 0)
+
+
+def item_history(section: str, item: Dict) -> List[Tuple[str, int]]:
+    """(day, right_answers) results for an item, oldest first."""
+    history = log().history(section, item["id"])
+    if history:
+        return history
+    legacy = legacy_attempt(item)
+    return [legacy] if legacy else []
+
+
+def item_summary(section: str, item: Dict) -> Dict:
+    """Latest/best/count for display; falls back to the row's own result."""
+    entry = log().summary(section, item["id"])
+    if entry is not None:
+        return {"latest": entry["latest"], "best": entry["best"], "attempts": entry["count"]}
+    legacy = legacy_attempt(item)
+    if legacy is None:
+        return {"latest": "", "best": "", "attempts": 0}
+    return {"latest": legacy[1], "best": legacy[1], "attempts": 1}
+
+
+def record_result(section: str, previous: Optional[Dict], updated: Dict) -> bool:
+    """Log an attempt when a save changes the item's result; returns True if one was logged."""
+    if previous is not None and (
+        previous.get("right_answers") == updated.get("right_answers") and previous.get("day") == updated.get("day")
+    ):
+        return False
+    attempt_log = log()
+    if previous is not None and attempt_log.summary(section, updated["id"]) is None:
+        # First logged retake: keep the result that was only stored on the row
+        legacy = legacy_attempt(previous)
+        if legacy is not None:
+            attempt_log.record(section, updated["id"], legacy[0], legacy[1], timestamp=_day_timestamp(legacy[0]))
+    attempt_log.record(section, updated["id"], updated.get("day", ""), updated.get("right_answers", 0))
+    return True
+
+
+def _day_timestamp(day: str) -> Optional[str]:
+    try:
+        return datetime.fromisoformat(day[:10]).isoformat(timespec="seconds")
+    except ValueError:
+        return None
+
+
+def forget_item(section: str, item_id: int) -> None:
+    log().forget(section, item_id)
+
+
+paths.on_release(_release)
+atexit.register(lambda: _log is not None and _log.save_summary())
@@ -0,0 +1,214 @@
+"""App-wide registry of audio input devices.
+
+PortAudio enumeration can take hundreds of milliseconds with many ALSA/Pulse
+endpoints, so it runs once in a background thread at startup. The result is
+cached along with each device's capabilities (channels, default and
+supported sample rates). Answer popups read the cache instead of calling
+``sd.query_devices()``.
+
+PortAudio only notices hot-plugged devices after it is re-initialized. An
+on-demand ``refresh()``, or the periodic one, re-initializes it in the
+background, but only while no stream is open. Streams are opened inside
+``registry.portaudio()``, which holds a lock that keeps the two apart.
+
+The last device used for recording is remembered per profile in
+settings.json by a stable key (host API + name); indices can change
+between runs.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from typing import Callable, List, Optional
+
+import settings
+
+
+COMMON_SAMPLERATES = (16000, 22050, 44100, 48000)
+REFRESH_INTERVAL_S = 60.0
+SETTINGS_KEY = "input_device"
+
+
+class InputDevice:
+    __slots__ = ("index", "name", "hostapi", "max_input_channels", "default_samplerate", "samplerates", "is_default")
+
+    def __init__(self, index: int, info: dict, hostapi: str, samplerates: List[int], is_default: bool):
+        self.index = index
+        self.name = str(info.get("name", "Unknown"))
+        self.hostapi = hostapi
+        self.max_input_channels = int(info.get("max_input_channels", 0))
+        self.default_samplerate = int(info.get("default_samplerate") or 0)
+        self.samplerates = samplerates
+        self.is_default = is_default
+
+    @property
+    def key(self) -> str:
+        return f"{self.hostapi}:{self.name}"
+
+    @property
+    def label(self) -> str:
+        return f"[{self.index}] {self.name}" + (f" ({self.hostapi})" if self.hostapi else "")
+
+
+class DeviceRegistry:
+    def __init__(self, refresh_interval: float = REFRESH_INTERVAL_S):
+        self.refresh_interval = refresh_interval
+        self.devices: List[InputDevice] = []
+        self.error: Optional[str] = None  # why enumeration failed (e.g. sounddevice missing)
+        self.version = 0  # bumped whenever the device list is replaced
+        self._ready = threading.Event()
+        self._wake = threading.Event()
+        self._reinit = False
+        self._open_streams = 0
+        self._pa_lock = threading.RLock()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    # ----- Lifecycle -----
+
+    def start(self) -> None:
+        """Begin background enumeration (idempotent)."""
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="audio-devices", daemon=True)
+                self._thread.start()
+
+    def refresh(self) -> None:
+        """Re-enumerate in the background, picking up hot-plugged devices."""
+        self.start()
+        self._reinit = True
+        self._wake.set()
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        self.start()
+        return self._ready.wait(timeout)
+
+    # ----- Lookups -----
+
+    def find(self, key: str) -> Optional[InputDevice]:
+        return next((d for d in self.devices if d.key == key), None)
+
+    def preferred(self) -> Optional[InputDevice]:
+        """Last device used in this profile, else the system default, else the first one."""
+        remembered = settings.get(SETTINGS_KEY)
+        device = self.find(remembered) if remembered else None
+        if device is None:
+            device = next((d for d in self.devices if d.is_default), None)
+        if device is None and self.devices:
+            device = self.devices[0]
+        return device
+
+    def remember(self, device: InputDevice) -> None:
+        if settings.get(SETTINGS_KEY) != device.key:
+            try:
+                settings.update(**{SETTINGS_KEY: device.key})
+            except OSError:
+                pass  # only a preference
+
+    # ----- Stream guard -----
+
+    @contextmanager
+    def portaudio(self):
+        """Hold off re-initialization while a stream is being opened."""
+        with self._pa_lock:
+            yield
+
+    def stream_opened(self) -> None:
+        with self._pa_lock:
+            self._open_streams += 1
+
+    def stream_closed(self) -> None:
+        with self._pa_lock:
+            self._open_streams = max(0, self._open_streams - 1)
+
+    # ----- Worker -----
+
+    def _run(self) -> None:
+        self._enumerate(reinit=False)
+        while True:
+            woke = self._wake.wait(self.refresh_interval if self.refresh_interval > 0 else None)
+            self._wake.clear()
+            self._enumerate(reinit=self._reinit or not woke)
+            self._reinit = False
+
+    def _enumerate(self, reinit: bool) -> None:
+        try:
+            import sounddevice as sd
+        except Exception as e:
+            self.error = f"sounddevice unavailable: {e}"
+            self._ready.set()
+            return
+        with self._pa_lock:
+            if reinit and self._open_streams:
+                return  # try again on the next round
+            try:
+                if reinit:
+                    # Private API, but the only way to make PortAudio rescan devices
+                    sd._terminate()
+                    sd._initialize()
+                devices = self._query(sd)
+                self.error = None
+            except Exception as e:
+                devices = []
+                self.error = f"Could not list audio devices: {e}"
+        if [d.key for d in devices] != [d.key for d in self.devices] or not self._ready.is_set():
+            self.devices = devices
+            self.version += 1
+        self._ready.set()
+
+    def _query(self, sd) -> List[InputDevice]:
+        hostapis = [h.get("name", "") for h in sd.query_hostapis()]
+        try:
+            default_input = int(sd.default.device[0])
+        except Exception:
+            default_input = -1
+        found = []
+        for index, info in enumerate(sd.query_devices()):
+            if int(info.get("max_input_channels", 0)) <= 0:
+                continue
+            rates = []
+            for rate in COMMON_SAMPLERATES:
+                try:
+                    sd.check_input_settings(device=index, samplerate=rate, channels=1)
+                    rates.append(rate)
+                except Exception:
+                    pass
+            hostapi = hostapis[info["hostapi"]] if 0 <= info.get("hostapi", -1) < len(hostapis) else ""
+            found.append(InputDevice(index, info, hostapi, rates, index == default_input))
+        return found
+
+
+# App-wide registry; main.py starts it once the window is up
+registry = DeviceRegistry()
+
+
+def watch(widget, on_change: Callable[[], None], poll_ms: int = 250) -> Callable[[], None]:
+    """Call ``on_change`` on the Tk thread whenever the device list changes.
+
+    Returns a function that stops watching.
+    """
+    state = {"version": None, "job": None}
+
+    def poll():
+        state["job"] = None
+        if registry.ready and registry.version != state["version"]:
+            state["version"] = registry.version
+            on_change()
+        state["job"] = widget.after(poll_ms, poll)
+
+    def stop():
+        if state["job"] is not None:
+            try:
+                widget.after_cancel(state["job"])
+            except Exception:
+                pass
+            state["job"] = None
+
+    registry.start()
+    poll()
+    return stop
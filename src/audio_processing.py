@@ -0,0 +1,195 @@
+"""Post-processing of Speaking takes before they are saved.
+
+The chain, all vectorized with NumPy/SciPy over ``(frames, channels)`` float
+arrays:
+
+1. DC removal: a 20 Hz Butterworth high-pass, which also removes slow drift.
+2. Noise gate: STFT bins that stay below the take's own noise floor are
+   attenuated. The floor is the quietest chunk's low percentile per bin.
+   The STFT runs over overlapping chunks, so memory stays bounded for long
+   takes.
+3. Loudness normalization to ``TARGET_LUFS``, measured per ITU-R BS.1770
+   (K-weighting, 400 ms blocks, absolute and relative gates). Takes shorter
+   than one block fall back to RMS.
+4. Peak limiter: a look-ahead gain envelope (minimum filter, then moving
+   average) keeps samples under ``PEAK_CEILING_DB`` without clicks.
+
+A 60-second take at 48 kHz processes in about half a second, most of it in
+the noise gate (see ``benchmarks/bench_audio.py``).
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Tuple
+
+import numpy as np
+from scipy import ndimage, signal
+
+
+TARGET_LUFS = -18.0
+MAX_GAIN_DB = 24.0  # do not turn a near-silent take into amplified hiss
+PEAK_CEILING_DB = -1.0
+LIMITER_LOOKAHEAD_S = 0.005
+DC_CUTOFF_HZ = 20.0
+
+GATE_NPERSEG = 1024
+GATE_THRESHOLD_DB = 6.0  # bins this far above the noise floor pass untouched
+GATE_REDUCTION_DB = 12.0
+GATE_NOISE_PERCENTILE = 20
+CHUNK_SECONDS = 10.0
+
+BLOCK_S = 0.4
+BLOCK_OVERLAP = 0.75
+ABSOLUTE_GATE_LUFS = -70.0
+RELATIVE_GATE_LU = -10.0
+
+
+def enhance(data: np.ndarray, samplerate: int, target_lufs: float = TARGET_LUFS, gate: bool = True) -> Tuple[np.ndarray, Dict]:
+    """Run the full chain; returns the processed float32 take and a short report."""
+    x = _as_2d(data)
+    x = remove_dc(x, samplerate)
+    if gate:
+        x = noise_gate(x, samplerate)
+    before = integrated_loudness(x, samplerate)
+    gain_db = 0.0
+    if np.isfinite(before):
+        gain_db = float(np.clip(target_lufs - before, -MAX_GAIN_DB, MAX_GAIN_DB))
+        x *= np.float32(10.0 ** (gain_db / 20.0))
+    x, limited = limit_peaks(x, samplerate)
+    report = {
+        "input_lufs": round(before, 1) if np.isfinite(before) else None,
+        "gain_db": round(gain_db, 1),
+        "limited_frames": limited,
+    }
+    return x.reshape(data.shape) if data.ndim == 1 else x, report
+
+
+def _as_2d(data: np.ndarray) -> np.ndarray:
+    x = np.asarray(data, dtype=np.float32)
+    return (x.reshape(-1, 1) if x.ndim == 1 else x).copy()
+
+
+# ----- DC removal -----
+
+
+def remove_dc(x: np.ndarray, samplerate: int) -> np.ndarray:
+    sos = signal.butter(2, DC_CUTOFF_HZ, btype="highpass", fs=samplerate, output="sos")
+    # Start from the first sample's steady state so the filter does not ring in
+    zi = signal.sosfilt_zi(sos)[:, :, None] * x[:1][None, :, :]
+    out, _ = signal.sosfilt(sos, x, axis=0, zi=zi)
+    return out.astype(np.float32, copy=False)
+
+
+# ----- Noise gate -----
+
+
+def noise_gate(x: np.ndarray, samplerate: int) -> np.ndarray:
+    """Attenuate time-frequency bins that do not rise above the noise floor."""
+    frames = len(x)
+    if frames < GATE_NPERSEG * 2:
+        return x
+    hop = GATE_NPERSEG // 2
+    chunk = max(GATE_NPERSEG * 8, int(CHUNK_SECONDS * samplerate) // hop * hop)
+    pad = GATE_NPERSEG * 2  # context on each side; only the middle of a chunk is kept
+
+    floor = None
+    for start in range(0, frames, chunk):
+        seg = x[start : start + chunk]
+        if len(seg) < GATE_NPERSEG:
+            continue
+        _, _, spec = signal.stft(seg, nperseg=GATE_NPERSEG, noverlap=hop, axis=0)
+        level = np.percentile(np.abs(spec), GATE_NOISE_PERCENTILE, axis=-1)  # (bins, channels)
+        floor = level if floor is None else np.minimum(floor, level)
+    if floor is None:
+        return x
+
+    threshold = (floor * 10.0 ** (GATE_THRESHOLD_DB / 20.0))[:, :, None]
+    reduction = np.float32(10.0 ** (-GATE_REDUCTION_DB / 20.0))
+    out = np.empty_like(x)
+    for start in range(0, frames, chunk):
+        lo = max(0, start - pad)
+        hi = min(frames, start + chunk + pad)
+        _, _, spec = signal.stft(x[lo:hi], nperseg=GATE_NPERSEG, noverlap=hop, axis=0)
+        mask = np.where(np.abs(spec) > threshold, np.float32(1.0), reduction)
+        # Smooth over neighbouring bins and frames to avoid musical noise
+        mask = ndimage.uniform_filter(mask, size=(3, 1, 5), mode="nearest")
+        _, seg = signal.istft(spec * mask, nperseg=GATE_NPERSEG, noverlap=hop, time_axis=-1, freq_axis=0)
+        # istft returns (channels, frames)
+        seg = np.asarray(seg, dtype=np.float32).T
+        end = min(start + chunk, frames)
+        out[start:end] = seg[start - lo : end - lo]
+    return out
+
+
+# ----- Loudness -----
+
+
+def _k_weighting(samplerate: int) -> np.ndarray:
+    """BS.1770 K-weighting (high shelf + RLB high-pass) for any sample rate, as SOS.
+
+    Bilinear-transform design that reproduces the standard's 48 kHz
+    coefficients (the same derivation libebur128 uses).
+    """
+    # High shelf: about +4 dB above 1.7 kHz
+    fc, gain_db, q = 1681.974450955533, 3.999843853973347, 0.7071752369554196
+    k = np.tan(np.pi * fc / samplerate)
+    vh = 10.0 ** (gain_db / 20.0)
+    vb = vh ** 0.4996667741545416
+    a0 = 1.0 + k / q + k * k
+    shelf_b = [(vh + vb * k / q + k * k) / a0, 2.0 * (k * k - vh) / a0, (vh - vb * k / q + k * k) / a0]
+    shelf_a = [1.0, 2.0 * (k * k - 1.0) / a0, (1.0 - k / q + k * k) / a0]
+    # RLB high-pass around 38 Hz
+    fc, q = 38.13547087602444, 0.5003270373238773
+    k = np.tan(np.pi * fc / samplerate)
+    a0 = 1.0 + k / q + k * k
+    hp_b = [1.0, -2.0, 1.0]
+    hp_a = [1.0, 2.0 * (k * k - 1.0) / a0, (1.0 - k / q + k * k) / a0]
+    return np.vstack([signal.tf2sos(shelf_b, shelf_a), signal.tf2sos(hp_b, hp_a)])
+
+
+def integrated_loudness(x: np.ndarray, samplerate: int) -> float:
+    """Gated integrated loudness in LUFS (-inf for silence)."""
+    x = _as_2d(x)
+    weighted = signal.sosfilt(_k_weighting(samplerate), x, axis=0)
+    power = np.square(weighted, dtype=np.float64)
+    block = int(BLOCK_S * samplerate)
+    if len(power) < block:
+        mean_square = power.mean(axis=0).sum() if len(power) else 0.0
+        return -0.691 + 10.0 * np.log10(mean_square) if mean_square > 0 else float("-inf")
+
+    # Mean square of every 400 ms block (75% overlap) from one cumulative sum
+    step = max(1, int(block * (1.0 - BLOCK_OVERLAP)))
+    csum = np.vstack([np.zeros((1, power.shape[1])), np.cumsum(power, axis=0)])
+    starts = np.arange(0, len(power) - block + 1, step)
+    block_power = ((csum[starts + block] - csum[starts]) / block).sum(axis=1)  # channels weighted 1.0
+    with np.errstate(divide="ignore"):
+        block_lufs = -0.691 + 10.0 * np.log10(block_power)
+
+    kept = block_power[block_lufs > ABSOLUTE_GATE_LUFS]
+    if not len(kept):
+        return float("-inf")
+    relative = -0.691 + 10.0 * np.log10(kept.mean()) + RELATIVE_GATE_LU
+    kept = block_power[block_lufs > max(relative, ABSOLUTE_GATE_LUFS)]
+    return float(-0.691 + 10.0 * np.log10(kept.mean()))
+
+
+# ----- Limiter -----
+
+
+def limit_peaks(x: np.ndarray, samplerate: int) -> Tuple[np.ndarray, int]:
+    """Keep peaks under the ceiling with a smooth look-ahead gain; returns (audio, frames limited)."""
+    ceiling = np.float32(10.0 ** (PEAK_CEILING_DB / 20.0))
+    peak = np.abs(x).max(axis=1)  # linked across channels
+    over = peak > ceiling
+    limited = int(over.sum())
+    if not limited:
+        return x, 0
+    needed = np.ones_like(peak)
+    needed[over] = ceiling / peak[over]
+    lookahead = max(1, int(LIMITER_LOOKAHEAD_S * samplerate))
+    # The minimum over 2L+1 samples, averaged over L+1, never exceeds the gain a peak needs
+    gain = ndimage.minimum_filter1d(needed, size=2 * lookahead + 1, mode="nearest")
+    gain = ndimage.uniform_filter1d(gain, size=lookahead + 1, mode="nearest")
+    x *= gain[:, None]
+    np.clip(x, -ceiling, ceiling, out=x)
+    return x, limited
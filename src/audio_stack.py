@@ -0,0 +1,74 @@
+"""Background warm-up of the audio stack (NumPy, soundfile, sounddevice).
+
+Importing NumPy and initializing PortAudio takes noticeable time. Doing it
+on the Tk thread the first time an answer window opens stalls the UI right
+when the learner wants to speak. ``warm_up()`` runs the imports on a
+background thread, by default right after the main menu renders. Answer
+windows check ``ready()`` and show an indicator until the stack is loaded
+instead of importing it themselves.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Optional, Tuple
+
+import audio_devices
+
+
+INSTALL_HINT = (
+    "Audio dependencies not installed.\n\n"
+    "Install with:\n"
+    "  python -m pip install sounddevice soundfile\n"
+    "On Debian/Ubuntu also install: sudo apt-get install libportaudio2"
+)
+
+_modules: Optional[Tuple[object, object, object]] = None  # (sounddevice, soundfile, numpy)
+_error: Optional[str] = None
+_done = threading.Event()
+_thread: Optional[threading.Thread] = None
+_lock = threading.Lock()
+
+
+def warm_up() -> None:
+    """Start loading the audio stack in the background (idempotent)."""
+    global _thread
+    with _lock:
+        if _thread is None:
+            _thread = threading.Thread(target=_load, name="audio-warmup", daemon=True)
+            _thread.start()
+
+
+def _load() -> None:
+    global _modules, _error
+    try:
+        import numpy as np  # type: ignore
+        import soundfile as sf  # type: ignore
+        import sounddevice as sd  # type: ignore  (initializes PortAudio)
+
+        _modules = (sd, sf, np)
+    except Exception as e:
+        _error = str(e) or type(e).__name__
+    finally:
+        _done.set()
+    if _modules is not None:
+        audio_devices.registry.start()
+
+
+def ready() -> bool:
+    """True once loading finished, whether or not it succeeded."""
+    return _done.is_set()
+
+
+def wait(timeout: Optional[float] = None) -> bool:
+    warm_up()
+    return _done.wait(timeout)
+
+
+def modules() -> Optional[Tuple[object, object, object]]:
+    """``(sounddevice, soundfile, numpy)``, or None if not loaded (yet) or unavailable."""
+    return _modules
+
+
+def error() -> Optional[str]:
+    return _error
@@ -0,0 +1,299 @@
+"""Offline cache for the material behind question links.
+
+Downloaded content (HTML, text, audio) is stored by the SHA-256 of its
+bytes under ``content_cache/objects/``, so the same file linked from several
+items is kept once. Blobs of 64 KiB or more are zlib-compressed when that
+actually shrinks them (already-compressed audio is left alone).
+``content_cache/index.json`` maps each URL to its object.
+
+``prefetch`` queues URLs on a small thread pool so the next due items are
+downloaded in the background. Opening a link then uses the local copy and
+works offline. Any URL ``urllib`` understands works, including ``file://``.
+After a network error (no connection, timeout), further prefetches are
+skipped for a short while. An HTTP error only concerns its own link: it is
+remembered per URL and that link is not prefetched again for a while.
+
+Copies older than ``MAX_AGE_S`` are still served, but they are re-fetched in
+the background when opened or prefetched. The re-fetch is conditional
+(ETag / Last-Modified) so unchanged documents are not downloaded again.
+
+Only the linked document itself is cached; pages that load more resources
+still need the network for those.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mimetypes
+import os
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple
+
+import paths
+
+
+COMPRESS_MIN_BYTES = 64 * 1024
+FETCH_TIMEOUT_S = 15
+MAX_DOWNLOAD_BYTES = 200 * 1024 * 1024
+PREFETCH_WORKERS = 3
+OFFLINE_RETRY_S = 60.0
+LINK_RETRY_S = 3600.0  # after an HTTP error for one link
+MAX_AGE_S = 7 * 24 * 3600
+USER_AGENT = "TOEFL-Prep/1.0 (offline cache)"
+
+
+class ContentCache:
+    def __init__(self, root: str):
+        self.root = root
+        self.objects_dir = os.path.join(root, "objects")
+        self.open_dir = os.path.join(root, "open")
+        self.index_path = os.path.join(root, "index.json")
+        self._lock = threading.Lock()
+        self._index: Dict[str, Dict] = self._load_index()
+        self._inflight: Dict[str, Future] = {}
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._offline_until = 0.0
+        self._link_errors: Dict[str, Tuple[float, str]] = {}  # url -> (retry after, message)
+
+    # ----- Lookups -----
+
+    def entry(self, url: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._index.get(url)
+        if entry is not None and os.path.exists(self._object_path(entry)):
+            return entry
+        return None
+
+    def is_stale(self, url: str) -> bool:
+        """True when the cached copy was last checked more than ``MAX_AGE_S`` ago."""
+        entry = self.entry(url)
+        return entry is not None and fetchable(url) and time.time() - entry.get("checked", 0) > MAX_AGE_S
+
+    def link_error(self, url: str) -> Optional[str]:
+        """The last HTTP error of ``url`` (e.g. "HTTP 404 Not Found"), or None."""
+        with self._lock:
+            failed = self._link_errors.get(url)
+        return failed[1] if failed is not None else None
+
+    def read(self, url: str) -> Optional[bytes]:
+        entry = self.entry(url)
+        if entry is None:
+            return None
+        with open(self._object_path(entry), "rb") as f:
+            data = f.read()
+        return zlib.decompress(data) if entry["compressed"] else data
+
+    def local_file(self, url: str) -> Optional[str]:
+        """Path of a plain copy with the document's extension for the browser or player, or None.
+
+        Objects have no extension, so browsers would not know how to show
+        them; uncompressed ones are hard-linked into ``open/`` (copied where
+        links are unsupported), compressed ones are decompressed there.
+        """
+        entry = self.entry(url)
+        if entry is None:
+            return None
+        path = os.path.join(self.open_dir, entry["sha256"] + _extension(url, entry.get("content_type", "")))
+        if not os.path.exists(path):
+            os.makedirs(self.open_dir, exist_ok=True)
+            if entry["compressed"]:
+                _write_atomic(path, self.read(url))
+            else:
+                try:
+                    os.link(self._object_path(entry), path)
+                except FileExistsError:
+                    pass  # materialized by a concurrent call
+                except OSError:
+                    _write_atomic(path, self.read(url))
+        return path
+
+    # ----- Downloads -----
+
+    def fetch(self, url: str) -> Dict:
+        """Download ``url`` into the cache (blocking) and return its entry.
+
+        An existing copy is revalidated: a 304 answer only refreshes its check time.
+        """
+        headers = {"User-Agent": USER_AGENT}
+        cached = self.entry(url)
+        if cached is not None:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+        request = urllib.request.Request(url, headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=FETCH_TIMEOUT_S) as response:
+                data = response.read(MAX_DOWNLOAD_BYTES + 1)
+                content_type = response.headers.get_content_type() if response.headers else ""
+                etag = response.headers.get("ETag", "") if response.headers else ""
+                last_modified = response.headers.get("Last-Modified", "") if response.headers else ""
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and cached is not None:
+                return self._checked(url)
+            raise
+        if len(data) > MAX_DOWNLOAD_BYTES:
+            raise ValueError(f"{url} is larger than {MAX_DOWNLOAD_BYTES // (1024 * 1024)} MB")
+        return self.put(url, data, content_type, etag=etag, last_modified=last_modified)
+
+    def put(self, url: str, data: bytes, content_type: str = "", etag: str = "", last_modified: str = "") -> Dict:
+        digest = hashlib.sha256(data).hexdigest()
+        stored, compressed = data, False
+        if len(data) >= COMPRESS_MIN_BYTES and not _precompressed(content_type):
+            packed = zlib.compress(data, 6)
+            if len(packed) < len(data) * 0.9:
+                stored, compressed = packed, True
+        entry = {
+            "sha256": digest,
+            "size": len(data),
+            "stored": len(stored),
+            "compressed": compressed,
+            "content_type": content_type,
+            "fetched": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "checked": time.time(),
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+        path = self._object_path(entry)
+        if not os.path.exists(path):  # identical content is stored once
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            _write_atomic(path, stored)
+        with self._lock:
+            self._index[url] = entry
+            self._write_index()
+        return entry
+
+    def _checked(self, url: str) -> Dict:
+        """Record that the cached copy of ``url`` is still current."""
+        with self._lock:
+            entry = self._index[url]
+            entry["checked"] = time.time()
+            self._write_index()
+        return entry
+
+    def fetch_async(self, url: str) -> Future:
+        """Queue a download; repeated calls for the same URL share one future."""
+        with self._lock:
+            future = self._inflight.get(url)
+            if future is not None:
+                return future
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS, thread_name_prefix="content-prefetch")
+            future = self._pool.submit(self._fetch_tracked, url)
+            self._inflight[url] = future
+            return future
+
+    def prefetch(self, urls: Iterable[str]) -> int:
+        """Queue the URLs that are not cached yet; returns how many were queued."""
+        if time.monotonic() < self._offline_until:
+            return 0
+        queued = 0
+        now = time.monotonic()
+        for url in urls:
+            if not url or not fetchable(url) or (self.entry(url) is not None and not self.is_stale(url)):
+                continue
+            with self._lock:
+                failed = self._link_errors.get(url)
+            if failed is not None and now < failed[0]:
+                continue
+            self.fetch_async(url)
+            queued += 1
+        return queued
+
+    def _fetch_tracked(self, url: str) -> Dict:
+        try:
+            entry = self.fetch(url)
+            self.local_file(url)  # materialize now so opening it later is instant
+            with self._lock:
+                self._link_errors.pop(url, None)
+            return entry
+        except urllib.error.HTTPError as e:
+            # The server answered: only this link is broken, the others may be fine
+            with self._lock:
+                self._link_errors[url] = (time.monotonic() + LINK_RETRY_S, f"HTTP {e.code} {e.reason}")
+            raise
+        except (urllib.error.URLError, TimeoutError):
+            if not url.startswith("file:"):
+                self._offline_until = time.monotonic() + OFFLINE_RETRY_S
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(url, None)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            # Running downloads finish into this cache's own directory
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    # ----- Storage -----
+
+    def _object_path(self, entry: Dict) -> str:
+        digest = entry["sha256"]
+        return os.path.join(self.objects_dir, digest[:2], digest + (".z" if entry["compressed"] else ""))
+
+    def _write_index(self) -> None:
+        _write_atomic(self.index_path, json.dumps(self._index, indent=1).encode("utf-8"))
+
+    def _load_index(self) -> Dict[str, Dict]:
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return index if isinstance(index, dict) else {}
+
+
+def fetchable(url: str) -> bool:
+    return url.split(":", 1)[0].lower() in ("http", "https", "file")
+
+
+def _precompressed(content_type: str) -> bool:
+    major = content_type.split("/", 1)[0]
+    return major in ("audio", "video", "image") or content_type in ("application/zip", "application/pdf")
+
+
+def _extension(url: str, content_type: str) -> str:
+    ext = os.path.splitext(urllib.parse.urlparse(url).path)[1]
+    if ext and len(ext) <= 6:
+        return ext
+    return mimetypes.guess_extension(content_type or "") or ""
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    tmp = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+_cache: Optional[ContentCache] = None
+_cache_lock = threading.Lock()
+
+
+def cache() -> ContentCache:
+    """The active profile's content cache."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            registry = paths.current()
+            _cache = ContentCache(registry.ensure_dir(registry.content_cache_dir))
+        return _cache
+
+
+def _release() -> None:
+    global _cache
+    with _cache_lock:
+        if _cache is not None:
+            _cache.close()
+            _cache = None
+
+
+paths.on_release(_release)
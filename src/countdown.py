@@ -0,0 +1,86 @@
+"""Prep/response countdown for TOEFL speaking tasks.
+
+The schedule is driven by the audio input stream itself: PhaseCounter counts
+the frames delivered to the stream callback, drops the preparation window and
+keeps exactly ``response_seconds * samplerate`` frames. Phase boundaries are
+therefore aligned to the sample clock of the device, and a take is cut at the
+limit to the frame, independently of Tk ``after`` latency.
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+
+# (label, preparation seconds, response seconds) as described in the tips
+SPEAKING_TASKS: List[Tuple[str, int, int]] = [
+    ("Task 1 (Independent) - 15s / 45s", 15, 45),
+    ("Tasks 2 & 3 (Integrated) - 30s / 60s", 30, 60),
+    ("Task 4 (Integrated) - 20s / 60s", 20, 60),
+]
+
+PREP = "prep"
+SPEAK = "speak"
+DONE = "done"
+
+
+class PhaseCounter:
+    """Frame-accurate prep -> speak -> done schedule.
+
+    ``feed`` is called from the audio callback with each input block and
+    returns the part of the block that falls inside the response window.
+    ``phase`` and ``frames_seen`` may be read from the UI thread.
+    """
+
+    def __init__(self, samplerate: int, prep_seconds: float, response_seconds: float):
+        self.samplerate = int(samplerate)
+        self.prep_frames = int(round(prep_seconds * self.samplerate))
+        self.response_frames = int(round(response_seconds * self.samplerate))
+        self.frames_seen = 0
+        self.frames_kept = 0
+        self.phase = PREP if self.prep_frames > 0 else SPEAK
+
+    @property
+    def total_frames(self) -> int:
+        return self.prep_frames + self.response_frames
+
+    @property
+    def done(self) -> bool:
+        return self.phase == DONE
+
+    def feed(self, block):
+        """Advance by ``len(block)`` frames; return the kept slice or None."""
+        start = self.frames_seen
+        end = start + len(block)
+        self.frames_seen = end
+
+        keep_from = max(start, self.prep_frames)
+        keep_to = min(end, self.total_frames)
+        kept = None
+        if keep_to > keep_from:
+            kept = block[keep_from - start : keep_to - start]
+            self.frames_kept += keep_to - keep_from
+
+        if end >= self.total_frames:
+            self.phase = DONE
+        elif end >= self.prep_frames:
+            self.phase = SPEAK
+        return kept
+
+    def remaining_seconds(self) -> float:
+        """Seconds left in the current phase, by the stream's frame count."""
+        seen = self.frames_seen
+        if self.phase == PREP:
+            left = self.prep_frames - seen
+        elif self.phase == SPEAK:
+            left = self.total_frames - seen
+        else:
+            left = 0
+        return max(0, left) / self.samplerate
+
+
+def task_phases(label: str) -> Optional[Tuple[int, int]]:
+    for name, prep, response in SPEAKING_TASKS:
+        if name == label:
+            return prep, response
+    return None
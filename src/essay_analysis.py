@@ -0,0 +1,215 @@
+"""Offline essay analysis for the Writing section.
+
+Flags repeated words and phrases, overused transitions, sentence-length
+spread and vocabulary-level coverage against the bundled ranked word list
+(resources/word_freq.txt). The word list is loaded once into a sorted word
+list with a parallel rank array and searched with bisect; each distinct essay
+word is looked up once per analysis.
+
+``analyze`` is pure and thread-safe, so the Writing screen runs it in a worker
+thread.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import re
+import threading
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+RESOURCE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources")
+WORD_FREQ_PATH = os.path.join(RESOURCE_DIR, "word_freq.txt")
+
+# Cumulative vocabulary bands over the ranked list; words past the last band are "beyond list"
+BANDS = ((500, "Top 500"), (1000, "Top 1000"), (2000, "Top 2000"))
+# The most frequent words are function words and never count as repetition
+FUNCTION_WORD_RANK = 150
+
+# Signposting language from the section tips, plus the usual essay connectors
+TRANSITIONS = (
+    "first of all", "for example", "for instance", "in contrast", "on the other hand",
+    "in addition", "in conclusion", "to sum up", "as a result", "in fact", "first", "second",
+    "finally", "also", "however", "moreover", "furthermore", "therefore", "additionally",
+    "besides", "consequently", "nevertheless", "meanwhile", "similarly", "thus", "overall",
+)
+
+REPEATED_WORD_MIN = 4
+REPEATED_PHRASE_MIN = 2
+PHRASE_SIZES = (2, 3, 4)
+TOP_N = 10
+
+WORD_RE = re.compile(r"[A-Za-z]+(?:['’-][A-Za-z]+)*")
+SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])[\"')\]”]*\s+|\n\s*\n")
+TRANSITION_RE = re.compile(
+    r"\b(" + "|".join(re.escape(t) for t in sorted(TRANSITIONS, key=len, reverse=True)) + r")\b"
+)
+
+
+class FrequencyTable:
+    """Ranked word list stored as an alphabetical word list plus a rank array."""
+
+    def __init__(self, ranked_words: Iterable[str]):
+        ranked = list(dict.fromkeys(w.strip().lower() for w in ranked_words if w.strip()))
+        order = sorted(range(len(ranked)), key=ranked.__getitem__)
+        self._words = [ranked[i] for i in order]
+        self._ranks = array("I", (i + 1 for i in order))
+
+    @classmethod
+    def load(cls, path: str = WORD_FREQ_PATH) -> "FrequencyTable":
+        with open(path, encoding="utf-8") as f:
+            return cls(line for line in f if not line.startswith("#"))
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def _exact(self, word: str) -> Optional[int]:
+        i = bisect_left(self._words, word)
+        if i < len(self._words) and self._words[i] == word:
+            return self._ranks[i]
+        return None
+
+    def rank(self, word: str) -> Optional[int]:
+        """1-based frequency rank of ``word`` or of its base form, else None."""
+        word = word.lower().replace("’", "'")
+        rank = self._exact(word)
+        if rank is not None:
+            return rank
+        for base in _base_forms(word):
+            rank = self._exact(base)
+            if rank is not None:
+                return rank
+        return None
+
+
+def _base_forms(word: str) -> List[str]:
+    """Candidate base forms for simple English inflections (studies -> study)."""
+    forms = []
+    if word.endswith("'s"):
+        forms.append(word[:-2])
+    if word.endswith("ies"):
+        forms.append(word[:-3] + "y")
+    if word.endswith("es"):
+        forms.append(word[:-2])
+    if word.endswith("s"):
+        forms.append(word[:-1])
+    if word.endswith("ied"):
+        forms.append(word[:-3] + "y")
+    if word.endswith("ed"):
+        forms.extend((word[:-1], word[:-2]))
+    if word.endswith("ing"):
+        forms.extend((word[:-3], word[:-3] + "e"))
+    if word.endswith("ly"):
+        forms.append(word[:-2])
+    return [f for f in forms if len(f) > 1]
+
+
+_table: Optional[FrequencyTable] = None
+_table_lock = threading.Lock()
+
+
+def frequency_table() -> FrequencyTable:
+    """The bundled word list, loaded on first use."""
+    global _table
+    if _table is None:
+        with _table_lock:
+            if _table is None:
+                _table = FrequencyTable.load()
+    return _table
+
+
+def split_sentences(text: str) -> List[str]:
+    return [s for s in (part.strip() for part in SENTENCE_SPLIT_RE.split(text)) if WORD_RE.search(s)]
+
+
+def analyze(text: str, table: Optional[FrequencyTable] = None) -> Dict:
+    """Score an essay; see the module docstring for what is reported."""
+    table = table or frequency_table()
+    sentences = [[w.lower() for w in WORD_RE.findall(s)] for s in split_sentences(text)]
+    tokens = [w for sentence in sentences for w in sentence]
+    counts = Counter(tokens)
+    ranks = {w: table.rank(w) for w in counts}
+
+    def is_function_word(w: str) -> bool:
+        rank = ranks.get(w)
+        return rank is not None and rank <= FUNCTION_WORD_RANK
+
+    return {
+        "words": len(tokens),
+        "unique_words": len(counts),
+        "sentences": len(sentences),
+        "sentence_lengths": _length_spread([len(s) for s in sentences]),
+        "repeated_words": [
+            (w, n)
+            for w, n in counts.most_common()
+            if n >= REPEATED_WORD_MIN and not is_function_word(w) and w not in TRANSITIONS
+        ][:TOP_N],
+        "repeated_phrases": _repeated_phrases(sentences, is_function_word),
+        "transitions": _transitions(text, len(tokens)),
+        "coverage": _coverage(counts, ranks, len(tokens)),
+        "beyond_list": sorted(
+            (w for w in counts if ranks[w] is None and len(w) > 3), key=lambda w: (-counts[w], w)
+        )[:TOP_N],
+    }
+
+
+def _length_spread(lengths: List[int]) -> Dict:
+    if not lengths:
+        return {"mean": 0.0, "stdev": 0.0, "min": 0, "max": 0, "short": 0, "long": 0}
+    mean = sum(lengths) / len(lengths)
+    stdev = math.sqrt(sum((n - mean) ** 2 for n in lengths) / len(lengths))
+    return {
+        "mean": mean,
+        "stdev": stdev,
+        "min": min(lengths),
+        "max": max(lengths),
+        "short": sum(1 for n in lengths if n < 8),
+        "long": sum(1 for n in lengths if n > 35),
+    }
+
+
+def _repeated_phrases(sentences: List[List[str]], is_function_word) -> List[Tuple[str, int]]:
+    """Word n-grams used more than once, longest first; sub-phrases of a reported phrase are dropped."""
+    counts: Counter = Counter()
+    for words in sentences:
+        for n in PHRASE_SIZES:
+            counts.update(zip(*(words[i:] for i in range(n))))
+    found: List[Tuple[Tuple[str, ...], int]] = []
+    covered: Dict[Tuple[str, ...], int] = {}  # sub-n-gram -> highest count of a reported phrase containing it
+    for gram, n in sorted(counts.items(), key=lambda kv: (-len(kv[0]), -kv[1], kv[0])):
+        if n < REPEATED_PHRASE_MIN or covered.get(gram, 0) >= n or all(is_function_word(w) for w in gram):
+            continue
+        found.append((gram, n))
+        for size in range(PHRASE_SIZES[0], len(gram)):
+            for i in range(len(gram) - size + 1):
+                sub = gram[i : i + size]
+                covered[sub] = max(covered.get(sub, 0), n)
+    found.sort(key=lambda kv: (-kv[1], -len(kv[0])))
+    return [(" ".join(gram), n) for gram, n in found[:TOP_N]]
+
+
+def _transitions(text: str, word_count: int) -> Dict:
+    counts = Counter(m.group(1) for m in TRANSITION_RE.finditer(text.lower()))
+    # More than twice, or more than once per 150 words, reads as formulaic
+    limit = max(2, word_count // 150)
+    return {
+        "counts": counts.most_common(),
+        "overused": [(t, n) for t, n in counts.most_common() if n > limit],
+    }
+
+
+def _coverage(counts: Counter, ranks: Dict[str, Optional[int]], total: int) -> List[Tuple[str, float]]:
+    """Share of running words within each cumulative frequency band."""
+    if not total:
+        return [(label, 0.0) for _, label in BANDS] + [("Beyond list", 0.0)]
+    rows = []
+    for limit, label in BANDS:
+        inside = sum(n for w, n in counts.items() if ranks[w] is not None and ranks[w] <= limit)
+        rows.append((label, inside / total))
+    beyond = sum(n for w, n in counts.items() if ranks[w] is None)
+    rows.append(("Beyond list", beyond / total))
+    return rows
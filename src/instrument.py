@@ -0,0 +1,202 @@
+"""Opt-in hot-path instrumentation.
+
+Enabled with the TOEFL_PREP_PROFILE=1 environment variable or
+``main.py --profile``. When enabled, decorated functions, spans and audio
+callbacks record their durations into log2-bucketed histograms, and a report
+is printed (or written to a file) at exit.
+
+Decorators decide at decoration time: when instrumentation is off they return
+the function unchanged, so ``enable()`` must run before the instrumented
+modules are imported (main.py imports the app after parsing its flags).
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+
+PROFILE_ENV = "TOEFL_PREP_PROFILE"
+BUCKETS = 40  # bucket i holds durations in [2**(i-1), 2**i) microseconds
+
+enabled = os.environ.get(PROFILE_ENV, "") not in ("", "0")
+_report_path: Optional[str] = None
+_histograms: Dict[str, "Histogram"] = {}
+_counters: Dict[str, int] = {}
+_lock = threading.Lock()
+_report_registered = False
+_extra_reports: List[Callable[[], str]] = []
+
+
+class Histogram:
+    """Count/total/max plus log2 buckets; O(1) memory per name."""
+
+    __slots__ = ("count", "total", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * BUCKETS
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        micros = int(seconds * 1e6)
+        self.buckets[min(micros.bit_length(), BUCKETS - 1)] += 1
+
+    def percentile(self, q: float) -> float:
+        """Upper bound (seconds) of the bucket holding the q-th percentile."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= target:
+                return min((1 << i) / 1e6, self.max)
+        return self.max
+
+
+def enable(report_path: Optional[str] = None) -> None:
+    global enabled, _report_path, _report_registered
+    enabled = True
+    _report_path = report_path or _report_path
+    if not _report_registered:
+        atexit.register(dump_report)
+        _report_registered = True
+
+
+def record(name: str, seconds: float) -> None:
+    with _lock:
+        hist = _histograms.get(name)
+        if hist is None:
+            hist = _histograms[name] = Histogram()
+        hist.add(seconds)
+
+
+def count(name: str, n: int = 1) -> None:
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def timed(arg=None):
+    """Decorator timing every call; usable as ``@timed`` or ``@timed("name")``."""
+
+    def decorate(fn: Callable, name: Optional[str] = None) -> Callable:
+        if not enabled:
+            return fn
+        label = name or f"{fn.__module__}.{fn.__qualname__}"
+
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(label, time.perf_counter() - start)
+
+        wrapper.__name__ = fn.__name__
+        wrapper.__qualname__ = fn.__qualname__
+        wrapper.__doc__ = fn.__doc__
+        wrapper.__wrapped__ = fn
+        return wrapper
+
+    if callable(arg):
+        return decorate(arg)
+    return lambda fn: decorate(fn, arg)
+
+
+@contextmanager
+def _timed_span(name: str):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - start)
+
+
+@contextmanager
+def _null_span():
+    yield
+
+
+def span(name: str):
+    """Context manager timing a block."""
+    return _timed_span(name) if enabled else _null_span()
+
+
+def until_idle(widget, name: str) -> None:
+    """Record the time from now until Tk has processed pending redraws."""
+    if not enabled:
+        return
+    start = time.perf_counter()
+    widget.after_idle(lambda: record(name, time.perf_counter() - start))
+
+
+def audio_callback(name: str, callback: Callable, samplerate: float) -> Callable:
+    """Wrap a sounddevice stream callback to time it and count overruns.
+
+    Calls slower than the block's real-time budget are counted as ``late``;
+    non-empty status flags (overflow/underflow) are counted per flag text.
+    """
+    if not enabled:
+        return callback
+
+    def wrapper(data, frames, time_info, status):
+        start = time.perf_counter()
+        try:
+            return callback(data, frames, time_info, status)
+        finally:
+            elapsed = time.perf_counter() - start
+            record(name, elapsed)
+            if status:
+                count(f"{name}.status[{str(status).strip()}]")
+            if samplerate and elapsed > frames / samplerate:
+                count(f"{name}.late")
+
+    return wrapper
+
+
+def add_report_section(fn: Callable[[], str]) -> None:
+    """Register an extra text section for the exit report."""
+    _extra_reports.append(fn)
+
+
+def report() -> str:
+    with _lock:
+        hists = sorted(_histograms.items(), key=lambda kv: kv[1].total, reverse=True)
+        counters = sorted(_counters.items())
+    lines = [f"{'name':<58} {'calls':>7} {'total ms':>10} {'mean ms':>9} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}"]
+    for name, h in hists:
+        lines.append(
+            f"{name:<58} {h.count:>7d} {h.total * 1e3:>10.2f} {h.total / h.count * 1e3:>9.3f} "
+            f"{h.percentile(0.5) * 1e3:>8.3f} {h.percentile(0.95) * 1e3:>8.3f} {h.max * 1e3:>8.3f}"
+        )
+    if counters:
+        lines.append("")
+        lines.extend(f"{name:<58} {n:>7d}" for name, n in counters)
+    for section in _extra_reports:
+        text = section()
+        if text:
+            lines.extend(["", text])
+    return "\n".join(lines)
+
+
+def dump_report() -> None:
+    text = "TOEFL Prep instrumentation report\n" + report() + "\n"
+    if _report_path:
+        with open(_report_path, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        sys.stderr.write(text)
+
+
+if enabled:
+    enable()
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+
+"""Check and repair the data root.
+
+``check`` reports, without changing anything:
+
+- rows of the section files that ``load_*_items`` skip silently (unparsable
+  id or score), with their line numbers, plus rows that load but fail the
+  screens' validation and duplicate ids;
+- recordings whose item no longer exists in speaking.csv (deleting an item
+  leaves its takes behind), files in the recordings folder that are not
+  takes, and takes whose audio header cannot be read;
+- Writing drafts and pitch-cache entries left without an item or recording.
+
+Recording headers are read by a thread pool, since the work is I/O bound
+on large archives.
+
+``repair`` fixes what can be fixed without losing data. Skipped rows move
+to ``quarantine/<section>_rejected.csv`` (with their original line numbers)
+and the section file is rewritten without them. With ``--quarantine``,
+orphaned and unreadable takes and orphaned drafts move to
+``quarantine/speaking_audio/`` and ``quarantine/writing_drafts/``. Stale
+pitch-cache entries are derived data and are deleted.
+
+    python src/integrity.py check [--user NAME] [--workers N]
+    python src/integrity.py repair --quarantine [--user NAME]
+
+Exit status: 0 when clean (or everything was repaired), 2 when problems
+remain.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+
+import paths
+import profiles
+import recordings
+import storage
+
+
+DRAFT_PREFIX, DRAFT_SUFFIX = "essay_", ".txt"
+
+
+# ----- Section files -----
+
+
+def scan_section(section: str) -> Dict:
+    """Classify every row of a section file.
+
+    Returns ``{"path", "rows", "ids", "skipped": [(line, reason, raw row)],
+    "invalid": [(line, reason)], "duplicates": [(line, id)]}``.
+    """
+    path = storage.section_csv(section)
+    report = {"path": path, "rows": 0, "ids": set(), "skipped": [], "invalid": [], "duplicates": [], "missing_columns": []}
+    if not os.path.exists(path):
+        return report
+    fields = storage.SECTION_FIELDS[section]
+    seen: Dict[int, int] = {}
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        report["missing_columns"] = [c for c in fields if c not in (reader.fieldnames or [])]
+        for row in reader:
+            line = reader.line_num
+            report["rows"] += 1
+            # Mirror the loaders: id and right_answers must parse as integers
+            try:
+                item_id = int(row.get("id", "0") or 0)
+                if "right_answers" in fields:
+                    int(row.get("right_answers", "0") or 0)
+            except (TypeError, ValueError):
+                report["skipped"].append((line, _unparsable(row, fields), row))
+                continue
+            if item_id in seen:
+                report["duplicates"].append((line, item_id))
+            seen.setdefault(item_id, line)
+            report["ids"].add(item_id)
+            try:
+                storage.validate_item(section, item_id, row)
+            except storage.ItemValidationError as e:
+                report["invalid"].append((line, str(e)))
+    return report
+
+
+def _unparsable(row: Dict, fields: List[str]) -> str:
+    if None in row:
+        return "too many columns"
+    bad = [c for c in ("id", "right_answers") if c in fields and not _is_int(row.get(c, "0") or "0")]
+    return "not an integer: " + ", ".join(f"{c}={row.get(c)!r}" for c in bad)
+
+
+def _is_int(value) -> bool:
+    try:
+        int(value)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+def drop_skipped_rows(section: str, report: Dict, quarantine_dir: str) -> int:
+    """Move unparsable rows to the quarantine and rewrite the section file without them."""
+    if not report["skipped"]:
+        return 0
+    fields = storage.SECTION_FIELDS[section]
+    os.makedirs(quarantine_dir, exist_ok=True)
+    rejected = os.path.join(quarantine_dir, f"{section}_rejected.csv")
+    new_file = not os.path.exists(rejected)
+    with open(rejected, "a", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        if new_file:
+            writer.writerow(["quarantined", "line"] + fields)
+        stamp = time.strftime("%Y-%m-%dT%H:%M:%S")
+        for line, _, row in report["skipped"]:
+            writer.writerow([stamp, line] + [row.get(c, "") for c in fields])
+
+    skipped_lines = {line for line, _, _ in report["skipped"]}
+    path = report["path"]
+    tmp = path + ".tmp"
+    with open(path, newline="", encoding="utf-8") as src, open(tmp, "w", newline="", encoding="utf-8") as dst:
+        reader = csv.DictReader(src)
+        writer = csv.DictWriter(dst, fieldnames=reader.fieldnames or fields, extrasaction="ignore")
+        writer.writeheader()
+        for row in reader:
+            if reader.line_num not in skipped_lines:
+                writer.writerow(row)
+    os.replace(tmp, path)
+    return len(skipped_lines)
+
+
+# ----- Recordings and derived files -----
+
+
+def check_recording(path: str) -> Optional[str]:
+    """None if the take's audio header reads, else what is wrong with it."""
+    try:
+        if path.lower().endswith(".wav"):
+            clip = recordings.MappedWav(path)
+            frames = clip.frames
+            clip.close()
+        else:
+            import soundfile as sf  # type: ignore
+
+            frames = sf.info(path).frames
+    except ImportError:
+        return None  # cannot tell without soundfile
+    except Exception as e:
+        return (str(e) or type(e).__name__).replace(f": {path}", "")
+    return None if frames > 0 else "no audio frames"
+
+
+def scan_recordings(speaking_ids: Set[int], workers: Optional[int] = None) -> Dict:
+    """Cross-check the recordings folder against speaking.csv."""
+    directory = paths.current().speaking_audio_dir
+    report = {"takes": 0, "orphans": [], "unreadable": [], "foreign": [], "bytes_orphaned": 0}
+    try:
+        entries = [e for e in os.scandir(directory) if e.is_file()]
+    except FileNotFoundError:
+        return report
+    takes = []
+    for entry in sorted(entries, key=lambda e: e.name):
+        parsed = recordings.parse_take_name(entry.name)
+        if parsed is None:
+            report["foreign"].append(entry.path)
+            continue
+        report["takes"] += 1
+        takes.append(entry.path)
+        if parsed[0] not in speaking_ids:
+            report["orphans"].append(entry.path)
+            report["bytes_orphaned"] += entry.stat().st_size
+    with ThreadPoolExecutor(max_workers=workers or min(16, (os.cpu_count() or 1) * 2)) as pool:
+        for path, problem in zip(takes, pool.map(check_recording, takes)):
+            if problem is not None:
+                report["unreadable"].append((path, problem))
+    return report
+
+
+def scan_drafts(writing_ids: Set[int]) -> List[str]:
+    directory = paths.current().writing_drafts_dir
+    try:
+        names = sorted(os.listdir(directory))
+    except FileNotFoundError:
+        return []
+    orphans = []
+    for name in names:
+        if name.startswith(DRAFT_PREFIX) and name.endswith(DRAFT_SUFFIX):
+            item = name[len(DRAFT_PREFIX) : -len(DRAFT_SUFFIX)]
+            if not item.isdigit() or int(item) not in writing_ids:
+                orphans.append(os.path.join(directory, name))
+    return orphans
+
+
+def scan_pitch_cache() -> List[str]:
+    """Cache entries whose recording is gone."""
+    registry = paths.current()
+    try:
+        names = sorted(os.listdir(registry.pitch_cache_dir))
+    except FileNotFoundError:
+        return []
+    return [
+        os.path.join(registry.pitch_cache_dir, name)
+        for name in names
+        if name.endswith(".npz") and not os.path.exists(os.path.join(registry.speaking_audio_dir, name[: -len(".npz")]))
+    ]
+
+
+def quarantine(files: List[str], target_dir: str) -> int:
+    os.makedirs(target_dir, exist_ok=True)
+    moved = 0
+    for path in files:
+        target = os.path.join(target_dir, os.path.basename(path))
+        if os.path.exists(target):
+            stem, ext = os.path.splitext(target)
+            target = f"{stem}.{int(time.time())}{ext}"
+        shutil.move(path, target)
+        moved += 1
+    return moved
+
+
+# ----- Command line -----
+
+
+def run(repair: bool = False, quarantine_orphans: bool = False, workers: Optional[int] = None, out=sys.stdout) -> int:
+    """Check (and optionally repair) the active data root; returns the number of problems left."""
+    registry = paths.current()
+    quarantine_dir = os.path.join(registry.root, "quarantine")
+    remaining = 0
+    ids: Dict[str, Set[int]] = {}
+
+    for section in storage.SECTIONS:
+        report = scan_section(section)
+        ids[section] = report["ids"]
+        name = os.path.basename(report["path"])
+        if not report["rows"] and not os.path.exists(report["path"]):
+            continue
+        print(f"{name}: {report['rows']} rows", file=out)
+        if report["missing_columns"]:
+            remaining += 1
+            print(f"  missing columns: {', '.join(report['missing_columns'])}", file=out)
+        for line, reason, _ in report["skipped"]:
+            print(f"  line {line}: skipped when loading ({reason})", file=out)
+        for line, reason in report["invalid"]:
+            print(f"  line {line}: {reason}", file=out)
+        for line, item_id in report["duplicates"]:
+            print(f"  line {line}: duplicate id {item_id}", file=out)
+        remaining += len(report["invalid"]) + len(report["duplicates"])
+        if repair and report["skipped"]:
+            moved = drop_skipped_rows(section, report, quarantine_dir)
+            print(f"  moved {moved} skipped rows to quarantine/{section}_rejected.csv", file=out)
+        else:
+            remaining += len(report["skipped"])
+
+    takes = scan_recordings(ids["speaking"], workers)
+    print(f"{os.path.basename(registry.speaking_audio_dir)}: {takes['takes']} takes", file=out)
+    for path in takes["orphans"]:
+        print(f"  {os.path.basename(path)}: no speaking item with this id", file=out)
+    if takes["orphans"]:
+        print(f"  {len(takes['orphans'])} orphaned takes use {takes['bytes_orphaned'] / 1e6:.1f} MB", file=out)
+    for path, problem in takes["unreadable"]:
+        print(f"  {os.path.basename(path)}: unreadable ({problem})", file=out)
+    for path in takes["foreign"]:
+        print(f"  {os.path.basename(path)}: not a take file", file=out)
+    stray = sorted(set(takes["orphans"]) | {p for p, _ in takes["unreadable"]})
+    drafts = scan_drafts(ids["writing"])
+    for path in drafts:
+        print(f"  {os.path.basename(path)}: draft without a writing item", file=out)
+    if repair and quarantine_orphans:
+        if stray:
+            moved = quarantine(stray, os.path.join(quarantine_dir, "speaking_audio"))
+            print(f"  moved {moved} takes to quarantine/speaking_audio", file=out)
+        if drafts:
+            moved = quarantine(drafts, os.path.join(quarantine_dir, "writing_drafts"))
+            print(f"  moved {moved} drafts to quarantine/writing_drafts", file=out)
+    else:
+        remaining += len(stray) + len(drafts)
+
+    stale = scan_pitch_cache()
+    if stale:
+        if repair:
+            for path in stale:
+                os.remove(path)
+            print(f"pitch_cache: removed {len(stale)} entries of deleted takes", file=out)
+        else:
+            print(f"pitch_cache: {len(stale)} entries of deleted takes", file=out)
+            remaining += len(stale)
+
+    print("No problems found." if not remaining else f"{remaining} problems found.", file=out)
+    return remaining
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Check or repair TOEFL Prep data files and recordings.")
+    parser.add_argument("--data-dir", default=None, help="data root directory")
+    parser.add_argument("--user", default=None, help="profile to check (default: the base data root)")
+    parser.add_argument("--workers", type=int, default=None, help="threads reading recording headers")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("check", help="report problems without changing anything")
+    repair = sub.add_parser("repair", help="quarantine skipped rows and drop stale cache entries")
+    repair.add_argument("--quarantine", action="store_true", help="also move orphaned/unreadable takes and drafts")
+    args = parser.parse_args(argv)
+    paths.configure(args.data_dir)
+    if args.user:
+        if args.user not in profiles.list_profiles():
+            parser.error(f"unknown profile '{args.user}'")
+        paths.configure(profiles.profile_root(args.user))
+
+    try:
+        remaining = run(args.command == "repair", getattr(args, "quarantine", False), args.workers)
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0 if not remaining else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
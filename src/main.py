@@ -7,13 +7,92 @@ Launches the main application window. App components are modularized under
 app.py (shell), screens/, ui/, and storage.py.
 """
 
-from app import MainWindow
+import argparse
+import os
+
+import audio_stack
+import instrument
+import paths
+import profiles
+import retention
+import watchdog
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="TOEFL Prep desktop app")
+    parser.add_argument(
+        "--data-dir",
+        default=None,
+        help=f"data root directory (default: ${paths.DATA_ROOT_ENV} or the repository's data/ folder)",
+    )
+    parser.add_argument("--user", default=None, help="learner profile to open (default: the last one used)")
+    parser.add_argument(
+        "--no-audio-warmup",
+        action="store_true",
+        help="do not load the audio libraries at startup (they load when the Speaking answer window opens)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=f"time storage, rendering, screen switches and audio callbacks (also ${instrument.PROFILE_ENV}=1)",
+    )
+    parser.add_argument("--profile-out", default=None, help="write the instrumentation report to this file")
+    parser.add_argument("--profile-startup", default=None, metavar="FILE", help="save a cProfile capture of startup")
+    parser.add_argument(
+        "--watch-latency",
+        action="store_true",
+        help=f"report Tk event-loop stalls with the stack that caused them (also ${watchdog.WATCHDOG_ENV}=1)",
+    )
+    parser.add_argument("--stall-threshold-ms", type=int, default=100, help="minimum stall reported by --watch-latency")
+    return parser
 
 
 def main() -> None:
+    parser = build_parser()
+    args = parser.parse_args()
+    paths.configure(args.data_dir)
+    if args.user and args.user not in profiles.list_profiles():
+        # Same as the command-line tools; a typo should not open another profile's data
+        parser.error(f"unknown profile '{args.user}' (existing: {', '.join(profiles.list_profiles())})")
+    profiles.init(args.user)
+    if args.profile or args.profile_out or args.profile_startup:
+        instrument.enable(args.profile_out)
+
+    profiler = None
+    if args.profile_startup:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    # Imported late so instrumentation is decided before modules are decorated
+    from app import MainWindow
+
     app = MainWindow()
+    if not args.no_audio_warmup:
+        # Load the audio stack and list devices in the background once the window has painted
+        app.after_idle(audio_stack.warm_up)
+    # Applies the profile's recording retention policy in the background
+    retention.sweeper.start()
+    if profiler is not None:
+        app.update_idletasks()
+        profiler.disable()
+        profiler.dump_stats(args.profile_startup)
+        instrument.add_report_section(lambda: _startup_summary(profiler))
+    if args.watch_latency or os.environ.get(watchdog.WATCHDOG_ENV, "") not in ("", "0"):
+        watchdog.install(app, threshold_ms=args.stall_threshold_ms)
     app.mainloop()
 
 
+def _startup_summary(profiler) -> str:
+    import io
+    import pstats
+
+    out = io.StringIO()
+    out.write("Startup profile (top 20 by cumulative time):\n")
+    pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(20)
+    return out.getvalue()
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
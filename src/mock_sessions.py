@@ -0,0 +1,121 @@
+"""Mock-test sequencing data: section limits, background warm-up and session records.
+
+A finished (or abandoned) mock test is appended as one JSON line to
+``mock_tests.jsonl`` in the data root:
+
+    {"started": "...", "ended": "...", "profile": "Default", "completed": true,
+     "sections": [{"section": "reading", "limit_s": 2100, "used_s": 1984.2,
+                   "ended_by": "next", "activity": {"attempts": 2, "right_answers": 15}}, ...]}
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import time
+from typing import Dict, Iterator, List
+
+import attempts
+import audio_devices
+import audio_stack
+import paths
+import profiles
+import storage
+from text_stats import IncrementalTextStats
+
+
+SECTION_ORDER = ("reading", "listening", "speaking", "writing")
+# Section lengths of the current TOEFL iBT format, in minutes
+SECTION_MINUTES = {"reading": 35, "listening": 36, "speaking": 16, "writing": 29}
+DRAFT_NAME_RE = re.compile(r"^essay_(\d+)\.txt$")
+
+
+def limit_seconds(section: str) -> int:
+    return SECTION_MINUTES[section] * 60
+
+
+def warm(section: str) -> None:
+    """Load what the section screen will need, off the Tk thread.
+
+    Reads the section file (so the screen's own load hits the page cache) and
+    imports/initializes heavy dependencies: the audio stack and device list
+    for Speaking, the word list for Writing. Failures are left for the
+    screen to report.
+    """
+    for _ in storage.iter_items(section):
+        pass
+    if section == "speaking":
+        if audio_stack.wait(timeout=10) and audio_stack.modules() is not None:
+            audio_devices.registry.wait(timeout=10)
+    elif section == "writing":
+        import essay_analysis
+
+        essay_analysis.frequency_table()
+
+
+class SectionProbe:
+    """Snapshot taken when a section starts, to measure what was done in it."""
+
+    def __init__(self, section: str):
+        self.section = section
+        self.started_wall = time.time()
+        self.started = time.monotonic()
+        self._attempts_offset = attempts.log().offset if section in ("reading", "listening") else 0
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def activity(self) -> Dict:
+        if self.section in ("reading", "listening"):
+            rows = [
+                r
+                for r in attempts.log().rows_since(self._attempts_offset)
+                if r.get("section") == self.section and str(r.get("right_answers", "")).strip()
+            ]
+            return {"attempts": len(rows), "right_answers": sum(int(r["right_answers"]) for r in rows)}
+        if self.section == "speaking":
+            return {"takes_saved": len(_modified_since(paths.current().speaking_audio_dir, self.started_wall))}
+        drafts = {}
+        for name in _modified_since(paths.current().writing_drafts_dir, self.started_wall):
+            match = DRAFT_NAME_RE.match(name)
+            if match:
+                item_id = int(match.group(1))
+                drafts[str(item_id)] = IncrementalTextStats(storage.load_writing_draft(item_id)).word_count
+        return {"essays": len(drafts), "words": drafts}
+
+
+def _modified_since(directory: str, since: float) -> List[str]:
+    try:
+        entries = list(os.scandir(directory))
+    except FileNotFoundError:
+        return []
+    return [e.name for e in entries if e.is_file() and e.stat().st_mtime >= since]
+
+
+def save_session(started: float, sections: List[Dict], completed: bool) -> Dict:
+    record = {
+        "started": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(started)),
+        "ended": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "profile": profiles.active(),
+        "completed": completed,
+        "sections": sections,
+    }
+    registry = paths.current()
+    registry.ensure_dir(registry.root)
+    with open(registry.mock_tests_log, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+    return record
+
+
+def iter_sessions() -> Iterator[Dict]:
+    try:
+        f = open(paths.current().mock_tests_log, encoding="utf-8")
+    except FileNotFoundError:
+        return
+    with f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
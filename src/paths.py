@@ -0,0 +1,93 @@
+"""Registry of on-disk data locations.
+
+Every data file and directory is resolved once from a single data root, and
+directory creation is remembered so hot paths do not call ``os.makedirs``
+on each load/save.
+
+The data root is, in order of precedence: the root passed to ``configure``
+(``main.py --data-dir``), the TOEFL_PREP_DATA_DIR environment variable, or
+the repository's ``data/`` folder. Pointing it at a faster local disk or a
+RAM disk is useful for benchmarks.
+
+Modules holding state tied to the active root (write buffers, caches) register
+a release hook with ``on_release``; hooks run before the root changes, e.g.
+when the learner switches profiles.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Callable, List, Optional, Set
+
+
+DATA_ROOT_ENV = "TOEFL_PREP_DATA_DIR"
+DEFAULT_DATA_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+
+class DataPaths:
+    """Resolved locations under one data root."""
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+        self.reading_csv = os.path.join(self.root, "reading.csv")
+        self.listening_csv = os.path.join(self.root, "listening.csv")
+        self.speaking_csv = os.path.join(self.root, "speaking.csv")
+        self.speaking_audio_dir = os.path.join(self.root, "speaking_audio")
+        self.writing_csv = os.path.join(self.root, "writing.csv")
+        self.writing_drafts_dir = os.path.join(self.root, "writing_drafts")
+        self.timing_log = os.path.join(self.root, "practice_timing.jsonl")
+        self.attempts_csv = os.path.join(self.root, "attempts.csv")
+        self.attempts_summary = os.path.join(self.root, "attempts_summary.json")
+        self.content_cache_dir = os.path.join(self.root, "content_cache")
+        self.mock_tests_log = os.path.join(self.root, "mock_tests.jsonl")
+        self.settings_json = os.path.join(self.root, "settings.json")
+        self.pitch_cache_dir = os.path.join(self.root, "pitch_cache")
+        self.recordings_index = os.path.join(self.root, "recordings_index.json")
+        self._ensured: Set[str] = set()
+
+    def section_csv(self, section: str) -> str:
+        return {
+            "reading": self.reading_csv,
+            "listening": self.listening_csv,
+            "speaking": self.speaking_csv,
+            "writing": self.writing_csv,
+        }[section]
+
+    def ensure_dir(self, path: str) -> str:
+        """Create ``path`` if needed; later calls for the same path are free."""
+        if path not in self._ensured:
+            os.makedirs(path, exist_ok=True)
+            self._ensured.add(path)
+        return path
+
+    def forget_dirs(self) -> None:
+        """Drop cached directory state, e.g. after directories were removed."""
+        self._ensured.clear()
+
+
+_current: Optional[DataPaths] = None
+_release_hooks: List[Callable[[], None]] = []
+
+
+def on_release(hook: Callable[[], None]) -> Callable[[], None]:
+    """Run ``hook`` before the active root is replaced (flush or drop root-bound state)."""
+    _release_hooks.append(hook)
+    return hook
+
+
+def configure(root: Optional[str] = None) -> DataPaths:
+    """Resolve the data root and make it the active one."""
+    global _current
+    root = root or os.environ.get(DATA_ROOT_ENV) or DEFAULT_DATA_ROOT
+    if _current is not None:
+        for hook in _release_hooks:
+            hook()
+    _current = DataPaths(root)
+    return _current
+
+
+def current() -> DataPaths:
+    """Return the active registry, resolving the default root on first use."""
+    if _current is None:
+        return configure()
+    return _current
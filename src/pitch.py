@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+
+"""Pitch (F0) contours of Speaking takes, for intonation feedback.
+
+Takes are mixed to mono and decimated to ``ANALYSIS_RATE`` Hz, then framed
+with NumPy stride tricks. F0 is estimated with YIN for all frames at once:
+the difference function comes from FFT cross-correlation plus cumulative
+energies, followed by the cumulative mean normalization, the absolute
+threshold and parabolic refinement. A 60-second take takes well under
+200 ms on one core.
+
+The contour (F0 in Hz every 10 ms, NaN when unvoiced) is cached per
+recording as float16 in ``pitch_cache/<take>.npz``. The entry is tagged
+with the recording's size and mtime, so an edited take is re-analyzed.
+
+Summary stats work in semitones so they do not depend on the speaker's
+voice range:
+- range: 5th to 95th percentile span of voiced frames
+- spread: standard deviation of voiced frames
+- monotony index: 0 for lively speech, 1 for a flat voice, from the spread
+  against ``LIVELY_SPREAD_ST``
+
+Batch mode analyzes the whole recording archive across cores:
+
+    python src/pitch.py [--user NAME] [--workers N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+import paths
+import profiles
+import recordings
+
+
+ANALYSIS_RATE = 8000  # plenty for speech F0, and a quarter of the work of 16 kHz
+HOP_S = 0.010
+WINDOW_S = 0.040
+F0_MIN = 70.0
+F0_MAX = 400.0
+YIN_THRESHOLD = 0.15
+SILENCE_DB = -45.0  # frames this far below the take's loudest frame are unvoiced
+FLOOR_DBFS = -65.0  # and frames below this level always are
+LIVELY_SPREAD_ST = 4.0
+CACHE_VERSION = 1
+
+
+# ----- Tracking -----
+
+
+def decimate(x: np.ndarray, samplerate: int, rate: int = ANALYSIS_RATE) -> Tuple[np.ndarray, int]:
+    """Polyphase resampling to ``rate`` (a no-op at or below it)."""
+    if samplerate <= rate:
+        return x, samplerate
+    from math import gcd
+
+    from scipy import signal
+
+    g = gcd(int(samplerate), rate)
+    return signal.resample_poly(x, rate // g, int(samplerate) // g).astype(np.float32), rate
+
+
+def track(x: np.ndarray, samplerate: int) -> np.ndarray:
+    """F0 in Hz per ``HOP_S`` frame of a mono signal; NaN where unvoiced."""
+    from scipy import fft
+
+    x = np.asarray(x, dtype=np.float32)
+    x, samplerate = decimate(x, samplerate)
+    hop = max(1, int(round(HOP_S * samplerate)))
+    window = int(round(WINDOW_S * samplerate))
+    tau_min = max(2, int(samplerate / F0_MAX))
+    tau_max = int(np.ceil(samplerate / F0_MIN))
+    span = window + tau_max
+    if len(x) < span:
+        return np.full(0, np.nan, dtype=np.float32)
+
+    frames = np.lib.stride_tricks.sliding_window_view(x, span)[::hop]
+    head = frames[:, :window]
+
+    # d(tau) = E(0) + E(tau) - 2 r(tau), with r from one FFT per frame. The
+    # zero-padded head only overlaps ``span`` samples, so lags up to tau_max
+    # do not wrap with an FFT that long.
+    n_fft = 1 << int(np.ceil(np.log2(span)))
+    spec = fft.rfft(frames, n_fft) * np.conj(fft.rfft(head, n_fft))
+    corr = fft.irfft(spec, n_fft)[:, : tau_max + 1]
+    # Energy of every lagged window: sliding sums from one (float64) cumulative sum of x^2
+    energy = np.concatenate([[0.0], np.cumsum(np.square(x, dtype=np.float64))])
+    sums = energy[window:] - energy[:-window]
+    e_tau = np.lib.stride_tricks.sliding_window_view(sums, tau_max + 1)[::hop][: len(frames)].astype(np.float32)
+    taus = np.arange(tau_max + 1)
+    diff = e_tau[:, :1] + e_tau
+    diff -= 2.0 * corr
+    np.maximum(diff, 0.0, out=diff)
+
+    # Cumulative mean normalized difference
+    cmnd = np.ones_like(diff)
+    running = np.cumsum(diff[:, 1:], axis=1)
+    np.maximum(running, np.finfo(np.float32).tiny, out=running)
+    np.multiply(diff[:, 1:], taus[1:].astype(np.float32), out=cmnd[:, 1:])
+    cmnd[:, 1:] /= running
+
+    # First local minimum under the threshold in the allowed lag range
+    inner = cmnd[:, tau_min:tau_max]
+    local_min = (inner <= cmnd[:, tau_min - 1 : tau_max - 1]) & (inner <= cmnd[:, tau_min + 1 : tau_max + 1])
+    candidate = local_min & (inner < YIN_THRESHOLD)
+    voiced = candidate.any(axis=1)
+    best = np.argmax(candidate, axis=1) + tau_min
+
+    # Parabolic refinement around the chosen lag
+    rows = np.arange(len(frames))
+    left, mid, right = cmnd[rows, best - 1], cmnd[rows, best], cmnd[rows, best + 1]
+    denom = left - 2.0 * mid + right
+    with np.errstate(divide="ignore", invalid="ignore"):
+        shift = np.where(np.abs(denom) > 1e-12, 0.5 * (left - right) / denom, 0.0)
+    period = best + np.clip(shift, -1.0, 1.0)
+
+    level = 10.0 * np.log10(e_tau[:, 0] / window + 1e-12)
+    voiced &= level > max(level.max() + SILENCE_DB, FLOOR_DBFS)
+    return np.where(voiced, samplerate / period, np.nan).astype(np.float32)
+
+
+def contour_stats(f0: np.ndarray) -> Dict:
+    voiced = f0[np.isfinite(f0)].astype(np.float64)
+    stats = {
+        "frames": int(len(f0)),
+        "voiced_ratio": round(len(voiced) / len(f0), 3) if len(f0) else 0.0,
+        "median_hz": None,
+        "range_st": None,
+        "spread_st": None,
+        "monotony": None,
+    }
+    if len(voiced) < 10:
+        return stats
+    median = float(np.median(voiced))
+    semitones = 12.0 * np.log2(voiced / median)
+    low, high = np.percentile(semitones, [5, 95])
+    spread = float(np.std(semitones))
+    stats.update(
+        median_hz=round(median, 1),
+        range_st=round(float(high - low), 1),
+        spread_st=round(spread, 2),
+        monotony=round(float(np.clip(1.0 - spread / LIVELY_SPREAD_ST, 0.0, 1.0)), 2),
+    )
+    return stats
+
+
+# ----- Cache -----
+
+
+def cache_path(recording: str, cache_dir: Optional[str] = None) -> str:
+    cache_dir = cache_dir or paths.current().pitch_cache_dir
+    return os.path.join(cache_dir, os.path.basename(recording) + ".npz")
+
+
+def _signature(recording: str) -> np.ndarray:
+    st = os.stat(recording)
+    return np.array([CACHE_VERSION, st.st_size, st.st_mtime_ns], dtype=np.int64)
+
+
+def load_cached(recording: str, cache_dir: Optional[str] = None) -> Optional[np.ndarray]:
+    try:
+        with np.load(cache_path(recording, cache_dir)) as cached:
+            if np.array_equal(cached["signature"], _signature(recording)):
+                return cached["f0"].astype(np.float32)
+    except (OSError, KeyError, ValueError):
+        pass
+    return None
+
+
+def contour(recording: str, cache_dir: Optional[str] = None) -> np.ndarray:
+    """F0 contour of a saved take, from the cache when it is current."""
+    cached = load_cached(recording, cache_dir)
+    if cached is not None:
+        return cached
+    signature = _signature(recording)
+    clip = recordings.open_recording(recording)
+    try:
+        data = clip.read_all() if hasattr(clip, "read_all") else clip.read(0, clip.frames)
+        mono = data.mean(axis=1) if data.ndim == 2 else data
+        f0 = track(mono, clip.samplerate)
+    finally:
+        clip.close()
+    target = cache_path(recording, cache_dir)
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    tmp = target + ".tmp.npz"
+    np.savez(tmp, f0=f0.astype(np.float16), signature=signature)
+    os.replace(tmp, target)
+    return f0
+
+
+def analyze(recording: str, cache_dir: Optional[str] = None) -> Dict:
+    """Contour plus summary stats for one take."""
+    f0 = contour(recording, cache_dir)
+    return {"path": recording, "hop_s": HOP_S, "f0": f0, "stats": contour_stats(f0)}
+
+
+# ----- Batch -----
+
+
+def _batch_one(args: Tuple[str, str]) -> Tuple[str, Optional[Dict], Optional[str]]:
+    recording, cache_dir = args
+    try:
+        return recording, contour_stats(contour(recording, cache_dir)), None
+    except Exception as e:
+        return recording, None, str(e)
+
+
+def analyze_archive(workers: Optional[int] = None) -> List[Tuple[str, Optional[Dict], Optional[str]]]:
+    """Analyze every saved take of the active profile across processes.
+
+    Returns ``[(path, stats or None, error or None)]`` in file-name order.
+    """
+    registry = paths.current()
+    try:
+        names = sorted(e.name for e in os.scandir(registry.speaking_audio_dir) if e.is_file())
+    except FileNotFoundError:
+        return []
+    jobs = [
+        (os.path.join(registry.speaking_audio_dir, name), registry.pitch_cache_dir)
+        for name in names
+        if recordings.parse_take_name(name) is not None
+    ]
+    if not jobs:
+        return []
+    if workers == 1 or len(jobs) == 1:
+        return [_batch_one(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_batch_one, jobs, chunksize=4))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Extract pitch contours of all saved Speaking takes.")
+    parser.add_argument("--data-dir", default=None, help="data root directory")
+    parser.add_argument("--user", default=None, help="profile to analyze (default: the base data root)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per core)")
+    args = parser.parse_args(argv)
+    paths.configure(args.data_dir)
+    if args.user:
+        if args.user not in profiles.list_profiles():
+            parser.error(f"unknown profile '{args.user}'")
+        paths.configure(profiles.profile_root(args.user))
+
+    results = analyze_archive(args.workers)
+    failed = 0
+    for path, stats, error in results:
+        name = os.path.basename(path)
+        if error is not None:
+            failed += 1
+            print(f"{name}: error: {error}", file=sys.stderr)
+        elif stats["median_hz"] is None:
+            print(f"{name}: too little voiced speech")
+        else:
+            print(
+                f"{name}: median {stats['median_hz']:.0f} Hz, range {stats['range_st']:.1f} st, "
+                f"monotony {stats['monotony']:.2f}"
+            )
+    print(f"Analyzed {len(results) - failed} takes ({failed} failed)")
+    return 0 if not failed else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""Named learner profiles, each with its own data root.
+
+The data root chosen at startup (``--data-dir``, TOEFL_PREP_DATA_DIR or the
+repository's ``data/``) is the base. Its own files are the "Default" profile,
+so existing data keeps working; other profiles live under ``profiles/<name>``
+inside it. Only the active profile's root is configured in ``paths``; switching
+runs the registered release hooks (buffers are flushed, caches dropped) before
+the new root becomes active. The last active profile is remembered in
+``profiles.json`` in the base root.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from typing import List, Optional
+
+import paths
+
+
+DEFAULT_PROFILE = "Default"
+PROFILES_DIRNAME = "profiles"
+STATE_FILENAME = "profiles.json"
+NAME_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9 _.-]{0,39}$")
+
+
+class ProfileError(ValueError):
+    pass
+
+
+_base_root: Optional[str] = None
+_active = DEFAULT_PROFILE
+
+
+def init(name: Optional[str] = None) -> str:
+    """Take the configured data root as the base and open ``name`` (or the last used profile)."""
+    global _base_root
+    _base_root = paths.current().root
+    name = name or _load_state().get("active") or DEFAULT_PROFILE
+    if name not in list_profiles():
+        name = DEFAULT_PROFILE
+    return switch(name)
+
+
+def base_root() -> str:
+    return _base_root or paths.current().root
+
+
+def active() -> str:
+    return _active
+
+
+def profile_root(name: str) -> str:
+    if name == DEFAULT_PROFILE:
+        return base_root()
+    return os.path.join(base_root(), PROFILES_DIRNAME, name)
+
+
+def list_profiles() -> List[str]:
+    try:
+        entries = os.listdir(os.path.join(base_root(), PROFILES_DIRNAME))
+    except FileNotFoundError:
+        entries = []
+    names = sorted(
+        (e for e in entries if NAME_RE.match(e) and os.path.isdir(os.path.join(base_root(), PROFILES_DIRNAME, e))),
+        key=str.lower,
+    )
+    return [DEFAULT_PROFILE] + [n for n in names if n != DEFAULT_PROFILE]
+
+
+def create_profile(name: str) -> str:
+    name = name.strip()
+    if not NAME_RE.match(name):
+        raise ProfileError("Profile names use letters, digits, spaces, '.', '_' or '-' (at most 40 characters).")
+    if name.lower() in (p.lower() for p in list_profiles()):
+        raise ProfileError(f"A profile named '{name}' already exists.")
+    os.makedirs(profile_root(name))
+    return name
+
+
+def switch(name: str) -> str:
+    """Make ``name`` the active profile without restarting the app."""
+    global _active
+    if name not in list_profiles():
+        raise ProfileError(f"Unknown profile '{name}'.")
+    root = profile_root(name)
+    if name != _active or paths.current().root != os.path.abspath(root):
+        paths.configure(root)
+    _active = name
+    _save_state({"active": name})
+    return name
+
+
+def _state_path() -> str:
+    return os.path.join(base_root(), STATE_FILENAME)
+
+
+def _load_state() -> dict:
+    try:
+        with open(_state_path(), encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def _save_state(state: dict) -> None:
+    try:
+        os.makedirs(base_root(), exist_ok=True)
+        with open(_state_path(), "w", encoding="utf-8") as f:
+            json.dump(state, f)
+    except OSError:
+        pass  # remembering the last profile is a convenience only
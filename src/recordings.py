@@ -0,0 +1,287 @@
+"""Read access to speaking recordings.
+
+PCM/float WAV files are opened by parsing their RIFF chunks and exposing the
+data chunk through ``np.memmap``: opening a take costs a few small reads no
+matter how long it is, and only the frames that are actually read get paged
+in. Other formats fall back to a full decode with soundfile.
+
+NumPy is imported lazily so the app still starts without audio dependencies.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import struct
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+import paths
+
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# (format tag, bits per sample) -> (numpy dtype, scale, offset)
+_SAMPLE_TYPES = {
+    (WAVE_FORMAT_PCM, 8): ("u1", 1.0 / 128, -128.0),
+    (WAVE_FORMAT_PCM, 16): ("<i2", 1.0 / 32768, 0.0),
+    (WAVE_FORMAT_PCM, 32): ("<i4", 1.0 / 2147483648, 0.0),
+    (WAVE_FORMAT_IEEE_FLOAT, 32): ("<f4", 1.0, 0.0),
+    (WAVE_FORMAT_IEEE_FLOAT, 64): ("<f8", 1.0, 0.0),
+}
+
+
+class ArrayClip:
+    """In-memory clip with the same read API as MappedWav."""
+
+    def __init__(self, data, samplerate: int):
+        if data.ndim == 1:
+            data = data.reshape(-1, 1)
+        self.data = data
+        self.samplerate = int(samplerate)
+        self.channels = int(data.shape[1])
+        self.frames = int(data.shape[0])
+        self.path: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        return self.frames / self.samplerate if self.samplerate else 0.0
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.data.nbytes)
+
+    def read(self, start: int, count: int):
+        """Return up to ``count`` float32 frames starting at ``start``."""
+        start = max(0, min(start, self.frames))
+        return self.data[start : start + count].astype("float32", copy=False)
+
+    def close(self) -> None:
+        pass
+
+
+class MappedWav:
+    """Memory-mapped view over the samples of a WAV file.
+
+    ``data`` is the raw (frames, channels) memmap; ``read`` converts only
+    the requested range to float32 in [-1, 1].
+    """
+
+    def __init__(self, path: str):
+        import numpy as np  # type: ignore
+
+        self.path = path
+        fmt, offset, size = _parse_wav(path)
+        tag, channels, samplerate, block_align, bits = fmt
+        sample = _SAMPLE_TYPES.get((tag, bits))
+        if sample is None:
+            raise ValueError(f"Unsupported WAV encoding (format {tag:#x}, {bits} bits): {path}")
+        dtype, self._scale, self._offset = sample
+
+        self.samplerate = samplerate
+        self.channels = channels
+        self.frames = size // block_align if block_align else 0
+        if self.frames:
+            self.data = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(self.frames, channels))
+        else:
+            self.data = np.zeros((0, channels), dtype=dtype)
+
+    @property
+    def duration(self) -> float:
+        return self.frames / self.samplerate if self.samplerate else 0.0
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the clip once decoded to float32."""
+        return self.frames * self.channels * 4
+
+    def read(self, start: int, count: int):
+        """Return up to ``count`` float32 frames starting at ``start``."""
+        start = max(0, min(start, self.frames))
+        block = self.data[start : start + count].astype("float32")
+        if self._offset:
+            block += self._offset
+        if self._scale != 1.0:
+            block *= self._scale
+        return block
+
+    def read_all(self):
+        return self.read(0, self.frames)
+
+    def close(self) -> None:
+        mm = getattr(self.data, "_mmap", None)
+        self.data = self.data[:0]
+        if mm is not None:
+            try:
+                mm.close()
+            except Exception:
+                # Still referenced by a view handed out earlier; the OS
+                # mapping is released when that view is collected.
+                pass
+
+
+def open_recording(path: str):
+    """Open a recording for reading; WAV files are memory-mapped."""
+    if path.lower().endswith(".wav"):
+        try:
+            return MappedWav(path)
+        except ValueError:
+            pass
+    import soundfile as sf  # type: ignore
+
+    data, samplerate = sf.read(path, dtype="float32", always_2d=True)
+    clip = ArrayClip(data, samplerate)
+    clip.path = path
+    return clip
+
+
+_TAKE_RE = re.compile(r"^speaking_(\d+)_(\d{8}-\d{6})\.(wav|flac)$", re.IGNORECASE)
+
+
+def take_filename(item_id: int, timestamp: str) -> str:
+    return f"speaking_{item_id}_{timestamp}.wav"
+
+
+def parse_take_name(name: str) -> Optional[Tuple[int, str]]:
+    """Return (item id, YYYYmmdd-HHMMSS timestamp) for a take file name."""
+    m = _TAKE_RE.match(name)
+    if not m:
+        return None
+    return int(m.group(1)), m.group(2)
+
+
+def list_takes(directory: str, item_id: int) -> List[Tuple[str, str]]:
+    """Return [(timestamp, path), ...] of the saved takes of an item, newest first."""
+    if not os.path.isdir(directory):
+        return []
+    prefix = f"speaking_{item_id}_"
+    takes = []
+    for entry in os.scandir(directory):
+        if not entry.name.startswith(prefix):
+            continue
+        parsed = parse_take_name(entry.name)
+        if parsed is not None and parsed[0] == item_id:
+            takes.append((parsed[1], entry.path))
+    takes.sort(reverse=True)
+    return takes
+
+
+class ClipCache:
+    """LRU cache of decoded takes bounded by a total byte budget.
+
+    Takes are decoded on first ``get`` and kept as float32 ArrayClips so that
+    switching between recently played attempts does not touch the disk.
+    Clips larger than the whole budget are streamed from their memmap instead.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._clips: "OrderedDict[str, Tuple[float, ArrayClip]]" = OrderedDict()
+        self._bytes = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def peek(self, path: str):
+        """Return the cached clip for ``path`` or an undecoded reader over it."""
+        cached = self._lookup(path)
+        return cached if cached is not None else open_recording(path)
+
+    def get(self, path: str):
+        """Return a decoded clip for ``path``, decoding and caching it if needed."""
+        cached = self._lookup(path)
+        if cached is not None:
+            return cached
+        source = open_recording(path)
+        if isinstance(source, ArrayClip):
+            clip = source
+        else:
+            if source.nbytes > self.max_bytes:
+                return source
+            clip = ArrayClip(source.read_all(), source.samplerate)
+            clip.path = path
+            source.close()
+        self.put(path, clip)
+        return clip
+
+    def put(self, path: str, clip: ArrayClip) -> None:
+        self.discard(path)
+        if clip.nbytes > self.max_bytes:
+            return
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return
+        self._clips[path] = (mtime, clip)
+        self._bytes += clip.nbytes
+        while self._bytes > self.max_bytes and self._clips:
+            _, (_, old) = self._clips.popitem(last=False)
+            self._bytes -= old.nbytes
+
+    def discard(self, path: str) -> None:
+        entry = self._clips.pop(path, None)
+        if entry is not None:
+            self._bytes -= entry[1].nbytes
+
+    def clear(self) -> None:
+        self._clips.clear()
+        self._bytes = 0
+
+    def _lookup(self, path: str) -> Optional[ArrayClip]:
+        entry = self._clips.get(path)
+        if entry is None:
+            return None
+        try:
+            fresh = os.path.getmtime(path) == entry[0]
+        except OSError:
+            fresh = False
+        if not fresh:
+            self.discard(path)
+            return None
+        self._clips.move_to_end(path)
+        return entry[1]
+
+
+# App-wide cache shared by all Answer popups; recordings belong to one data root
+clip_cache = ClipCache()
+paths.on_release(clip_cache.clear)
+
+
+def _parse_wav(path: str):
+    """Return ((tag, channels, samplerate, block_align, bits), data offset, data size)."""
+    file_size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        riff = f.read(12)
+        if len(riff) < 12 or riff[:4] not in (b"RIFF", b"RIFX") or riff[8:12] != b"WAVE":
+            raise ValueError(f"Not a WAV file: {path}")
+        if riff[:4] == b"RIFX":
+            raise ValueError(f"Big-endian WAV is not supported: {path}")
+        fmt = None
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                break
+            chunk_id, chunk_size = struct.unpack("<4sI", header)
+            if chunk_id == b"fmt ":
+                body = f.read(chunk_size)
+                tag, channels, samplerate, _, block_align, bits = struct.unpack("<HHIIHH", body[:16])
+                if tag == WAVE_FORMAT_EXTENSIBLE and len(body) >= 26:
+                    # First two bytes of the SubFormat GUID hold the real tag
+                    (tag,) = struct.unpack("<H", body[24:26])
+                fmt = (tag, channels, samplerate, block_align, bits)
+                if chunk_size % 2:
+                    f.seek(1, os.SEEK_CUR)
+            elif chunk_id == b"data":
+                if fmt is None:
+                    raise ValueError(f"WAV data chunk before fmt chunk: {path}")
+                offset = f.tell()
+                available = file_size - offset
+                # Writers that stream may leave the size as 0 or 0xFFFFFFFF
+                size = chunk_size if 0 < chunk_size <= available else available
+                return fmt, offset, size
+            else:
+                f.seek(chunk_size + (chunk_size % 2), os.SEEK_CUR)
+    raise ValueError(f"WAV file has no data chunk: {path}")
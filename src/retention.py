@@ -0,0 +1,414 @@
+"""Retention of Speaking takes under a per-profile policy and disk budget.
+
+The policy is stored in the profile's settings.json under ``retention``:
+
+    {"keep_latest": 5,        # per item; older takes are evicted (0 = keep all)
+     "max_total_gb": 2.0,     # cap for the whole recordings folder (0 = no cap)
+     "compress": true}        # evicted WAV takes become FLAC instead of being deleted
+
+Pinned takes ("Keep this take" in the answer window) and the newest take of
+each item are never evicted. The default policy keeps everything.
+
+A metadata index in ``recordings_index.json`` records name, item, timestamp,
+size and pin per take. The sweeper works from it. The recordings folder is
+re-listed only when the folder's own mtime shows files were added or
+removed behind the app's back; takes saved by the app are added directly.
+
+Eviction, oldest first: takes beyond ``keep_latest`` of their item are
+compressed (or deleted when compression is off). If the folder is still
+over the cap, further WAV takes are compressed, then FLAC takes are
+deleted. FLAC is lossless and roughly halves speech recordings.
+
+The sweeper thread runs a pass shortly after startup, after each saved take
+and every ``SWEEP_INTERVAL_S``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+import paths
+import recordings
+import settings
+
+
+SETTINGS_KEY = "retention"
+DEFAULT_POLICY = {"keep_latest": 0, "max_total_gb": 0.0, "compress": True}
+SWEEP_INTERVAL_S = 15 * 60
+STARTUP_DELAY_S = 30.0
+SAVE_DELAY_S = 5.0
+GRACE_S = 60.0  # files this recent may still be being written
+
+
+def policy() -> Dict:
+    stored = settings.get(SETTINGS_KEY) or {}
+    return {key: stored.get(key, default) for key, default in DEFAULT_POLICY.items()}
+
+
+def set_policy(**changes) -> Dict:
+    updated = dict(policy(), **changes)
+    settings.update(**{SETTINGS_KEY: updated})
+    return updated
+
+
+class RecordingIndex:
+    """Name -> {"item", "ts", "size", "pinned"} for the takes in the recordings folder."""
+
+    def __init__(self, registry: paths.DataPaths):
+        self.path = registry.recordings_index
+        self.directory = registry.speaking_audio_dir
+        self.entries: Dict[str, Dict] = {}
+        self._dir_mtime = None
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                stored = json.load(f)
+            self.entries = stored.get("entries", {})
+            self._dir_mtime = stored.get("dir_mtime_ns")
+        except (OSError, ValueError, AttributeError):
+            self.entries, self._dir_mtime = {}, None
+        self.refresh()
+
+    def refresh(self) -> bool:
+        """Re-list the folder if its mtime changed; returns True if the index changed."""
+        try:
+            mtime = os.stat(self.directory).st_mtime_ns
+        except FileNotFoundError:
+            changed = bool(self.entries)
+            self.entries = {}
+            return changed
+        if mtime == self._dir_mtime:
+            return False
+        present = {}
+        for entry in os.scandir(self.directory):
+            parsed = recordings.parse_take_name(entry.name)
+            if parsed is None or not entry.is_file():
+                continue
+            known = self.entries.get(entry.name)
+            if known is None:
+                known = {"item": parsed[0], "ts": parsed[1], "size": entry.stat().st_size, "pinned": False}
+            present[entry.name] = known
+        self.entries = present
+        self._dir_mtime = mtime
+        self.save()
+        return True
+
+    def save(self) -> None:
+        if not os.path.isdir(os.path.dirname(self.path)):
+            return
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"dir_mtime_ns": self._dir_mtime, "entries": self.entries}, f)
+        os.replace(tmp, self.path)
+
+    def _touch_dir(self) -> None:
+        try:
+            self._dir_mtime = os.stat(self.directory).st_mtime_ns
+        except FileNotFoundError:
+            self._dir_mtime = None
+
+    def add(self, path: str) -> None:
+        name = os.path.basename(path)
+        parsed = recordings.parse_take_name(name)
+        if parsed is None:
+            return
+        previous = self.entries.get(name, {})
+        self.entries[name] = {
+            "item": parsed[0],
+            "ts": parsed[1],
+            "size": os.path.getsize(path),
+            "pinned": previous.get("pinned", False),
+        }
+        self._touch_dir()
+        self.save()
+
+    def remove(self, name: str) -> None:
+        if self.entries.pop(name, None) is not None:
+            self._touch_dir()
+            self.save()
+
+    def set_pinned(self, name: str, pinned: bool) -> None:
+        if name in self.entries:
+            self.entries[name]["pinned"] = bool(pinned)
+            self.save()
+
+    def is_pinned(self, name: str) -> bool:
+        return bool(self.entries.get(name, {}).get("pinned"))
+
+    def total_bytes(self) -> int:
+        return sum(e["size"] for e in self.entries.values())
+
+    def by_item(self) -> Dict[int, List[str]]:
+        """Item id -> take names, newest first."""
+        items: Dict[int, List[str]] = {}
+        for name, e in self.entries.items():
+            items.setdefault(e["item"], []).append(name)
+        for names in items.values():
+            names.sort(key=lambda n: self.entries[n]["ts"], reverse=True)
+        return items
+
+
+# One index per data root. _lock guards it and is held only briefly;
+# _sweep_mutex lets one sweep run at a time (background pass or "Clean Up Now")
+_index: Optional[RecordingIndex] = None
+_lock = threading.RLock()
+_sweep_mutex = threading.Lock()
+
+
+def index() -> RecordingIndex:
+    global _index
+    with _lock:
+        if _index is None:
+            _index = RecordingIndex(paths.current())
+        return _index
+
+
+def take_saved(path: str) -> None:
+    """Record a take the app just wrote and schedule a sweep."""
+    with _lock:
+        index().add(path)
+    sweeper.wake(SAVE_DELAY_S)
+
+
+def set_pinned(path: str, pinned: bool) -> None:
+    with _lock:
+        idx = index()
+        idx.refresh()
+        idx.set_pinned(os.path.basename(path), pinned)
+
+
+def is_pinned(path: str) -> bool:
+    with _lock:
+        return index().is_pinned(os.path.basename(path))
+
+
+def usage() -> Dict:
+    with _lock:
+        idx = index()
+        idx.refresh()
+        return {
+            "takes": len(idx.entries),
+            "bytes": idx.total_bytes(),
+            "flac": sum(1 for n in idx.entries if n.lower().endswith(".flac")),
+            "pinned": sum(1 for e in idx.entries.values() if e["pinned"]),
+        }
+
+
+# ----- Sweeping -----
+
+
+class _Released(Exception):
+    """The profile changed during a sweep; its index is gone."""
+
+
+def sweep(now: Optional[float] = None) -> Dict:
+    """Apply the active profile's policy once; returns what was done.
+
+    Candidates are picked from a snapshot of the index. Encoding runs
+    without the lock, which is only taken to swap files and update the index,
+    so the Tk thread's pin and usage lookups never wait for a whole pass.
+    Concurrent calls run one after the other.
+    """
+    with _sweep_mutex:
+        return _sweep(now)
+
+
+def _sweep(now: Optional[float]) -> Dict:
+    now = time.time() if now is None else now
+    rules = policy()
+    report = {"compressed": 0, "deleted": 0, "freed_bytes": 0, "errors": []}
+    keep_latest = max(0, int(rules["keep_latest"] or 0))
+    cap = int(float(rules["max_total_gb"] or 0) * 1e9)
+    if not keep_latest and not cap:
+        return report
+    with _lock:
+        idx = index()
+        idx.refresh()
+        by_item = idx.by_item()
+        entries = {name: dict(e) for name, e in idx.entries.items()}
+
+    protected = set()
+    beyond_quota = []
+    for names in by_item.values():
+        protected.add(names[0])  # newest take of every item
+        for position, name in enumerate(names):
+            if entries[name]["pinned"] or _too_recent(entries[name], now):
+                protected.add(name)
+            elif keep_latest and position >= keep_latest:
+                beyond_quota.append(name)
+    oldest_first = sorted((n for n in entries if n not in protected), key=lambda n: entries[n]["ts"])
+
+    try:
+        for name in sorted(beyond_quota, key=lambda n: entries[n]["ts"]):
+            if not rules["compress"]:
+                _delete(idx, name, report)
+            elif name.lower().endswith(".wav"):
+                _compress(idx, name, report)
+
+        if cap:
+            # Compress WAV takes first (when allowed), then delete FLAC ones, oldest first
+            stages = ([".wav"] if rules["compress"] else []) + [".flac", ".wav"]
+            for stage, suffix in enumerate(stages):
+                for name in oldest_first:
+                    with _lock:
+                        if idx.total_bytes() <= cap:
+                            break
+                        current = _current_name(idx, name)
+                    if current is None or not current.lower().endswith(suffix):
+                        continue
+                    if stage == 0 and rules["compress"]:
+                        _compress(idx, current, report)
+                    else:
+                        _delete(idx, current, report)
+    except _Released:
+        pass
+    return report
+
+
+def _too_recent(entry: Dict, now: float) -> bool:
+    """Takes saved within ``GRACE_S`` may still be being written (judged by their name's timestamp)."""
+    try:
+        saved = time.mktime(time.strptime(entry["ts"], "%Y%m%d-%H%M%S"))
+    except ValueError:
+        return True
+    return now - saved < GRACE_S
+
+
+def _current_name(idx: RecordingIndex, name: str) -> Optional[str]:
+    """The take's name now (a WAV may have become FLAC during this sweep)."""
+    if name in idx.entries:
+        return name
+    flac = os.path.splitext(name)[0] + ".flac"
+    return flac if flac in idx.entries else None
+
+
+def _still_evictable(idx: RecordingIndex, name: str) -> bool:
+    """Checked under the lock: the profile is unchanged and the take was not pinned meanwhile."""
+    if _index is not idx:
+        raise _Released
+    entry = idx.entries.get(name)
+    return entry is not None and not entry["pinned"]
+
+
+def _compress(idx: RecordingIndex, name: str, report: Dict) -> None:
+    import soundfile as sf  # type: ignore
+
+    src = os.path.join(idx.directory, name)
+    dst = os.path.splitext(src)[0] + ".flac"
+    tmp = f"{dst}.{threading.get_ident()}.tmp"
+    try:
+        data, samplerate = sf.read(src, dtype="int16", always_2d=True)
+        sf.write(tmp, data, samplerate, format="FLAC", subtype="PCM_16")
+    except Exception as e:
+        report["errors"].append(f"{name}: {e}")
+        _discard(tmp)
+        return
+    with _lock:
+        try:
+            if not _still_evictable(idx, name):
+                _discard(tmp)
+                return
+        except _Released:
+            _discard(tmp)
+            raise
+        try:
+            os.replace(tmp, dst)
+            os.remove(src)
+        except OSError as e:  # e.g. the take is open for playback on Windows
+            report["errors"].append(f"{name}: {e}")
+            _discard(tmp)
+            if os.path.exists(src):
+                _discard(dst)
+            return
+        before = idx.entries.pop(name)["size"]
+        idx.add(dst)
+        report["compressed"] += 1
+        report["freed_bytes"] += before - idx.entries[os.path.basename(dst)]["size"]
+    _drop_derived(src)
+
+
+def _delete(idx: RecordingIndex, name: str, report: Dict) -> None:
+    path = os.path.join(idx.directory, name)
+    with _lock:
+        if not _still_evictable(idx, name):
+            return
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            report["errors"].append(f"{name}: {e}")
+            return
+        size = idx.entries[name]["size"]
+        idx.remove(name)
+    _drop_derived(path)
+    report["deleted"] += 1
+    report["freed_bytes"] += size
+
+
+def _discard(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _drop_derived(path: str) -> None:
+    """Remove the pitch-cache entry of a take that moved or went away."""
+    import pitch
+
+    try:
+        os.remove(pitch.cache_path(path))
+    except OSError:
+        pass
+
+
+class Sweeper:
+    """Background thread applying the retention policy of the active profile."""
+
+    def __init__(self):
+        self._wake = threading.Event()
+        self._due = 0.0
+        self._thread: Optional[threading.Thread] = None
+        self.last_report: Optional[Dict] = None
+
+    def start(self, delay: float = STARTUP_DELAY_S) -> None:
+        if self._thread is None:
+            self._due = time.monotonic() + delay
+            self._thread = threading.Thread(target=self._run, name="retention-sweeper", daemon=True)
+            self._thread.start()
+
+    def wake(self, delay: float = 0.0) -> None:
+        """Sweep after ``delay`` seconds (sooner than the periodic pass)."""
+        self._due = min(self._due, time.monotonic() + delay) if self._thread else time.monotonic() + delay
+        self._wake.set()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(max(0.0, self._due - time.monotonic()))
+            self._wake.clear()
+            if time.monotonic() < self._due:
+                continue
+            self._due = time.monotonic() + SWEEP_INTERVAL_S
+            try:
+                self.last_report = sweep()
+            except Exception as e:  # keep sweeping later; nothing here is fatal
+                self.last_report = {"errors": [str(e)]}
+
+
+sweeper = Sweeper()
+
+
+def _release() -> None:
+    global _index
+    with _lock:  # a running sweep notices (_Released) at its next index update
+        _index = None
+
+
+paths.on_release(_release)
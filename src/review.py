@@ -0,0 +1,199 @@
+"""Spaced-repetition scheduling for Reading and Listening items.
+
+Each practice result is graded 0-5 from the share of right answers and fed
+through the SM-2 algorithm, which yields the item's next review date. The
+schedule is derived from the item's attempt history (attempts.py) alone, so
+nothing extra is stored.
+
+Per section, a ``DueIndex`` keeps the items in a heap ordered by due date.
+"What is due today" walks only the top of the heap, where entries are due,
+instead of scanning every item. Saves and deletes update the index in place.
+The indexes are rebuilt lazily per profile and released when the data root
+changes.
+"""
+
+from __future__ import annotations
+
+import heapq
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import attempts
+import paths
+import storage
+
+
+REVIEW_SECTIONS = ("reading", "listening")
+# Typical number of questions per passage/lecture, used to grade right answers
+QUESTIONS_PER_ITEM = {"reading": 10, "listening": 6}
+
+INITIAL_EASE = 2.5
+MIN_EASE = 1.3
+PASSING_QUALITY = 3
+
+
+class ReviewState:
+    __slots__ = ("item_id", "ease", "interval", "repetitions", "last_day", "last_quality", "due")
+
+    def __init__(self, item_id: int):
+        self.item_id = item_id
+        self.ease = INITIAL_EASE
+        self.interval = 0
+        self.repetitions = 0
+        self.last_day: Optional[date] = None
+        self.last_quality: Optional[int] = None
+        self.due: Optional[date] = None
+
+    def review(self, day: date, quality: int) -> None:
+        """Apply one graded attempt (SM-2)."""
+        if quality >= PASSING_QUALITY:
+            if self.repetitions == 0:
+                self.interval = 1
+            elif self.repetitions == 1:
+                self.interval = 6
+            else:
+                self.interval = max(1, round(self.interval * self.ease))
+            self.repetitions += 1
+        else:
+            self.repetitions = 0
+            self.interval = 1
+        self.ease = max(MIN_EASE, self.ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+        self.last_day = day
+        self.last_quality = quality
+        self.due = day + timedelta(days=self.interval)
+
+
+def quality(section: str, right_answers: int) -> int:
+    """Grade a result 0-5 from the share of right answers."""
+    total = QUESTIONS_PER_ITEM.get(section, 10)
+    share = min(max(int(right_answers), 0), total) / total
+    return int(round(5 * share))
+
+
+def parse_day(value) -> Optional[date]:
+    try:
+        return date.fromisoformat(str(value).strip()[:10])
+    except ValueError:
+        return None
+
+
+def item_history(section: str, item: Dict) -> List[Tuple[date, int]]:
+    """Dated (day, right_answers) attempts for an item; undated ones are skipped."""
+    history = []
+    for day, right in attempts.item_history(section, item):
+        parsed = parse_day(day)
+        if parsed is not None:
+            history.append((parsed, right))
+    return history
+
+
+def schedule(section: str, item_id: int, history: Iterable[Tuple[date, int]]) -> Optional[ReviewState]:
+    """Replay a score history; None when the item has no usable result yet."""
+    state = ReviewState(item_id)
+    for day, right in sorted(history, key=lambda h: h[0]):
+        state.review(day, quality(section, right))
+    return state if state.due is not None else None
+
+
+class DueIndex:
+    """Min-heap of (due ordinal, item id) with lazy invalidation.
+
+    Updating an item pushes a new entry and marks the old one stale, so
+    updates cost O(log n). Stale entries are skipped on read and dropped when
+    they outnumber the live ones.
+    """
+
+    def __init__(self, section: str):
+        self.section = section
+        self._heap: List[Tuple[int, int]] = []
+        self._states: Dict[int, ReviewState] = {}
+
+    @classmethod
+    def build(cls, section: str, histories: Iterable[Tuple[int, Iterable[Tuple[date, int]]]]) -> "DueIndex":
+        index = cls(section)
+        for item_id, history in histories:
+            state = schedule(section, item_id, history)
+            if state is not None:
+                index._states[item_id] = state
+        index._heap = [(s.due.toordinal(), i) for i, s in index._states.items()]
+        heapq.heapify(index._heap)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def state(self, item_id: int) -> Optional[ReviewState]:
+        return self._states.get(item_id)
+
+    def update(self, item_id: int, history: Iterable[Tuple[date, int]]) -> None:
+        state = schedule(self.section, item_id, history)
+        if state is None:
+            self.remove(item_id)
+            return
+        self._states[item_id] = state
+        heapq.heappush(self._heap, (state.due.toordinal(), item_id))
+        self._compact()
+
+    def remove(self, item_id: int) -> None:
+        if self._states.pop(item_id, None) is not None:
+            self._compact()
+
+    def _live(self, entry: Tuple[int, int]) -> bool:
+        state = self._states.get(entry[1])
+        return state is not None and state.due.toordinal() == entry[0]
+
+    def _compact(self) -> None:
+        if len(self._heap) > 2 * len(self._states) + 16:
+            self._heap = [(s.due.toordinal(), i) for i, s in self._states.items()]
+            heapq.heapify(self._heap)
+
+    def next_due(self) -> Optional[ReviewState]:
+        """Earliest scheduled item, in O(1) amortized."""
+        while self._heap and not self._live(self._heap[0]):
+            heapq.heappop(self._heap)
+        return self._states[self._heap[0][1]] if self._heap else None
+
+    def due(self, today: Optional[date] = None) -> List[ReviewState]:
+        """Items due on or before ``today``, most overdue first.
+
+        Walks the heap as a tree and stops descending at the first entry due
+        later, so the cost is proportional to the number of due items.
+        """
+        limit = (today or date.today()).toordinal()
+        heap = self._heap
+        found: Dict[int, ReviewState] = {}
+        stack = [0] if heap else []
+        while stack:
+            i = stack.pop()
+            if heap[i][0] > limit:
+                continue
+            if self._live(heap[i]):
+                found[heap[i][1]] = self._states[heap[i][1]]
+            stack.extend(c for c in (2 * i + 1, 2 * i + 2) if c < len(heap))
+        return sorted(found.values(), key=lambda s: (s.due, s.item_id))
+
+
+_indexes: Dict[str, DueIndex] = {}
+
+
+def due_index(section: str) -> DueIndex:
+    """The active profile's index for ``section``, built on first use."""
+    index = _indexes.get(section)
+    if index is None:
+        index = _indexes[section] = DueIndex.build(
+            section, ((item["id"], item_history(section, item)) for item in storage.iter_items(section))
+        )
+    return index
+
+
+def item_saved(section: str, item: Dict) -> None:
+    if section in _indexes:
+        _indexes[section].update(item["id"], item_history(section, item))
+
+
+def item_deleted(section: str, item_id: int) -> None:
+    if section in _indexes:
+        _indexes[section].remove(item_id)
+
+
+paths.on_release(_indexes.clear)
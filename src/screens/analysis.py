@@ -0,0 +1,68 @@
+from typing import Dict, List, Tuple
+import tkinter as tk
+from tkinter import ttk
+
+from utils import center_window
+
+
+class EssayAnalysisPopup(tk.Toplevel):
+    """Read-only report for one ``essay_analysis.analyze`` result."""
+
+    def __init__(self, parent: tk.Widget, title: str, result: Dict):
+        super().__init__(parent)
+        self.title(title)
+        self.transient(parent.winfo_toplevel())
+        self.geometry("620x520")
+        self.minsize(420, 320)
+
+        body = ttk.Frame(self, padding=8)
+        body.pack(fill="both", expand=True)
+        body.grid_columnconfigure(0, weight=1)
+        body.grid_rowconfigure(0, weight=1)
+
+        txt = tk.Text(body, wrap="word")
+        txt.insert("1.0", self._report(result))
+        txt.configure(state="disabled")
+        txt.grid(row=0, column=0, sticky="nsew")
+        yscroll = ttk.Scrollbar(body, orient="vertical", command=txt.yview)
+        yscroll.grid(row=0, column=1, sticky="ns")
+        txt.configure(yscrollcommand=yscroll.set)
+
+        ttk.Button(self, text="Close", command=self.destroy).pack(pady=8)
+        self.after(0, lambda: center_window(self, 620, 520))
+
+    def _report(self, r: Dict) -> str:
+        if not r["words"]:
+            return "The essay is empty."
+        spread = r["sentence_lengths"]
+        lines = [
+            f"Words: {r['words']}   Distinct words: {r['unique_words']}   Sentences: {r['sentences']}",
+            "",
+            "Sentence length (words)",
+            f"  mean {spread['mean']:.1f}, spread ±{spread['stdev']:.1f}, shortest {spread['min']}, longest {spread['max']}",
+            f"  {spread['short']} very short (<8 words), {spread['long']} very long (>35 words)",
+            "",
+            "Vocabulary coverage (share of running words)",
+        ]
+        lines.extend(f"  {label:<12} {share * 100:5.1f}%" for label, share in r["coverage"])
+        if r["beyond_list"]:
+            lines.append("  Less common words used: " + ", ".join(r["beyond_list"]))
+
+        transitions = r["transitions"]
+        lines += ["", "Transitions"]
+        if transitions["counts"]:
+            lines.append("  " + ", ".join(f"{t} ({n})" for t, n in transitions["counts"]))
+        else:
+            lines.append("  None found. Signpost your points with transitions such as \"For example\" or \"In contrast\".")
+        if transitions["overused"]:
+            lines.append("  Overused: " + ", ".join(t for t, _ in transitions["overused"]) + ". Try varying them.")
+
+        lines += ["", "Repeated words"] + _pairs(r["repeated_words"])
+        lines += ["", "Repeated phrases"] + _pairs(r["repeated_phrases"])
+        return "\n".join(lines)
+
+
+def _pairs(rows: List[Tuple[str, int]]) -> List[str]:
+    if not rows:
+        return ["  None"]
+    return [f"  {n:>3}x  {text}" for text, n in rows]
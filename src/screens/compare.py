@@ -0,0 +1,133 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+import datetime as dt
+import tkinter as tk
+from tkinter import ttk
+
+from utils import center_window
+
+
+POLL_MS = 50
+
+_compare_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="take-compare")
+
+
+class TakeComparePopup(tk.Toplevel):
+    """Aligns two saved takes of one item and reports pace and pause differences."""
+
+    def __init__(self, parent: tk.Widget, item_id: int, takes: List[Tuple[str, str]], selected: str):
+        super().__init__(parent)
+        self.title(f"Compare Takes (ID {item_id})")
+        self.transient(parent.winfo_toplevel())
+        self.geometry("640x480")
+        self.minsize(480, 320)
+        self._takes = takes  # [(timestamp, path)], newest first
+        self._pending: Optional[Future] = None
+
+        labels = [_stamp(ts) for ts, _ in takes]
+        paths = [path for _, path in takes]
+        first = paths.index(selected) if selected in paths else 0
+        second = first + 1 if first + 1 < len(takes) else max(0, first - 1)
+
+        bar = ttk.Frame(self, padding=8)
+        bar.pack(fill="x")
+        ttk.Label(bar, text="Take A:").pack(side="left")
+        self.a_cb = ttk.Combobox(bar, values=labels, state="readonly", width=20)
+        self.a_cb.current(first)
+        self.a_cb.pack(side="left", padx=(4, 12))
+        ttk.Label(bar, text="Take B:").pack(side="left")
+        self.b_cb = ttk.Combobox(bar, values=labels, state="readonly", width=20)
+        self.b_cb.current(second)
+        self.b_cb.pack(side="left", padx=4)
+        self.compare_btn = ttk.Button(bar, text="Compare", command=self._run)
+        self.compare_btn.pack(side="right")
+
+        body = ttk.Frame(self, padding=(8, 0))
+        body.pack(fill="both", expand=True)
+        body.grid_columnconfigure(0, weight=1)
+        body.grid_rowconfigure(0, weight=1)
+        self.txt = tk.Text(body, wrap="word")
+        self.txt.grid(row=0, column=0, sticky="nsew")
+        yscroll = ttk.Scrollbar(body, orient="vertical", command=self.txt.yview)
+        yscroll.grid(row=0, column=1, sticky="ns")
+        self.txt.configure(yscrollcommand=yscroll.set)
+
+        ttk.Button(self, text="Close", command=self.destroy).pack(pady=8)
+        self.after(0, lambda: center_window(self, 640, 480))
+        self._run()
+
+    def _set_text(self, text: str):
+        self.txt.configure(state="normal")
+        self.txt.delete("1.0", "end")
+        self.txt.insert("1.0", text)
+        self.txt.configure(state="disabled")
+
+    def _run(self):
+        a, b = self.a_cb.current(), self.b_cb.current()
+        if a == b:
+            self._set_text("Pick two different takes.")
+            return
+        import take_compare
+
+        self.compare_btn.configure(state="disabled")
+        self._set_text("Aligning takes...")
+        names = (self.a_cb.get(), self.b_cb.get())
+        self._pending = _compare_worker.submit(take_compare.compare, self._takes[a][1], self._takes[b][1])
+        self.after(POLL_MS, self._check, self._pending, names)
+
+    def _check(self, future: Future, names: Tuple[str, str]):
+        if not future.done():
+            self.after(POLL_MS, self._check, future, names)
+            return
+        if future is not self._pending:
+            return
+        self.compare_btn.configure(state="normal")
+        error = future.exception()
+        if error is not None:
+            self._set_text(f"Could not compare the takes:\n{error}")
+            return
+        self._set_text(_report(future.result(), *names))
+
+
+def _stamp(ts: str) -> str:
+    return dt.datetime.strptime(ts, "%Y%m%d-%H%M%S").strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _clock(seconds: float) -> str:
+    return f"{int(seconds) // 60}:{int(seconds) % 60:02d}"
+
+
+def _report(r: Dict, name_a: str, name_b: str) -> str:
+    lines = []
+    for label, name, s in (("A", name_a, r["a"]), ("B", name_b, r["b"])):
+        lines.append(
+            f"Take {label} ({name}): {s['duration_s']:.1f} s, speech {s['speech_s']:.1f} s, "
+            f"{s['pauses']} pauses ({s['pause_s']:.1f} s)"
+        )
+    if r["distance"] is None:
+        lines += ["", "One of the takes is too short to compare."]
+        return "\n".join(lines)
+    lines.append(f"Alignment distance: {r['distance']:.2f} (lower means a more similar delivery)")
+
+    lines += ["", "Pace (B compared with A)"]
+    if not r["pace"]:
+        lines.append("  About the same pace throughout.")
+    for seg in r["pace"]:
+        change = abs(seg["ratio"] - 1.0) * 100
+        lines.append(
+            f"  {_clock(seg['a_start'])}-{_clock(seg['a_end'])} in A: B is {change:.0f}% {seg['kind']} "
+            f"({_clock(seg['b_start'])}-{_clock(seg['b_end'])} in B)"
+        )
+
+    lines += ["", "Pauses"]
+    if not r["pauses"]:
+        lines.append("  Pauses in the same places with similar lengths.")
+    for p in r["pauses"]:
+        where = f"  {_clock(p['a_time'])} in A / {_clock(p['b_time'])} in B: "
+        if p["kind"] == "only_a":
+            lines.append(where + f"{p['a_len']:.1f} s pause in A, none in B")
+        elif p["kind"] == "only_b":
+            lines.append(where + f"new {p['b_len']:.1f} s pause in B")
+        else:
+            lines.append(where + f"pause {p['kind']} in B ({p['a_len']:.1f} s -> {p['b_len']:.1f} s)")
+    return "\n".join(lines)
@@ -0,0 +1,71 @@
+from datetime import date
+from typing import Callable, Dict, List
+import tkinter as tk
+from tkinter import ttk
+
+import review
+from utils import center_window
+
+
+class DueItemsPopup(tk.Toplevel):
+    """Items whose spaced-repetition review is due; double-click jumps to the row."""
+
+    def __init__(self, parent: tk.Widget, section: str, items: List[Dict], on_open: Callable[[int], None]):
+        super().__init__(parent)
+        self.title(f"{section.title()} - Due for Review")
+        self.transient(parent.winfo_toplevel())
+        self.geometry("620x400")
+        self.minsize(420, 280)
+        self.on_open = on_open
+
+        today = date.today()
+        due = review.due_index(section).due(today)
+        links = {it["id"]: it.get("url", "") for it in items}
+
+        body = ttk.Frame(self, padding=8)
+        body.pack(fill="both", expand=True)
+        body.grid_columnconfigure(0, weight=1)
+        body.grid_rowconfigure(0, weight=1)
+
+        self.tree = ttk.Treeview(body, columns=("id", "due", "last", "interval", "url"), show="headings", height=10)
+        for key, title, width in (
+            ("id", "Link Number", 90),
+            ("due", "Due", 120),
+            ("last", "Last Grade", 80),
+            ("interval", "Interval", 70),
+            ("url", "Questions Link", 240),
+        ):
+            self.tree.heading(key, text=title, anchor="w")
+            self.tree.column(key, width=width, anchor="w", stretch=key == "url")
+        for state in due:
+            overdue = (today - state.due).days
+            when = "today" if overdue == 0 else f"{overdue} day{'s' if overdue != 1 else ''} ago"
+            self.tree.insert(
+                "",
+                "end",
+                iid=str(state.item_id),
+                values=(state.item_id, when, f"{state.last_quality}/5", f"{state.interval} d", links.get(state.item_id, "")),
+            )
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        yscroll = ttk.Scrollbar(body, orient="vertical", command=self.tree.yview)
+        yscroll.grid(row=0, column=1, sticky="ns")
+        self.tree.configure(yscrollcommand=yscroll.set)
+        self.tree.bind("<Double-1>", self._on_open)
+        self.tree.bind("<Return>", self._on_open)
+
+        if due:
+            summary = f"{len(due)} item{'s' if len(due) != 1 else ''} due. Double-click one to select it in the table."
+        else:
+            upcoming = review.due_index(section).next_due()
+            summary = "Nothing is due today."
+            if upcoming is not None:
+                summary += f" Next review: item {upcoming.item_id} on {upcoming.due.isoformat()}."
+        ttk.Label(body, text=summary).grid(row=1, column=0, columnspan=2, sticky="w", pady=(8, 0))
+        ttk.Button(self, text="Close", command=self.destroy).pack(pady=8)
+
+        self.after(0, lambda: center_window(self, 620, 400))
+
+    def _on_open(self, event=None):
+        selected = self.tree.selection()
+        if selected:
+            self.on_open(int(selected[0]))
@@ -0,0 +1,88 @@
+from typing import Dict
+import tkinter as tk
+from tkinter import ttk
+
+import numpy as np
+
+from utils import center_window
+
+
+PLOT_RANGE_ST = 12  # semitones above/below the median shown on the plot
+MAX_POINTS = 2000
+
+
+class IntonationPopup(tk.Toplevel):
+    """Pitch contour and summary of one ``pitch.analyze`` result."""
+
+    def __init__(self, parent: tk.Widget, title: str, result: Dict):
+        super().__init__(parent)
+        self.title(title)
+        self.transient(parent.winfo_toplevel())
+        self.geometry("680x460")
+        self.minsize(480, 340)
+        self._result = result
+
+        ttk.Label(self, text=self._summary(result["stats"]), justify="left", padding=8, wraplength=640).pack(
+            fill="x"
+        )
+        self.canvas = tk.Canvas(self, background="white", highlightthickness=0)
+        self.canvas.pack(fill="both", expand=True, padx=8)
+        self.canvas.bind("<Configure>", lambda e: self._draw())
+        ttk.Label(
+            self,
+            text=f"Pitch in semitones around your median voice (±{PLOT_RANGE_ST}) over time; gaps are pauses or unvoiced sounds.",
+            foreground="#555",
+            padding=(8, 4),
+        ).pack(fill="x")
+
+        ttk.Button(self, text="Close", command=self.destroy).pack(pady=8)
+        self.after(0, lambda: center_window(self, 680, 460))
+
+    def _summary(self, s: Dict) -> str:
+        if s["median_hz"] is None:
+            return "Too little voiced speech in this take to measure intonation."
+        if s["monotony"] >= 0.6:
+            advice = "Your pitch stays quite flat. Stress key words and let your voice rise and fall between ideas."
+        elif s["monotony"] >= 0.3:
+            advice = "Moderate pitch variation. Stressing the key word of each point will make it livelier."
+        else:
+            advice = "Lively intonation with clear pitch movement."
+        return "\n".join(
+            [
+                f"Median pitch: {s['median_hz']:.0f} Hz   Range: {s['range_st']:.1f} semitones   "
+                f"Spread: {s['spread_st']:.1f} st   Monotony: {s['monotony']:.2f} (0 lively - 1 flat)",
+                f"Voiced: {s['voiced_ratio'] * 100:.0f}% of the take",
+                advice,
+            ]
+        )
+
+    def _draw(self):
+        c = self.canvas
+        c.delete("all")
+        width, height = c.winfo_width(), c.winfo_height()
+        f0 = self._result["f0"]
+        median = self._result["stats"]["median_hz"]
+        if width < 10 or height < 10 or median is None or not len(f0):
+            return
+        mid = height / 2
+        scale = (height / 2 - 6) / PLOT_RANGE_ST
+        c.create_line(0, mid, width, mid, fill="#ccc", dash=(3, 3))
+        duration = len(f0) * self._result["hop_s"]
+        for seconds in range(10, int(duration), 10):
+            x = seconds / duration * width
+            c.create_line(x, 0, x, height, fill="#eee")
+            c.create_text(x + 2, height - 2, text=f"{seconds}s", anchor="sw", fill="#999")
+
+        step = max(1, len(f0) // MAX_POINTS)
+        values = f0[::step]
+        semitones = np.clip(12.0 * np.log2(values / median), -PLOT_RANGE_ST, PLOT_RANGE_ST)
+        xs = np.arange(len(values)) * (width / len(values))
+        ys = mid - semitones * scale
+        # One polyline per voiced run
+        voiced = np.isfinite(values)
+        edges = np.flatnonzero(np.diff(np.concatenate([[0], voiced.astype(np.int8), [0]])))
+        for start, end in zip(edges[::2], edges[1::2]):
+            if end - start < 2:
+                continue
+            coords = np.column_stack([xs[start:end], ys[start:end]]).ravel().tolist()
+            c.create_line(*coords, fill="#1565c0", width=2)
@@ -3,68 +3,26 @@ from typing import List, Dict
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+import attempts
+import instrument
+import review
 import storage
+from screens.due import DueItemsPopup
+from screens.stats import PracticeStatsPopup
+from timing_log import timing_log
 from ui.timer import TimerWidget
-from ui.scrollable import ScrollableFrame
-
-
-class ListeningRow(ttk.Frame):
-    def __init__(self, parent: tk.Widget, item: Dict, on_save, on_delete):
-        super().__init__(parent)
-        self.item = item
-        self.on_save = on_save
-        self.on_delete = on_delete
-
-        # Columns: Link Number | Questions Link | Right Answers | Day | Save | Delete
-        self.lbl_id = ttk.Label(self, text=str(item["id"]))
-        self.ent_url = ttk.Entry(self, width=48)
-        self.ent_url.insert(0, item.get("url", ""))
-        self.ent_right = ttk.Spinbox(self, from_=0, to=999, width=6)
-        self.ent_right.set(str(item.get("right_answers", 0)))
-        self.ent_day = ttk.Entry(self, width=12)
-        self.ent_day.insert(0, item.get("day", ""))
-        self.btn_save = ttk.Button(self, text="Save", command=self._save)
-        self.btn_delete = ttk.Button(self, text="Delete", command=self._delete)
-
-        self.lbl_id.grid(row=0, column=0, padx=6, pady=6, sticky="w")
-        self.ent_url.grid(row=0, column=1, padx=6, pady=6, sticky="ew")
-        self.ent_right.grid(row=0, column=2, padx=6, pady=6)
-        self.ent_day.grid(row=0, column=3, padx=6, pady=6)
-        self.btn_save.grid(row=0, column=4, padx=6, pady=6)
-        self.btn_delete.grid(row=0, column=5, padx=6, pady=6)
-
-        self.grid_columnconfigure(1, weight=1)
-
-    def _save(self):
-        url = self.ent_url.get().strip()
-        day_str = self.ent_day.get().strip()
-        try:
-            right = int(self.ent_right.get())
-            if right < 0:
-                raise ValueError
-        except Exception:
-            messagebox.showerror("Invalid value", "Right Answers must be a non-negative integer.")
-            return
-
-        if not day_str:
-            messagebox.showerror("Missing value", "Day cannot be empty. Use YYYY-MM-DD.")
-            return
+from ui.grid import EditableGrid, GridColumn
+from ui.links import open_link, prefetch_due
 
-        if not url:
-            messagebox.showerror("Missing value", "Questions Link cannot be empty.")
-            return
-
-        updated = {
-            "id": self.item["id"],
-            "url": url,
-            "right_answers": right,
-            "day": day_str,
-        }
-        self.on_save(updated)
 
-    def _delete(self):
-        if messagebox.askyesno("Delete", f"Delete item {self.item['id']}?"):
-            self.on_delete(self.item["id"]) 
+COLUMNS = [
+    GridColumn("id", "Link Number", width=100),
+    GridColumn("url", "Questions Link", width=380, editor="entry", stretch=True),
+    GridColumn("right_answers", "Right Answers", width=110, editor="spinbox"),
+    GridColumn("best", "Best", width=60),
+    GridColumn("attempts", "Attempts", width=80),
+    GridColumn("day", "Day", width=110, editor="entry"),
+]
 
 
 class ListeningScreen(ttk.Frame):
@@ -84,16 +42,22 @@ class ListeningScreen(ttk.Frame):
 
         left_actions = ttk.Frame(top)
         left_actions.grid(row=0, column=0, sticky="w")
-        back_btn = ttk.Button(left_actions, text="← Back", command=self.on_back)
+        back_btn = ttk.Button(left_actions, text="← Back", command=self._go_back)
         back_btn.grid(row=0, column=0, sticky="w", padx=(0, 6))
         tips_btn = ttk.Button(left_actions, text="Listening Tips", command=self._show_tips)
         tips_btn.grid(row=0, column=1, sticky="w")
+        stats_btn = ttk.Button(left_actions, text="Stats", command=self._show_stats)
+        stats_btn.grid(row=0, column=2, sticky="w", padx=(6, 0))
+        self.due_btn = ttk.Button(left_actions, text="Due", command=self._show_due)
+        self.due_btn.grid(row=0, column=3, sticky="w", padx=(6, 0))
 
         title = ttk.Label(top, text="Listening", font=("Segoe UI", 16, "bold"))
         title.grid(row=0, column=1)
 
-        timer = TimerWidget(top)
-        timer.grid(row=0, column=2, sticky="e")
+        # Timed segments are logged against the item selected in the table
+        self.timer = TimerWidget(top, on_segment=self._on_timer_segment)
+        self.timer.grid(row=0, column=2, sticky="e")
+        self._timed_item = None
 
         # Table header + rows inside a centered block
         center = ttk.Frame(self)
@@ -106,18 +70,19 @@ class ListeningScreen(ttk.Frame):
         table_block.grid(row=1, column=1, sticky="nsew")
         table_block.grid_columnconfigure(0, weight=1)
 
-        header = ttk.Frame(table_block)
-        header.grid(row=0, column=0, sticky="ew")
-        labels = ["Link Number", "Questions Link", "Right Answers", "Day", "Save", "Delete"]
-        widths = [12, 48, 12, 12, 8, 8]
-        for i, (txt, w) in enumerate(zip(labels, widths)):
-            lbl = ttk.Label(header, text=txt, font=("Segoe UI", 10, "bold"))
-            lbl.grid(row=0, column=i, padx=6, pady=(0, 6), sticky="w")
-            header.grid_columnconfigure(i, weight=1 if i == 1 else 0)
-
-        self.scroll = ScrollableFrame(table_block)
-        self.scroll.grid(row=1, column=0, sticky="nsew")
-        table_block.grid_rowconfigure(1, weight=1)
+        # Single Treeview grid; Ctrl+O opens the link, Ctrl+S saves and Delete removes the selected row
+        self.table = EditableGrid(
+            table_block,
+            COLUMNS,
+            actions=[
+                ("Open", self._open_row, "<Control-o>"),
+                ("Save", self._save_row, "<Control-s>"),
+                ("Delete", self._delete_row, "<Delete>"),
+            ],
+        )
+        self.table.grid(row=0, column=0, sticky="nsew")
+        self.table.tree.bind("<<TreeviewSelect>>", self._on_select, add="+")
+        table_block.grid_rowconfigure(0, weight=1)
 
         # Bottom controls
         bottom = ttk.Frame(self)
@@ -128,6 +93,37 @@ class ListeningScreen(ttk.Frame):
         # Load existing
         self._load_items()
 
+    def _go_back(self):
+        # Close the running segment so it is not lost, then persist the log
+        self.timer.pause()
+        timing_log.flush()
+        self.on_back()
+
+    # Practice timing
+    def _on_timer_segment(self, start: float, seconds: float):
+        timing_log.record("listening", self._timed_item, start, seconds)
+        self._timed_item = self.table.selected_id()
+
+    def _on_select(self, event=None):
+        selected = self.table.selected_id()
+        if selected == self._timed_item:
+            return
+        if self.timer.running:
+            self.timer.split()  # attributes the time so far to the previous item
+        self._timed_item = selected
+
+    def _show_stats(self):
+        PracticeStatsPopup(self, "listening", self.items)
+
+    # Spaced repetition
+    def _show_due(self):
+        DueItemsPopup(self, "listening", self.items, on_open=self.table.select)
+
+    def _refresh_due(self):
+        due = review.due_index("listening").due()
+        self.due_btn.configure(text=f"Due ({len(due)})" if due else "Due")
+        prefetch_due((state.item_id for state in due), self.items)
+
     # Data handling
     def _load_items(self):
         try:
@@ -136,33 +132,63 @@ class ListeningScreen(ttk.Frame):
             messagebox.showwarning("Load failed", f"Could not load items: {e}")
             self.items = []
         self._render_rows()
+        self._refresh_due()
 
+    @instrument.timed
     def _render_rows(self):
-        # Clear existing rows
-        for child in list(self.scroll.inner.winfo_children()):
-            child.destroy()
-        for idx, item in enumerate(self.items):
-            row = ListeningRow(self.scroll.inner, item=item, on_save=self._save_item, on_delete=self._delete_item)
-            row.grid(row=idx, column=0, sticky="ew")
-            self.scroll.inner.grid_columnconfigure(0, weight=1)
-
-    def _save_all(self):
+        self.table.set_rows([self._row(it) for it in self.items])
+
+    def _row(self, item: Dict) -> Dict:
+        # Best score and attempt count come from the maintained attempts summary
+        summary = attempts.item_summary("listening", item)
+        return dict(item, best=summary["best"], attempts=summary["attempts"])
+
+    def _open_row(self, item_id: int):
+        open_link(self, self.table.row_values(item_id)["url"])
+
+    def _save_row(self, item_id: int):
+        values = self.table.row_values(item_id)
+        try:
+            updated = storage.validate_scored_item(
+                item_id, values["url"], values["right_answers"], values["day"]
+            )
+        except storage.ItemValidationError as e:
+            messagebox.showerror(e.title, str(e))
+            return
+        self._save_item(updated)
+
+    def _delete_row(self, item_id: int):
+        if messagebox.askyesno("Delete", f"Delete item {item_id}?"):
+            self._delete_item(item_id)
+
+    def _save_all(self) -> bool:
         try:
             storage.save_listening_items(self.items)
         except Exception as e:
             messagebox.showerror("Save failed", f"Could not save items: {e}")
+            return False
+        return True
 
     def _save_item(self, updated: Dict):
         # Update in-memory list
-        found = False
+        previous = None
         for i, it in enumerate(self.items):
             if it["id"] == updated["id"]:
+                previous = it
                 self.items[i] = updated
-                found = True
                 break
-        if not found:
+        else:
             self.items.append(updated)
-        self._save_all()
+        if not self._save_all():
+            return
+        # The attempt is logged only once the item itself is stored
+        try:
+            attempts.record_result("listening", previous, updated)
+        except OSError as e:
+            messagebox.showerror("Save failed", f"Item {updated['id']} was saved but the attempt could not be logged: {e}")
+        review.item_saved("listening", updated)
+        self._refresh_due()
+        self.table.update_row(self._row(updated))
         messagebox.showinfo("Saved", f"Item {updated['id']} saved.")
 
     def _delete_item(self, item_id: int):
@@ -173,7 +199,10 @@ class ListeningScreen(ttk.Frame):
         except Exception as e:
             messagebox.showerror("Delete failed", f"Could not delete item: {e}")
             return
-        self._render_rows()
+        attempts.forget_item("listening", item_id)
+        review.item_deleted("listening", item_id)
+        self._refresh_due()
+        self.table.delete_row(item_id)
 
     def add_item(self):
         new_id = storage.next_id(self.items)
@@ -184,7 +213,9 @@ class ListeningScreen(ttk.Frame):
             "day": date.today().isoformat(),
         }
         self.items.append(new_item)
-        self._render_rows()
+        self.table.insert_row(self._row(new_item))
+        self.table.select(new_id)
+        self.table.edit_cell(new_id, "url")
 
     def _show_tips(self):
         tips_text = (
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import threading
+import time
+import tkinter as tk
+from tkinter import ttk, messagebox
+from typing import Callable, Dict, List, Optional
+
+import mock_sessions
+from ui.timer import timer_service
+
+
+# Give the current section time to paint before warming the next one
+PRELOAD_DELAY_MS = 1500
+PRELOAD_POLL_MS = 100
+
+
+class MockTestScreen(ttk.Frame):
+    """Runs Reading, Listening, Speaking and Writing back to back under the official limits.
+
+    While one section is running, the next one's data and dependencies are
+    warmed in a background thread and its screen is built (hidden) at idle
+    time, so moving on is just a re-grid.
+    """
+
+    def __init__(self, parent: tk.Widget, on_back, sections: Dict[str, Callable]):
+        super().__init__(parent)
+        self.on_back = on_back
+        self.sections = sections
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
+
+        # Header: Back/End, section title, remaining time, Next Section
+        header = ttk.Frame(self)
+        header.grid(row=0, column=0, sticky="ew", pady=(0, 8))
+        header.grid_columnconfigure(1, weight=1)
+        self.end_btn = ttk.Button(header, text="← Back", command=self._on_end)
+        self.end_btn.grid(row=0, column=0, sticky="w")
+        self.title_var = tk.StringVar(value="Mock Test")
+        ttk.Label(header, textvariable=self.title_var, font=("Segoe UI", 16, "bold")).grid(row=0, column=1)
+        self.remaining_var = tk.StringVar(value="")
+        ttk.Label(header, textvariable=self.remaining_var, font=("Segoe UI", 14)).grid(row=0, column=2, sticky="e", padx=8)
+        self.next_btn = ttk.Button(header, text="Next Section", command=lambda: self._finish_section("next"))
+        self.next_btn.grid(row=0, column=3, sticky="e")
+        self.next_btn.grid_remove()
+
+        self.body = ttk.Frame(self)
+        self.body.grid(row=1, column=0, sticky="nsew")
+        self.body.grid_columnconfigure(0, weight=1)
+        self.body.grid_rowconfigure(0, weight=1)
+
+        self.intro = self._build_intro(self.body)
+        self.intro.grid(row=0, column=0, sticky="nsew")
+
+        # Session state
+        self._index = -1
+        self._screen: Optional[tk.Widget] = None
+        self._probe: Optional[mock_sessions.SectionProbe] = None
+        self._results: List[Dict] = []
+        self._started = 0.0
+        self._prebuilt: Dict[str, tk.Widget] = {}
+        self._warming: Dict[str, threading.Thread] = {}
+        self._preload_job: Optional[str] = None
+        self._shown_remaining = ""
+
+    def _build_intro(self, parent: tk.Widget) -> ttk.Frame:
+        frame = ttk.Frame(parent, padding=24)
+        frame.grid_columnconfigure(0, weight=1)
+        lines = ["The four sections run in order with the official time limits:", ""]
+        for i, section in enumerate(mock_sessions.SECTION_ORDER, start=1):
+            lines.append(f"  {i}. {section.title():<10} {mock_sessions.SECTION_MINUTES[section]} minutes")
+        lines += [
+            "",
+            "Use Next Section to move on early; each section ends automatically when its time is up.",
+            "Your results are saved as one session when the test ends.",
+        ]
+        ttk.Label(frame, text="\n".join(lines), justify="left", font=("Segoe UI", 11)).grid(row=0, column=0, sticky="n")
+        self.last_var = tk.StringVar(value=self._last_session_text())
+        ttk.Label(frame, textvariable=self.last_var, justify="left", foreground="#555").grid(row=1, column=0, pady=12)
+        ttk.Button(frame, text="Start Mock Test", command=self._start).grid(row=2, column=0, ipadx=16, ipady=8)
+        return frame
+
+    # ---------- Sequencing ----------
+
+    def _start(self):
+        self.intro.grid_remove()
+        self._results = []
+        self._started = time.time()
+        self.end_btn.configure(text="End Test")
+        self.next_btn.grid()
+        timer_service(self).add(self._on_tick)
+        self._enter(0)
+
+    def _enter(self, index: int):
+        if self._preload_job is not None:
+            self.after_cancel(self._preload_job)
+            self._preload_job = None
+        self._index = index
+        section = mock_sessions.SECTION_ORDER[index]
+        screen = self._prebuilt.pop(section, None) or self._build_screen(section)
+        screen.grid(row=0, column=0, sticky="nsew")
+        self._screen = screen
+        self._probe = mock_sessions.SectionProbe(section)
+        timer = getattr(screen, "timer", None)
+        if timer is not None:
+            timer.start()  # practice time is logged as usual
+        self.title_var.set(f"Mock Test - {index + 1}/{len(mock_sessions.SECTION_ORDER)} {section.title()}")
+        last = index == len(mock_sessions.SECTION_ORDER) - 1
+        self.next_btn.configure(text="Finish Test" if last else "Next Section")
+        self._on_tick(time.monotonic())
+        if not last:
+            self._preload_job = self.after(PRELOAD_DELAY_MS, self._preload, mock_sessions.SECTION_ORDER[index + 1])
+
+    def _build_screen(self, section: str) -> tk.Widget:
+        return self.sections[section](self.body, on_back=self._on_end)
+
+    def _on_tick(self, now: float):
+        if self._probe is None:
+            return
+        remaining = mock_sessions.limit_seconds(self._probe.section) - self._probe.elapsed()
+        if remaining <= 0:
+            self._finish_section("time")
+            return
+        text = f"{int(remaining) // 60:02d}:{int(remaining) % 60:02d} left"
+        if text != self._shown_remaining:
+            self._shown_remaining = text
+            self.remaining_var.set(text)
+
+    def _finish_section(self, ended_by: str):
+        if self._probe is None:
+            return
+        probe, self._probe = self._probe, None
+        self._close_screen()
+        self._results.append(
+            {
+                "section": probe.section,
+                "limit_s": mock_sessions.limit_seconds(probe.section),
+                "used_s": round(min(probe.elapsed(), mock_sessions.limit_seconds(probe.section)), 1),
+                "ended_by": ended_by,
+                "activity": probe.activity(),
+            }
+        )
+        if ended_by != "end" and self._index + 1 < len(mock_sessions.SECTION_ORDER):
+            self._enter(self._index + 1)
+        else:
+            self._end(completed=ended_by != "end")
+
+    def _close_screen(self):
+        if self._screen is None:
+            return
+        timer = getattr(self._screen, "timer", None)
+        if timer is not None:
+            timer.pause()
+        self._screen.destroy()  # flushes drafts and closes the section's resources
+        self._screen = None
+
+    def _on_end(self):
+        if self._probe is None:
+            self.on_back()
+            return
+        if messagebox.askyesno("End Mock Test", "End the mock test now? Completed sections are saved."):
+            self._finish_section("end")
+            return
+        timer = getattr(self._screen, "timer", None)
+        if timer is not None:
+            timer.start()  # the section's own Back button paused it
+
+    def _end(self, completed: bool):
+        timer_service(self).remove(self._on_tick)
+        if self._preload_job is not None:
+            self.after_cancel(self._preload_job)
+            self._preload_job = None
+        for screen in self._prebuilt.values():
+            screen.destroy()
+        self._prebuilt.clear()
+        try:
+            mock_sessions.save_session(self._started, self._results, completed)
+        except OSError as e:
+            messagebox.showerror("Save failed", f"Could not save the mock test session: {e}")
+        self._index = -1
+        self.title_var.set("Mock Test")
+        self.remaining_var.set("")
+        self._shown_remaining = ""
+        self.end_btn.configure(text="← Back")
+        self.next_btn.grid_remove()
+        self.last_var.set(self._last_session_text())
+        self.intro.grid()
+
+    # ---------- Preloading ----------
+
+    def _preload(self, section: str):
+        """Warm the next section's data off the Tk thread, then build its screen at idle."""
+        self._preload_job = None
+        if section in self._prebuilt or section in self._warming:
+            return
+        thread = threading.Thread(target=mock_sessions.warm, args=(section,), name=f"mock-warm-{section}", daemon=True)
+        self._warming[section] = thread
+        thread.start()
+        self._preload_job = self.after(PRELOAD_POLL_MS, self._finish_preload, section)
+
+    def _finish_preload(self, section: str):
+        self._preload_job = None
+        thread = self._warming.get(section)
+        if thread is not None and thread.is_alive():
+            self._preload_job = self.after(PRELOAD_POLL_MS, self._finish_preload, section)
+            return
+        self._warming.pop(section, None)
+        order = mock_sessions.SECTION_ORDER
+        if self._probe is None or section in self._prebuilt or order[self._index + 1 : self._index + 2] != (section,):
+            return  # the test ended or moved past this section meanwhile
+        # Built but not gridded: the next section appears without a construction stall
+        self._prebuilt[section] = self._build_screen(section)
+
+    # ---------- Summary ----------
+
+    def _last_session_text(self) -> str:
+        last = None
+        for last in mock_sessions.iter_sessions():
+            pass
+        if last is None:
+            return "No mock tests taken yet."
+        parts = []
+        for result in last.get("sections", []):
+            minutes = result.get("used_s", 0) / 60.0
+            parts.append(f"{result.get('section', '?').title()} {minutes:.0f}/{result.get('limit_s', 0) // 60} min")
+        status = "completed" if last.get("completed") else "ended early"
+        return f"Last mock test ({last.get('started', '')[:16].replace('T', ' ')}, {status}): " + ", ".join(parts)
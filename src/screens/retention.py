@@ -0,0 +1,93 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+import retention
+from utils import center_window
+
+
+POLL_MS = 100
+
+_sweep_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="retention-sweep")
+
+
+class RetentionPopup(tk.Toplevel):
+    """Edits the active profile's retention policy for Speaking takes."""
+
+    def __init__(self, parent: tk.Widget):
+        super().__init__(parent)
+        self.title("Recordings")
+        self.transient(parent.winfo_toplevel())
+        self.resizable(False, False)
+
+        rules = retention.policy()
+        self.keep_var = tk.StringVar(value=str(rules["keep_latest"]))
+        self.cap_var = tk.StringVar(value=f"{rules['max_total_gb']:g}")
+        self.compress_var = tk.BooleanVar(value=bool(rules["compress"]))
+        self.usage_var = tk.StringVar()
+
+        body = ttk.Frame(self, padding=12)
+        body.pack(fill="both", expand=True)
+        ttk.Label(body, textvariable=self.usage_var).grid(row=0, column=0, columnspan=2, sticky="w", pady=(0, 8))
+        ttk.Label(body, text="Keep the latest takes per item (0 = all):").grid(row=1, column=0, sticky="w")
+        ttk.Spinbox(body, from_=0, to=99, width=6, textvariable=self.keep_var).grid(row=1, column=1, sticky="w", padx=6)
+        ttk.Label(body, text="Cap all recordings at GB (0 = no cap):").grid(row=2, column=0, sticky="w", pady=(4, 0))
+        ttk.Entry(body, width=8, textvariable=self.cap_var).grid(row=2, column=1, sticky="w", padx=6, pady=(4, 0))
+        ttk.Checkbutton(
+            body, text="Compress evicted takes to FLAC instead of deleting them", variable=self.compress_var
+        ).grid(row=3, column=0, columnspan=2, sticky="w", pady=(8, 0))
+        ttk.Label(
+            body,
+            text="Kept takes and the newest take of each item are never removed.",
+            foreground="#555",
+        ).grid(row=4, column=0, columnspan=2, sticky="w", pady=(8, 0))
+
+        btns = ttk.Frame(self, padding=(12, 0, 12, 12))
+        btns.pack(fill="x")
+        self.apply_btn = ttk.Button(btns, text="Save and Clean Up Now", command=self._apply)
+        self.apply_btn.pack(side="left")
+        ttk.Button(btns, text="Close", command=self.destroy).pack(side="right")
+
+        self._show_usage()
+        self.after(0, lambda: center_window(self))
+
+    def _show_usage(self, note: str = ""):
+        u = retention.usage()
+        text = f"{u['takes']} takes use {u['bytes'] / 1e6:.1f} MB ({u['flac']} compressed, {u['pinned']} kept)."
+        self.usage_var.set(text + (f"\n{note}" if note else ""))
+
+    def _apply(self):
+        try:
+            keep = int(self.keep_var.get())
+            cap = float(self.cap_var.get() or 0)
+            if keep < 0 or cap < 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Recordings", "Enter a whole number of takes and a size in GB (0 or more).", parent=self)
+            return
+        retention.set_policy(keep_latest=keep, max_total_gb=cap, compress=bool(self.compress_var.get()))
+        self.apply_btn.configure(state="disabled")
+        self.usage_var.set("Cleaning up...")
+        self.after(POLL_MS, self._check, _sweep_worker.submit(retention.sweep))
+
+    def _check(self, future: Future):
+        if not future.done():
+            self.after(POLL_MS, self._check, future)
+            return
+        self.apply_btn.configure(state="normal")
+        error = future.exception()
+        if error is not None:
+            self._show_usage()
+            messagebox.showerror("Recordings", f"Clean-up failed:\n{error}", parent=self)
+            return
+        self._show_usage(_summary(future.result()))
+
+
+def _summary(report: Dict) -> str:
+    if not report["compressed"] and not report["deleted"] and not report["errors"]:
+        return "Nothing to clean up."
+    text = f"Compressed {report['compressed']}, deleted {report['deleted']}, freed {report['freed_bytes'] / 1e6:.1f} MB."
+    if report["errors"]:
+        text += f" {len(report['errors'])} takes could not be changed (in use?)."
+    return text
@@ -3,16 +3,27 @@ from __future__ import annotations
 import os
 import time
 import datetime as dt
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 import tkinter as tk
 from tkinter import ttk, messagebox
 
-from ui.scrollable import ScrollableFrame
-from ui.timer import TimerWidget
+import audio_devices
+import audio_stack
+import countdown
+import instrument
+import recordings
+import retention
+import settings
+
+from ui.grid import EditableGrid, GridColumn
+from ui.links import open_link
+from ui.timer import TimerWidget, timer_service
 from storage import (
     load_speaking_items,
     write_speaking_items,
     delete_speaking_item,
     next_speaking_id,
+    speaking_audio_dir,
 )
 from utils import center_window
 
@@ -33,6 +44,20 @@ Tips:
 5. Don't worry about perfection: Small grammatical mistakes are acceptable. The goal is clear communication. If you make a mistake, just correct it quickly and keep going. Don't let it stop you.
 """
 
+AUDIO_POLL_MS = 100
+SAVE_POLL_MS = 50
+ENHANCE_SETTING = "enhance_takes"
+
+# Post-processing and encoding of saved takes stay off the Tk thread
+_take_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="take-writer")
+_pitch_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pitch")
+
+SPEAKING_COLUMNS = [
+    GridColumn("index", "Link Number", width=100),
+    GridColumn("url", "Questions Link", width=420, editor="entry", stretch=True),
+    GridColumn("day", "Day", width=120, editor="entry"),
+]
+
 
 class SpeakingScreen(ttk.Frame):
     def __init__(self, parent: tk.Widget, on_back):
@@ -52,7 +77,10 @@ class SpeakingScreen(ttk.Frame):
         back_btn.grid(row=0, column=0, sticky="w")
 
         title = ttk.Label(top, text="Speaking", font=("Segoe UI", 16, "bold"))
-        title.grid(row=0, column=1, columnspan=2, sticky="w", padx=(8, 0))
+        title.grid(row=0, column=1, sticky="w", padx=(8, 0))
+
+        recordings_btn = ttk.Button(top, text="Recordings", command=self._open_retention)
+        recordings_btn.grid(row=0, column=2, sticky="e", padx=(0, 8))
 
         tips_btn = ttk.Button(top, text="Speaking Tips", command=self._open_tips)
         tips_btn.grid(row=0, column=3, sticky="e", padx=(0, 8))
@@ -63,9 +91,17 @@ class SpeakingScreen(ttk.Frame):
         self.timer = TimerWidget(top)
         self.timer.grid(row=0, column=5, sticky="e")
 
-        # Scrollable table
-        self.scroll = ScrollableFrame(self)
-        self.scroll.grid(row=2, column=0, sticky="nsew")
+        # Table: edits are saved as soon as a cell editor is committed
+        self.table = EditableGrid(
+            self,
+            SPEAKING_COLUMNS,
+            actions=[
+                ("Answer", self._answer_row, "<Control-Return>"),
+                ("Delete", self._on_delete, "<Delete>"),
+            ],
+            on_edit=self._on_cell_edited,
+        )
+        self.table.grid(row=2, column=0, sticky="nsew")
 
         # Footer actions
         footer = ttk.Frame(self)
@@ -80,45 +116,11 @@ class SpeakingScreen(ttk.Frame):
 
     # ---------- UI Helpers ----------
 
-    def _content_frame(self) -> ttk.Frame:
-        """Handle ScrollableFrame API differences gracefully."""
-        if hasattr(self.scroll, "content"):
-            return getattr(self.scroll, "content")
-        if hasattr(self.scroll, "scrollable_frame"):
-            return getattr(self.scroll, "scrollable_frame")
-        return self.scroll  # fallback
-
+    @instrument.timed
     def _render_rows(self):
-        content = self._content_frame()
-        for w in list(content.children.values()):
-            w.destroy()
-
-        # Header
-        header = ttk.Frame(content, padding=(0, 0, 0, 4))
-        header.grid(row=0, column=0, sticky="ew")
-        for i, width in enumerate([10, 50, 20, 20, 20]):
-            header.grid_columnconfigure(i, weight=1, minsize=0, uniform="cols")
-
-        def hlabel(text, col):
-            ttk.Label(header, text=text, style="Header.TLabel").grid(row=0, column=col, sticky="w", padx=4)
-
-        hlabel("Link Number", 0)
-        hlabel("Questions Link", 1)
-        hlabel("Day", 2)
-        hlabel("Answer", 3)
-        hlabel("Delete", 4)
-
-        # Rows
-        for idx, item in enumerate(self.items, start=1):
-            row = SpeakingRow(
-                content,
-                index=idx,
-                item=item,
-                on_answer=self._on_answer,
-                on_delete=self._on_delete,
-                on_changed=self._on_row_changed,
-            )
-            row.grid(row=idx, column=0, sticky="ew", pady=2)
+        # Link Number is the incremental index, not the ID
+        rows = [dict(item, index=idx) for idx, item in enumerate(self.items, start=1)]
+        self.table.set_rows(rows)
 
     # ---------- Actions ----------
 
@@ -150,6 +152,18 @@ class SpeakingScreen(ttk.Frame):
         if updated:
             write_speaking_items(self.items)
 
+    def _on_cell_edited(self, item_id: int, key: str, value: str):
+        values = self.table.row_values(item_id)
+        self._on_row_changed(item_id, values["url"], values["day"])
+        for it in self.items:
+            if it["id"] == item_id:
+                self.table.update_row(dict(it, index=values["index"]))
+                break
+
+    def _answer_row(self, item_id: int):
+        values = self.table.row_values(item_id)
+        self._on_answer(item_id, values["url"], values["day"])
+
     def _on_answer(self, item_id: int, url: str, day: str):
         # Save edits then open popup
         self._on_row_changed(item_id, url, day)
@@ -158,6 +172,19 @@ class SpeakingScreen(ttk.Frame):
     def _open_tips(self):
         TipsPopup(self, "Speaking Tips", SPEAKING_TIPS)
 
+    def destroy(self):
+        # Answer windows are children of this screen: release their streams and
+        # timers and keep their takes (e.g. when a mock-test section ends)
+        for child in list(self.winfo_children()):
+            if isinstance(child, AnswerPopup):
+                child.shutdown()
+        super().destroy()
+
+    def _open_retention(self):
+        from screens.retention import RetentionPopup
+
+        RetentionPopup(self)
+
     def _open_templates(self):
         # Placeholder popup; content will be provided later
         popup = tk.Toplevel(self)
@@ -173,47 +200,6 @@ class SpeakingScreen(ttk.Frame):
         ttk.Button(popup, text="Close", command=popup.destroy).pack(pady=8)
 
 
-class SpeakingRow(ttk.Frame):
-    def __init__(self, parent, index: int, item: dict, on_answer, on_delete, on_changed):
-        super().__init__(parent)
-        self.item = item
-        self.on_answer = on_answer
-        self.on_delete = on_delete
-        self.on_changed = on_changed
-
-        for i, width in enumerate([10, 50, 20, 20, 20]):
-            self.grid_columnconfigure(i, weight=1, minsize=0, uniform="cols")
-
-        # Link Number (incremental index, not the ID)
-        ttk.Label(self, text=str(index)).grid(row=0, column=0, sticky="w", padx=4)
-
-        # URL entry
-        self.url_var = tk.StringVar(value=item.get("url", ""))
-        url_entry = ttk.Entry(self, textvariable=self.url_var)
-        url_entry.grid(row=0, column=1, sticky="ew", padx=4)
-
-        # Day entry
-        self.day_var = tk.StringVar(value=item.get("day", ""))
-        day_entry = ttk.Entry(self, textvariable=self.day_var, width=12)
-        day_entry.grid(row=0, column=2, sticky="ew", padx=4)
-
-        # Answer button (saves any edits first)
-        answer_btn = ttk.Button(
-            self,
-            text="Answer",
-            command=lambda: self.on_answer(self.item["id"], self.url_var.get(), self.day_var.get()),
-        )
-        answer_btn.grid(row=0, column=3, sticky="ew", padx=4)
-
-        # Delete button
-        del_btn = ttk.Button(self, text="Delete", command=lambda: self.on_delete(self.item["id"]))
-        del_btn.grid(row=0, column=4, sticky="ew", padx=4)
-
-        # Auto-save on focus-out
-        url_entry.bind("<FocusOut>", lambda e: self.on_changed(self.item["id"], self.url_var.get(), self.day_var.get()))
-        day_entry.bind("<FocusOut>", lambda e: self.on_changed(self.item["id"], self.url_var.get(), self.day_var.get()))
-
-
 class TipsPopup(tk.Toplevel):
     def __init__(self, parent: tk.Widget, title: str, text: str):
         super().__init__(parent)
@@ -251,6 +237,8 @@ class AnswerPopup(tk.Toplevel):
     """
     Popup to time, record, play, and save a response.
     Recording uses sounddevice if available; otherwise shows an error message.
+    The audio libraries are loaded in the background (see audio_stack); until
+    they are ready the window shows an indicator and recording is disabled.
     """
 
     def __init__(self, parent: tk.Widget, item_id: int, link: str | None = None):
@@ -258,28 +246,39 @@ class AnswerPopup(tk.Toplevel):
         self.title(f"Answer (ID {item_id})")
         self.transient(parent.winfo_toplevel())
         self.grab_set()
-        self.geometry("640x420")
-        self.minsize(520, 360)
+        self.geometry("640x560")
+        self.minsize(520, 480)
 
         self.item_id = item_id
         self.link = link or ""
 
-        # Lazy imports to avoid hard dependency when not needed
+        # Filled in from audio_stack once it has loaded
         self._sd = None
         self._sf = None
         self._np = None
         self._in_stream = None
+        self._out_stream = None
+        self._clip = None  # playback source: recorded ArrayClip or opened MappedWav
+        self._play_frame = 0
         self._buffer = []
         self._samplerate = 16000
         self._channels = 1
         self._dtype = "float32"
-        self._has_audio = False
-        self._input_devices = []
-        self._input_indices = []
+        self._has_audio = False  # an unsaved recording is held in memory
+        self._takes = []  # [(timestamp, path)] of saved takes, newest first
+        self._devices = []  # audio_devices.InputDevice entries shown in the combobox
         self._device_cb = None
+        self._stop_watching = None
+        self._audio_job = None
+        self._pending_save: Future | None = None
+        self._save_path = None
+        self._save_job = None
+        self._close_requested = False  # close once the pending save finishes
         
         # Audio timing variables
         self._recording_start_time = 0
+        self._counter = None  # countdown.PhaseCounter while a timed task runs
+        self._shown_phase = None
         self._audio_duration = 0
         self._playback_start_time = 0
         self._is_playing = False
@@ -287,41 +286,44 @@ class AnswerPopup(tk.Toplevel):
         self._seeking = False
         self._playback_timer_id = None
 
-        try:
-            import sounddevice as sd  # type: ignore
-            import soundfile as sf  # type: ignore
-            import numpy as np  # type: ignore
+        # No-op if the app already started loading it after the main menu rendered
+        audio_stack.warm_up()
 
-            self._sd = sd
-            self._sf = sf
-            self._np = np
-        except Exception as e:
-            messagebox.showwarning(
-                "Audio Not Available",
-                "Audio dependencies not installed.\n\n"
-                "Install with:\n"
-                "  python -m pip install sounddevice soundfile\n"
-                "On Debian/Ubuntu also install: sudo apt-get install libportaudio2",
-            )
-
-        # Top: Timer
+        # Top: Timer and audio ready indicator
         top = ttk.Frame(self, padding=(8, 8, 8, 4))
         top.pack(fill="x")
         ttk.Label(top, text="Speaking Timer", font=("Segoe UI", 12, "bold")).pack(side="left")
         self.timer = TimerWidget(top)
         self.timer.pack(side="right")
-
-        # Optional: input device selector (only if audio libs present)
-        if self._sd is not None:
-            devbar = ttk.Frame(self, padding=(8, 0, 8, 4))
-            devbar.pack(fill="x")
-            ttk.Label(devbar, text="Input device:").pack(side="left")
-            self._device_var = tk.StringVar()
-            self._device_cb = ttk.Combobox(devbar, textvariable=self._device_var, state="readonly", width=48)
-            self._device_cb.pack(side="left", fill="x", expand=True, padx=6)
-            ttk.Button(devbar, text="Refresh", command=self._refresh_devices).pack(side="left")
-            # Populate devices and select a default
-            self._refresh_devices()
+        self.audio_var = tk.StringVar(value="Preparing audio...")
+        self.audio_label = ttk.Label(top, textvariable=self.audio_var, foreground="#777")
+        self.audio_label.pack(side="right", padx=(0, 12))
+
+        # Input device selector; hidden if the audio libs turn out to be missing
+        self._devbar = ttk.Frame(self, padding=(8, 0, 8, 4))
+        self._devbar.pack(fill="x")
+        ttk.Label(self._devbar, text="Input device:").pack(side="left")
+        self._device_var = tk.StringVar()
+        self._device_cb = ttk.Combobox(self._devbar, textvariable=self._device_var, state="readonly", width=48)
+        self._device_cb.pack(side="left", fill="x", expand=True, padx=6)
+        ttk.Button(self._devbar, text="Refresh", command=self._refresh_devices).pack(side="left")
+        # Filled from the app-wide registry once audio is ready
+        self._device_cb.set("Looking for devices...")
+
+        # Timed task: prep countdown, then recording cut at the response limit
+        self._taskbar = ttk.Frame(self, padding=(8, 0, 8, 4))
+        self._taskbar.pack(fill="x")
+        ttk.Label(self._taskbar, text="Timed task:").pack(side="left")
+        self._task_var = tk.StringVar(value=countdown.SPEAKING_TASKS[0][0])
+        ttk.Combobox(
+            self._taskbar,
+            textvariable=self._task_var,
+            values=[name for name, _, _ in countdown.SPEAKING_TASKS],
+            state="readonly",
+            width=40,
+        ).pack(side="left", fill="x", expand=True, padx=6)
+        self.task_btn = ttk.Button(self._taskbar, text="Start Task", command=self._start_task, state="disabled")
+        self.task_btn.pack(side="left")
 
         # Middle: status, time info, and audio progress bar
         mid = ttk.Frame(self, padding=8)
@@ -353,6 +355,24 @@ class AnswerPopup(tk.Toplevel):
         self.playback_slider.pack(fill="x")
         self.playback_slider.state(["disabled"])
 
+        # Previous takes of this item; clips are decoded only when played
+        takes_frame = ttk.LabelFrame(self, text="Previous takes", padding=(8, 4))
+        takes_frame.pack(fill="both", expand=True, padx=8, pady=(0, 8))
+        takes_frame.grid_columnconfigure(0, weight=1)
+        takes_frame.grid_rowconfigure(0, weight=1)
+        self.takes_list = tk.Listbox(takes_frame, height=5, exportselection=False, activestyle="none")
+        self.takes_list.grid(row=0, column=0, sticky="nsew")
+        takes_scroll = ttk.Scrollbar(takes_frame, orient="vertical", command=self.takes_list.yview)
+        takes_scroll.grid(row=0, column=1, sticky="ns")
+        self.takes_list.configure(yscrollcommand=takes_scroll.set)
+        self.takes_list.bind("<<ListboxSelect>>", self._on_take_selected)
+        self._keep_var = tk.BooleanVar(value=False)
+        self.keep_btn = ttk.Checkbutton(
+            takes_frame, text="Keep this take", variable=self._keep_var, command=self._on_keep_toggled, state="disabled"
+        )
+        self.keep_btn.grid(row=1, column=0, sticky="w", pady=(4, 0))
+        self._refresh_takes()
+
         # Buttons
         btns = ttk.Frame(self, padding=(8, 0, 8, 8))
         btns.pack(fill="x")
@@ -362,7 +382,7 @@ class AnswerPopup(tk.Toplevel):
         btns.grid_columnconfigure(3, weight=1)
         btns.grid_columnconfigure(4, weight=1)
 
-        self.record_btn = ttk.Button(btns, text="Record", command=self._start_record)
+        self.record_btn = ttk.Button(btns, text="Record", command=self._start_record, state="disabled")
         self.stop_btn = ttk.Button(btns, text="Stop", command=self._stop_record, state="disabled")
         self.play_btn = ttk.Button(btns, text="Play", command=self._play, state="disabled")
         self.save_btn = ttk.Button(btns, text="Save", command=self._save, state="disabled")
@@ -374,117 +394,217 @@ class AnswerPopup(tk.Toplevel):
         self.save_btn.grid(row=0, column=3, sticky="ew", padx=4)
         self.transcribe_btn.grid(row=0, column=4, sticky="ew", padx=4)
 
+        self.intonation_btn = ttk.Button(btns, text="Intonation", command=self._show_intonation)
+        self.intonation_btn.grid(row=1, column=0, sticky="ew", padx=4, pady=(4, 0))
+        ttk.Button(btns, text="Compare Takes", command=self._compare_takes).grid(
+            row=1, column=1, sticky="ew", padx=4, pady=(4, 0)
+        )
+
+        # DC removal, noise gate and loudness normalization before writing (see audio_processing)
+        self._enhance_var = tk.BooleanVar(value=bool(settings.get(ENHANCE_SETTING, False)))
+        ttk.Checkbutton(
+            btns, text="Enhance on save", variable=self._enhance_var, command=self._on_enhance_toggled
+        ).grid(row=1, column=3, columnspan=2, sticky="e", padx=4, pady=(4, 0))
+
         # Bottom: link info and Close
         bottom = ttk.Frame(self, padding=8)
         bottom.pack(fill="x")
         if self.link:
-            ttk.Label(bottom, text=f"Link: {self.link}", wraplength=580).pack(anchor="w", pady=(0, 6))
+            link_row = ttk.Frame(bottom)
+            link_row.pack(fill="x", pady=(0, 6))
+            ttk.Button(link_row, text="Open", command=lambda: open_link(self, self.link)).pack(side="right", padx=(6, 0))
+            ttk.Label(link_row, text=f"Link: {self.link}", wraplength=520).pack(side="left", anchor="w")
         ttk.Button(bottom, text="Close", command=self._on_close).pack(side="right")
 
         self.protocol("WM_DELETE_WINDOW", self._on_close)
         self.after(0, lambda: center_window(self))
+        self._check_audio()
 
     # ----- Recording logic -----
 
+    def _check_audio(self):
+        """Poll the background warm-up; enable recording once the audio stack is loaded."""
+        self._audio_job = None
+        if not audio_stack.ready():
+            self._audio_job = self.after(AUDIO_POLL_MS, self._check_audio)
+            return
+        modules = audio_stack.modules()
+        if modules is None:
+            self.audio_var.set("Audio unavailable")
+            self._devbar.pack_forget()
+            self._taskbar.pack_forget()
+            self.status_var.set("Audio recording not available.")
+            messagebox.showwarning("Audio Not Available", audio_stack.INSTALL_HINT, parent=self)
+            return
+        self._sd, self._sf, self._np = modules
+        self.audio_var.set("Audio ready")
+        self.audio_label.configure(foreground="#2e7d32")
+        self.record_btn.configure(state="normal")
+        self.task_btn.configure(state="normal")
+        self._stop_watching = audio_devices.watch(self, self._show_devices)
+
     def _audio_supported(self) -> bool:
         return all([self._sd, self._sf, self._np])
 
     def _refresh_devices(self):
-        """Populate input devices into the combobox."""
-        try:
-            devices = self._sd.query_devices()
-            input_devs = [(i, d) for i, d in enumerate(devices) if int(d.get("max_input_channels", 0)) > 0]
-        except Exception as e:
-            input_devs = []
-        self._input_devices = input_devs
-        self._input_indices = [i for i, _ in input_devs]
-        labels = [f"[{i}] {d.get('name','Unknown')}" for i, d in input_devs]
-        if self._device_cb is not None:
-            self._device_cb["values"] = labels
-            if labels:
-                self._device_cb.current(0)
-            else:
-                self._device_cb.set("No input device")
+        """Rescan for hot-plugged devices; the combobox updates when the scan is done."""
+        if self._in_stream is None and self._out_stream is None:
+            audio_devices.registry.refresh()
+
+    def _show_devices(self):
+        """Populate the combobox from the registry, keeping the current choice if it still exists."""
+        registry = audio_devices.registry
+        current = self._selected_device()
+        self._devices = list(registry.devices)
+        if self._device_cb is None:
+            return
+        self._device_cb["values"] = [d.label for d in self._devices]
+        keep = registry.find(current.key) if current is not None else None
+        chosen = keep or registry.preferred()
+        if chosen is not None:
+            self._device_cb.current(self._devices.index(chosen))
+        else:
+            self._device_cb.set(registry.error or "No input device")
 
-    def _selected_device_index(self) -> int | None:
-        """Return selected device index or None."""
-        if not getattr(self, "_input_indices", []):
+    def _selected_device(self) -> audio_devices.InputDevice | None:
+        """Return the selected input device or None."""
+        if not self._devices:
             return None
-        if self._device_cb is None:
-            return self._input_indices[0]
-        sel = self._device_cb.current()
-        if sel < 0:
-            return self._input_indices[0]
-        return self._input_indices[sel]
+        sel = self._device_cb.current() if self._device_cb is not None else -1
+        return self._devices[sel] if 0 <= sel < len(self._devices) else self._devices[0]
+
+    def _start_task(self):
+        phases = countdown.task_phases(self._task_var.get())
+        if phases is not None:
+            self._start_record(phases)
 
-    def _start_record(self):
+    def _start_record(self, phases=None):
+        """Start recording; with ``phases`` (prep, response seconds) run a timed task."""
         if not self._audio_supported():
             messagebox.showerror("Audio", "Audio recording not available.")
             return
         if self._in_stream is not None:
             return
-        dev_index = self._selected_device_index()
-        if dev_index is None:
+        device = self._selected_device()
+        if device is None:
             messagebox.showerror("Audio", "No input device available.")
             return
+        dev_index = device.index
 
         self._buffer.clear()
         self._has_audio = False
         
         # Reset timing info
-        self._recording_start_time = time.time()
-        self._update_timer()  # Start updating the timer
-
-        def callback(indata, frames, time_info, status):
-            if status:
-                pass
-            self._buffer.append(indata.copy())
+        self._recording_start_time = time.monotonic()
+        timer_service(self).add(self._update_timer)  # Start updating the timer
 
         try:
-            # Use the device's default sample rate and available channels
-            info = self._sd.query_devices(dev_index)
-            samplerate = int(info.get("default_samplerate") or self._samplerate)
-            channels = max(1, min(self._channels, int(info.get("max_input_channels", 1))))
+            # Use the device's default sample rate and available channels (cached by the registry)
+            samplerate = device.default_samplerate or self._samplerate
+            channels = max(1, min(self._channels, device.max_input_channels))
             self._samplerate = samplerate
             self._channels = channels
 
-            self._in_stream = self._sd.InputStream(
-                device=dev_index,
-                samplerate=self._samplerate,
-                channels=self._channels,
-                dtype=self._dtype,
-                callback=callback,
-            )
-            self._in_stream.start()
-            self.status_var.set(f"Recording on device [{dev_index}]... Click 'Stop' to finish.")
+            # In a timed task the stream runs from the start of preparation and
+            # the frame counter decides which samples belong to the response
+            counter = countdown.PhaseCounter(samplerate, *phases) if phases else None
+            self._counter = counter
+            self._shown_phase = None
+            sd = self._sd
+
+            def callback(indata, frames, time_info, status):
+                if status:
+                    pass
+                if counter is None:
+                    self._buffer.append(indata.copy())
+                    return
+                kept = counter.feed(indata)
+                if kept is not None and len(kept):
+                    self._buffer.append(kept.copy())
+                if counter.done:
+                    raise sd.CallbackStop
+
+            with audio_devices.registry.portaudio():
+                stream = self._sd.InputStream(
+                    device=dev_index,
+                    samplerate=self._samplerate,
+                    channels=self._channels,
+                    dtype=self._dtype,
+                    callback=instrument.audio_callback("audio.input_callback", callback, self._samplerate),
+                )
+                stream.start()
+                self._in_stream = stream
+                audio_devices.registry.stream_opened()
+            audio_devices.registry.remember(device)
+            if counter is None:
+                self.status_var.set(f"Recording on device [{dev_index}]... Click 'Stop' to finish.")
             self.record_btn.configure(state="disabled")
+            self.task_btn.configure(state="disabled")
             self.stop_btn.configure(state="normal")
             self.play_btn.configure(state="disabled")
             self.save_btn.configure(state="disabled")
         except Exception as e:
+            self._counter = None
             messagebox.showerror("Audio", f"Failed to start recording:\n{e}")
 
-    def _update_timer(self):
-        """Update the timer display during recording or playback"""
-        if self._in_stream is not None:  # Recording in progress
-            elapsed = time.time() - self._recording_start_time
+    def _update_timer(self, now=None):
+        """Update the timer display during recording or playback.
+
+        Runs on the shared timer tick while recording or playing and
+        unsubscribes itself once neither is happening.
+        """
+        if self._in_stream is not None and self._counter is not None:  # Timed task
+            self._update_countdown()
+        elif self._in_stream is not None:  # Recording in progress
+            elapsed = (now or time.monotonic()) - self._recording_start_time
             self.time_var.set(f"{self._format_time(elapsed)} / Recording...")
-            self.after(100, self._update_timer)
         elif self._is_playing:  # Playback in progress
-            elapsed = time.time() - self._playback_start_time + self._playback_position
+            # Position comes from the frames actually handed to the device
+            elapsed = self._play_frame / self._clip.samplerate
             if elapsed < self._audio_duration:
                 self.time_var.set(f"{self._format_time(elapsed)} / {self._format_time(self._audio_duration)}")
                 if not self._seeking:
                     # Update slider position only if not currently seeking
                     self.playback_slider.set((elapsed / self._audio_duration) * 100)
-                self.after(100, self._update_timer)
             else:
                 # Playback finished
                 self._is_playing = False
                 self.time_var.set(f"{self._format_time(self._audio_duration)} / {self._format_time(self._audio_duration)}")
                 self.playback_slider.set(100)
                 self.play_btn.configure(text="Play")
-    
+                timer_service(self).remove(self._update_timer)
+        else:
+            timer_service(self).remove(self._update_timer)
+
+    def _update_countdown(self):
+        """Reflect the stream-driven task phase; cues fire on phase changes."""
+        counter = self._counter
+        phase = counter.phase
+        if phase != self._shown_phase:
+            self._shown_phase = phase
+            if phase == countdown.PREP:
+                self.status_var.set("Preparation time. Recording starts automatically.")
+            elif phase == countdown.SPEAK:
+                self.status_var.set("Speak now. Recording stops automatically at the time limit.")
+                self._play_cue(880.0)
+            else:
+                self._play_cue(440.0)
+                self._stop_record()
+                return
+        label = "Prepare" if phase == countdown.PREP else "Speak"
+        self.time_var.set(f"{label}: {self._format_time(counter.remaining_seconds() + 0.999)}")
+
+    def _play_cue(self, freq: float):
+        """Short beep marking a phase boundary (falls back to the Tk bell)."""
+        try:
+            np = self._np
+            rate = 44100
+            t = np.arange(int(rate * 0.25)) / rate
+            tone = 0.2 * np.sin(2 * np.pi * freq * t) * np.minimum(1.0, (0.25 - t) * 40)
+            self._sd.play(tone.astype("float32"), rate)
+        except Exception:
+            self.bell()
+
     def _format_time(self, seconds):
         """Format time in seconds to MM:SS format"""
         mins = int(seconds) // 60
@@ -493,7 +613,7 @@ class AnswerPopup(tk.Toplevel):
 
     def _on_slider_move(self, value):
         """Handle slider movement for seeking in audio playback"""
-        if not self._has_audio:
+        if self._clip is None:
             return
             
         self._seeking = True
@@ -517,15 +637,16 @@ class AnswerPopup(tk.Toplevel):
             self._in_stream.close()
         finally:
             self._in_stream = None
-
-        # Calculate recording duration
-        self._audio_duration = time.time() - self._recording_start_time
+            audio_devices.registry.stream_closed()
+        self._counter = None
+        self.task_btn.configure(state="normal")
 
         if self._buffer and self._np is not None:
             data = self._np.concatenate(self._buffer, axis=0)
             self._buffer.clear()
             self._audio_data = data  # keep in memory only
             self._has_audio = True
+            self._set_clip(recordings.ArrayClip(data, self._samplerate))
             
             duration_str = self._format_time(self._audio_duration)
             self.status_var.set(f"Recorded {duration_str}. You can Play or Save.")
@@ -538,10 +659,39 @@ class AnswerPopup(tk.Toplevel):
             self.stop_btn.configure(state="disabled")
             self.playback_slider.state(["!disabled"])  # Enable slider
             self.playback_slider.set(0)  # Reset slider position
+        else:
+            # Stopped before anything was captured (e.g. during preparation)
+            self.status_var.set("Idle. Click 'Record' to start.")
+            self.time_var.set("00:00 / 00:00")
+            self.record_btn.configure(state="normal")
+            self.stop_btn.configure(state="disabled")
+
+    def _set_clip(self, clip):
+        """Make ``clip`` the playback source, releasing the previous one."""
+        if self._is_playing:
+            self._stop_playback()
+        if self._clip is not None and self._clip is not clip:
+            self._clip.close()
+        self._clip = clip
+        self._audio_duration = clip.duration
+        self._playback_position = 0
 
     def _play(self):
-        if not self._audio_supported() or not self._has_audio:
+        if not self._audio_supported() or self._clip is None:
             return
+
+        # A saved take is decoded (or taken from the LRU cache) on first play
+        path = getattr(self._clip, "path", None)
+        if path and not isinstance(self._clip, recordings.ArrayClip) and not self._is_playing:
+            try:
+                clip = recordings.clip_cache.get(path)
+            except Exception as e:
+                messagebox.showerror("Audio", f"Could not load recording:\n{e}")
+                return
+            if clip is not self._clip:
+                position = self._playback_position
+                self._set_clip(clip)
+                self._playback_position = position
         
         if self._is_playing:
             # If already playing, stop playback
@@ -554,95 +704,340 @@ class AnswerPopup(tk.Toplevel):
 
     def _start_playback_at_position(self, position_seconds):
         """Start playback from the specified position in seconds"""
+        clip = self._clip
         try:
             if position_seconds >= self._audio_duration:
                 position_seconds = 0
-                
-            frame_position = int(position_seconds * self._samplerate)
-            
-            # Calculate how many frames to skip (assuming mono audio for simplicity)
-            if frame_position > 0 and frame_position < len(self._audio_data):
-                audio_to_play = self._audio_data[frame_position:]
-            else:
-                audio_to_play = self._audio_data
-                
-            self._sd.play(audio_to_play, self._samplerate)
-            self._playback_start_time = time.time()
+
+            # Stream from the clip so only the frames being played are read
+            self._play_frame = int(position_seconds * clip.samplerate)
+            sd = self._sd
+
+            def callback(outdata, frames, time_info, status):
+                chunk = clip.read(self._play_frame, frames)
+                n = len(chunk)
+                outdata[:n] = chunk
+                self._play_frame += n
+                if n < frames:
+                    outdata[n:] = 0
+                    raise sd.CallbackStop
+
+            with audio_devices.registry.portaudio():
+                stream = sd.OutputStream(
+                    samplerate=clip.samplerate,
+                    channels=clip.channels,
+                    dtype="float32",
+                    callback=instrument.audio_callback("audio.output_callback", callback, clip.samplerate),
+                )
+                stream.start()
+                self._out_stream = stream
+                audio_devices.registry.stream_opened()
+            self._playback_start_time = time.monotonic()
             self._playback_position = position_seconds
             self._is_playing = True
-            
+
             # Start updating the timer
-            self._update_timer()
-            
+            timer_service(self).add(self._update_timer)
+
             # Set callback for when playback finishes
             self._playback_timer_id = self.after(
-                int(self._audio_duration * 1000), 
+                int((self._audio_duration - position_seconds) * 1000),
                 self._on_playback_finished
             )
-            
+
         except Exception as e:
             messagebox.showerror("Audio", f"Playback failed:\n{e}")
 
     def _stop_playback(self):
         """Stop the current playback"""
         if self._is_playing:
-            self._sd.stop()
+            self._close_out_stream()
             self._is_playing = False
-            
+            self._playback_position = self._play_frame / self._clip.samplerate
+
             # Cancel the scheduled playback finished callback
             if self._playback_timer_id is not None:
                 self.after_cancel(self._playback_timer_id)
                 self._playback_timer_id = None
 
+    def _close_out_stream(self):
+        if self._out_stream is not None:
+            try:
+                self._out_stream.abort()
+                self._out_stream.close()
+            except Exception:
+                pass
+            self._out_stream = None
+            audio_devices.registry.stream_closed()
+
     def _on_playback_finished(self):
         """Called when playback finishes naturally"""
+        self._playback_timer_id = None
+        self._close_out_stream()
         self._is_playing = False
         self._playback_position = 0
         self.play_btn.configure(text="Play")
         self.playback_slider.set(0)
         self.time_var.set(f"00:00 / {self._format_time(self._audio_duration)}")
 
+    def _on_enhance_toggled(self):
+        try:
+            settings.update(**{ENHANCE_SETTING: bool(self._enhance_var.get())})
+        except OSError:
+            pass  # only a preference
+
     def _save(self):
         if not self._audio_supported() or not getattr(self, "_audio_data", None) is not None:
             return
+        if self._pending_save is not None:
+            return
         try:
-            out_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "..", "data", "speaking_audio")
-            out_dir = os.path.normpath(out_dir)
-            os.makedirs(out_dir, exist_ok=True)
-            ts = time.strftime("%Y%m%d-%H%M%S")
-            filename = f"speaking_{self.item_id}_{ts}.wav"
-            out_path = os.path.join(out_dir, filename)
-
-            # soundfile expects float data in range [-1,1] for float subtype; this is fine
-            self._sf.write(out_path, self._audio_data, self._samplerate, subtype="PCM_16")
-            messagebox.showinfo("Saved", f"Audio saved:\n{out_path}")
-            # Consider clearing after save (user can re-record a new one)
-            self._has_audio = False
+            out_dir = self._recordings_dir()
         except Exception as e:
             messagebox.showerror("Save Failed", f"Could not save audio:\n{e}")
+            return
+        ts = time.strftime("%Y%m%d-%H%M%S")
+        out_path = os.path.join(out_dir, recordings.take_filename(self.item_id, ts))
+        enhance = bool(self._enhance_var.get())
+        self._save_path = out_path
+        self._pending_save = _take_writer.submit(
+            _write_take, self._sf, out_path, self._audio_data, self._samplerate, enhance
+        )
+        self.save_btn.configure(state="disabled")
+        self.record_btn.configure(state="disabled")
+        self.task_btn.configure(state="disabled")
+        self.status_var.set("Enhancing and saving..." if enhance else "Saving...")
+        self._save_job = self.after(SAVE_POLL_MS, self._check_saved, out_path)
+
+    def _check_saved(self, out_path: str):
+        future = self._pending_save
+        if not future.done():
+            self._save_job = self.after(SAVE_POLL_MS, self._check_saved, out_path)
+            return
+        self._save_job = None
+        self._pending_save = None
+        self.record_btn.configure(state="normal")
+        self.task_btn.configure(state="normal")
+        error = future.exception()
+        if error is not None:
+            self._close_requested = False  # the take is still unsaved; let the user decide again
+            self.save_btn.configure(state="normal")
+            self.status_var.set("Save failed.")
+            messagebox.showerror("Save Failed", f"Could not save audio:\n{error}", parent=self)
+            return
+        data, report = future.result()
+        # The take stays playable (as saved) and is now listed and cached as a saved take
+        self._has_audio = False
+        if data is not self._audio_data:
+            self._audio_data = data
+            position = self._playback_position
+            self._set_clip(recordings.ArrayClip(data, self._samplerate))
+            self._playback_position = position
+        self._clip.path = out_path
+        recordings.clip_cache.put(out_path, self._clip)
+        retention.take_saved(out_path)
+        if self._close_requested:
+            self._teardown()
+            return
+        self._refresh_takes(select=out_path)
+        note = f" Loudness adjusted by {report['gain_db']:+.1f} dB." if report else ""
+        self.status_var.set(f"Saved {os.path.basename(out_path)}.{note}")
+        messagebox.showinfo("Saved", f"Audio saved:\n{out_path}", parent=self)
+
+    def _recordings_dir(self) -> str:
+        return speaking_audio_dir()
+
+    def _refresh_takes(self, select: str | None = None):
+        """List the saved takes of this item (file names only, nothing is decoded)."""
+        self._takes = recordings.list_takes(self._recordings_dir(), self.item_id)
+        self.takes_list.configure(state="normal")
+        self.takes_list.delete(0, "end")
+        for ts, path in self._takes:
+            stamp = dt.datetime.strptime(ts, "%Y%m%d-%H%M%S").strftime("%Y-%m-%d  %H:%M:%S")
+            if retention.is_pinned(path):
+                stamp += "  (kept)"
+            if path.lower().endswith(".flac"):
+                stamp += "  (compressed)"
+            self.takes_list.insert("end", stamp)
+        self._sync_keep(select)
+        if not self._takes:
+            self.takes_list.insert("end", "No saved takes yet.")
+            self.takes_list.configure(state="disabled")
+            return
+        for i, (_, path) in enumerate(self._takes):
+            if path == select:
+                self.takes_list.selection_set(i)
+                self.takes_list.see(i)
+
+    def _sync_keep(self, path: str | None):
+        """Show the retention pin of the selected saved take."""
+        saved = path is not None and any(p == path for _, p in self._takes)
+        self._keep_var.set(saved and retention.is_pinned(path))
+        self.keep_btn.configure(state="normal" if saved else "disabled")
+
+    def _on_keep_toggled(self):
+        sel = self.takes_list.curselection()
+        if not sel or sel[0] >= len(self._takes):
+            return
+        retention.set_pinned(self._takes[sel[0]][1], bool(self._keep_var.get()))
+        self._refresh_takes(select=self._takes[sel[0]][1])
+
+    def _on_take_selected(self, event=None):
+        sel = self.takes_list.curselection()
+        if not sel or sel[0] >= len(self._takes):
+            return
+        path = self._takes[sel[0]][1]
+        self._sync_keep(path)
+        if self._clip is not None and getattr(self._clip, "path", None) == path:
+            return
+        self._open_take(path)
+
+    def _open_take(self, path: str):
+        """Open a saved take for playback; WAV files are memory-mapped, not loaded."""
+        if not audio_stack.ready() or self._pending_save is not None:
+            busy = "Audio is still loading" if self._pending_save is None else "The take is still being saved"
+            self.status_var.set(f"{busy}; select the take again in a moment.")
+            self.takes_list.selection_clear(0, "end")
+            return
+        if not self._audio_supported():
+            messagebox.showerror("Audio", "Audio playback not available.")
+            return
+        if getattr(self, "_audio_data", None) is not None and self._has_audio:
+            if not messagebox.askyesno("Discard Recording", "You have an unsaved recording. Discard it?"):
+                self.takes_list.selection_clear(0, "end")
+                return
+        try:
+            clip = recordings.clip_cache.peek(path)
+        except Exception as e:
+            messagebox.showerror("Audio", f"Could not open recording:\n{e}")
+            return
+        self._audio_data = None
+        self._has_audio = False
+        self._set_clip(clip)
+        duration_str = self._format_time(self._audio_duration)
+        self.status_var.set(f"Opened {os.path.basename(path)} ({duration_str}).")
+        self.time_var.set(f"00:00 / {duration_str}")
+        self.play_btn.configure(state="normal", text="Play")
+        self.save_btn.configure(state="disabled")
+        self.playback_slider.state(["!disabled"])
+        self.playback_slider.set(0)
+
+    def _show_intonation(self):
+        """Pitch contour of the selected saved take, computed (or read from its cache) off the Tk thread."""
+        path = getattr(self._clip, "path", None)
+        if not path or self._has_audio or self._pending_save is not None:
+            messagebox.showinfo("Intonation", "Save the take or select a saved one first.", parent=self)
+            return
+        import pitch
+
+        self.intonation_btn.configure(state="disabled")
+        self.status_var.set("Analyzing intonation...")
+        future = _pitch_worker.submit(pitch.analyze, path)
+        self.after(SAVE_POLL_MS, self._check_intonation, future, path)
+
+    def _check_intonation(self, future: Future, path: str):
+        if not future.done():
+            self.after(SAVE_POLL_MS, self._check_intonation, future, path)
+            return
+        self.intonation_btn.configure(state="normal")
+        error = future.exception()
+        if error is not None:
+            self.status_var.set("Intonation analysis failed.")
+            messagebox.showerror("Intonation", f"Could not analyze the take:\n{error}", parent=self)
+            return
+        self.status_var.set(f"Intonation of {os.path.basename(path)}.")
+        from screens.intonation import IntonationPopup
+
+        IntonationPopup(self, f"Intonation - {os.path.basename(path)}", future.result())
+
+    def _compare_takes(self):
+        """Align two saved takes of this item (the selected one and the previous by default)."""
+        if len(self._takes) < 2:
+            messagebox.showinfo("Compare Takes", "Save at least two takes of this item to compare them.", parent=self)
+            return
+        from screens.compare import TakeComparePopup
+
+        sel = self.takes_list.curselection()
+        selected = self._takes[sel[0]][1] if sel and sel[0] < len(self._takes) else self._takes[0][1]
+        TakeComparePopup(self, self.item_id, self._takes, selected)
 
     def _transcribe_placeholder(self):
         messagebox.showinfo("Transcribe", "Transcription will be implemented later.")
 
     def _on_close(self):
-        # Stop any ongoing operations
+        if self._pending_save is not None:
+            # Without blocking the Tk thread: _check_saved closes the window once the
+            # take is written, or re-enables the controls if the save failed
+            self._close_requested = True
+            self.status_var.set("Finishing the save; the window closes when it is done.")
+            return
+        # If audio exists and not saved, ask confirmation
+        if getattr(self, "_audio_data", None) is not None and self._has_audio:
+            if not messagebox.askyesno("Discard Recording", "You have an unsaved recording. Close and discard it?"):
+                return
+        self._teardown()
+
+    def shutdown(self):
+        """Close without asking, keeping the take.
+
+        A running recording is stopped and an unsaved take is saved first.
+        Used when the owning screen is destroyed, e.g. when a mock-test
+        section times out. Blocks until the take is written, so the section's
+        activity includes it.
+        """
+        if self._in_stream is not None:
+            try:
+                self._stop_record()
+            except Exception:
+                pass  # the stream is released either way; _teardown finishes the rest
+        if self._has_audio and self._pending_save is None:
+            self._save()
+        future = self._pending_save
+        if future is not None:
+            wait([future])
+            self._pending_save = None
+            if future.exception() is None:
+                retention.take_saved(self._save_path)
+        self._teardown()
+
+    def _teardown(self):
+        """Release streams, scheduled callbacks and subscriptions, then destroy the window."""
         if self._in_stream is not None:
             try:
                 self._in_stream.abort()
                 self._in_stream.close()
             except Exception:
                 pass
-        
-        # Stop any ongoing playback
+            self._in_stream = None
+            audio_devices.registry.stream_closed()
         if self._is_playing:
             self._stop_playback()
-            
-        # Cancel any pending timers
-        if self._playback_timer_id is not None:
-            self.after_cancel(self._playback_timer_id)
-            
-        # If audio exists and not saved, ask confirmation
-        if getattr(self, "_audio_data", None) is not None and self._has_audio:
-            if not messagebox.askyesno("Discard Recording", "You have an unsaved recording. Close and discard it?"):
-                return
-        self.destroy()
\ No newline at end of file
+        self._close_out_stream()
+        for job in (self._playback_timer_id, self._audio_job, self._save_job):
+            if job is not None:
+                self.after_cancel(job)
+        self._playback_timer_id = self._audio_job = self._save_job = None
+        if self._clip is not None:
+            self._clip.close()
+        if self._stop_watching is not None:
+            self._stop_watching()
+            self._stop_watching = None
+        timer_service(self).remove(self._update_timer)
+        self.destroy()
+
+def _write_take(sf, path: str, data, samplerate: int, enhance: bool):
+    """Runs on the take writer: optionally post-process, then encode to 16-bit WAV.
+
+    Returns the samples that were written and the processing report (None when
+    the take was saved as recorded).
+    """
+    report = None
+    if enhance:
+        try:
+            import audio_processing
+        except ImportError:  # SciPy missing: keep the take as recorded
+            audio_processing = None
+        if audio_processing is not None:
+            data, report = audio_processing.enhance(data, samplerate)
+    sf.write(path, data, samplerate, subtype="PCM_16")
+    return data, report
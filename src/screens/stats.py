@@ -0,0 +1,78 @@
+from typing import Dict, List
+import tkinter as tk
+from tkinter import ttk
+
+import analytics
+import storage
+from timing_log import timing_log
+from utils import center_window
+
+
+class PracticeStatsPopup(tk.Toplevel):
+    """Time spent per item and, for scored sections, how pace relates to right answers."""
+
+    def __init__(self, parent: tk.Widget, section: str, items: List[Dict]):
+        super().__init__(parent)
+        self.title(f"{section.title()} Stats")
+        self.transient(parent.winfo_toplevel())
+        self.geometry("560x420")
+        self.minsize(420, 300)
+
+        # Include segments still waiting in the write buffer
+        timing_log.flush()
+        rows = analytics.pace_accuracy(section, items)
+        # Writing has no right answers: no score column, no pace vs. accuracy line
+        self._scored = "right_answers" in storage.SECTION_FIELDS[section]
+
+        body = ttk.Frame(self, padding=8)
+        body.pack(fill="both", expand=True)
+        body.grid_columnconfigure(0, weight=1)
+        body.grid_rowconfigure(0, weight=1)
+
+        columns = [("id", "Link Number", 100), ("time", "Time Spent", 120), ("sessions", "Sessions", 90)]
+        if self._scored:
+            columns.append(("right", "Right Answers", 110))
+        tree = ttk.Treeview(body, columns=[key for key, _, _ in columns], show="headings", height=10)
+        for key, title, width in columns:
+            tree.heading(key, text=title, anchor="w")
+            tree.column(key, width=width, anchor="w")
+        for row in rows:
+            values = [row["id"], _format_minutes(row["minutes"]), row["sessions"]]
+            if self._scored:
+                values.append(row["right_answers"])
+            tree.insert("", "end", values=values)
+        tree.grid(row=0, column=0, sticky="nsew")
+        yscroll = ttk.Scrollbar(body, orient="vertical", command=tree.yview)
+        yscroll.grid(row=0, column=1, sticky="ns")
+        tree.configure(yscrollcommand=yscroll.set)
+
+        ttk.Label(body, text=self._summary(section, rows), justify="left").grid(
+            row=1, column=0, columnspan=2, sticky="w", pady=(8, 0)
+        )
+        ttk.Button(self, text="Close", command=self.destroy).pack(pady=8)
+
+        self.after(0, lambda: center_window(self, 560, 420))
+
+    def _summary(self, section: str, rows: List[Dict]) -> str:
+        if not rows:
+            return "No timed sessions yet. Select an item and start the timer while you practice."
+        minutes = [r["minutes"] for r in rows]
+        lines = [f"Average time per item: {_format_minutes(sum(minutes) / len(minutes))}"]
+        target = analytics.TARGET_MINUTES.get(section)
+        if target is not None:
+            over = sum(1 for m in minutes if m > target)
+            lines[0] += f" (target {target:.0f} min; {over} over target)"
+        if not self._scored:
+            return "\n".join(lines)
+        r = analytics.correlation(minutes, [float(row["right_answers"]) for row in rows])
+        if r is None:
+            lines.append("Pace vs. accuracy: not enough data yet.")
+        else:
+            trend = "more time went with more right answers" if r > 0 else "more time went with fewer right answers"
+            lines.append(f"Pace vs. accuracy: r = {r:+.2f} ({trend}).")
+        return "\n".join(lines)
+
+
+def _format_minutes(minutes: float) -> str:
+    total = int(round(minutes * 60))
+    return f"{total // 60:d}:{total % 60:02d}"
@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+import datetime as dt
+import time
+import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
+from tkinter import ttk, messagebox
+from typing import Dict, List, Optional
+
+import essay_analysis
+import instrument
+import storage
+from screens.analysis import EssayAnalysisPopup
+from screens.speaking import TipsPopup
+from screens.stats import PracticeStatsPopup
+from text_stats import IncrementalTextStats
+from timing_log import timing_log
+from ui.grid import EditableGrid, GridColumn
+from ui.timer import TimerWidget
+from ui.tracked_text import TrackedText
+
+
+WRITING_TIPS = """The TOEFL Writing Section measures your ability to write in English in an academic setting. It takes about 30 minutes and has 2 tasks:
+
+- Integrated Writing: You will read a short academic passage (3 minutes), listen to a lecture on the same topic, and then have 20 minutes to write a response explaining how the lecture relates to the reading. A typical strong response is 150-225 words.
+- Writing for an Academic Discussion: You will read an online class discussion with a professor's question and two student posts, then have 10 minutes to write your own contribution. Aim for at least 100 words.
+
+Tips:
+
+1. Plan Before You Write: Spend a minute outlining your main points. A clear structure (introduction, body points, short conclusion) is easier to follow and to score.
+2. Connect the Sources: In the Integrated task, explain how each point in the lecture challenges or supports the reading. Do not give your own opinion.
+3. Add Something New: In the Academic Discussion task, do not just repeat the students' ideas. Bring your own reason or example and state your position clearly.
+4. Vary Your Language: Use a range of vocabulary and sentence structures, and signal your organization with transitions such as "In contrast", "Furthermore" and "For instance".
+5. Leave Time to Review: Keep 1-2 minutes at the end to fix typos, missing words and agreement errors.
+"""
+
+WRITING_COLUMNS = [
+    GridColumn("index", "Link Number", width=100),
+    GridColumn("url", "Prompt Link", width=420, editor="entry", stretch=True),
+    GridColumn("day", "Day", width=120, editor="entry"),
+]
+
+AUTOSAVE_DELAY_MS = 1500
+SAVE_POLL_MS = 100
+
+# One writer thread keeps draft writes in submission order
+_draft_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="draft-writer")
+_analysis_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="essay-analysis")
+
+
+class WritingScreen(ttk.Frame):
+    def __init__(self, parent: tk.Widget, on_back):
+        super().__init__(parent)
+        self.on_back = on_back
+        self.items: List[Dict] = []
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(2, weight=1)
+
+        # Top bar: Back, Tips, Stats, Title, Timer
+        top = ttk.Frame(self)
+        top.grid(row=0, column=0, sticky="ew", pady=(0, 8))
+        top.grid_columnconfigure(1, weight=1)
+
+        left_actions = ttk.Frame(top)
+        left_actions.grid(row=0, column=0, sticky="w")
+        ttk.Button(left_actions, text="← Back", command=self._go_back).grid(row=0, column=0, sticky="w", padx=(0, 6))
+        ttk.Button(left_actions, text="Writing Tips", command=self._open_tips).grid(row=0, column=1, sticky="w")
+        ttk.Button(left_actions, text="Stats", command=self._show_stats).grid(row=0, column=2, sticky="w", padx=(6, 0))
+
+        title = ttk.Label(top, text="Writing", font=("Segoe UI", 16, "bold"))
+        title.grid(row=0, column=1)
+
+        # Timed segments are logged against the essay open in the editor
+        self.timer = TimerWidget(top, on_segment=self._on_timer_segment)
+        self.timer.grid(row=0, column=2, sticky="e")
+
+        # Prompts table: edits are saved as soon as a cell editor is committed
+        self.table = EditableGrid(
+            self,
+            WRITING_COLUMNS,
+            actions=[("Delete", self._on_delete, "<Delete>")],
+            on_edit=self._on_cell_edited,
+            height=5,
+        )
+        self.table.grid(row=1, column=0, sticky="nsew")
+        self.table.tree.bind("<<TreeviewSelect>>", self._on_select, add="+")
+
+        # Essay editor for the selected prompt
+        editor_block = ttk.Frame(self)
+        editor_block.grid(row=2, column=0, sticky="nsew", pady=(8, 0))
+        editor_block.grid_columnconfigure(0, weight=1)
+        editor_block.grid_rowconfigure(1, weight=1)
+
+        self.editor_title = ttk.Label(editor_block, text="Select a prompt to start writing", font=("Segoe UI", 11, "bold"))
+        self.editor_title.grid(row=0, column=0, sticky="w", pady=(0, 4))
+
+        self.editor = TrackedText(editor_block, on_change=self._on_text_changed, wrap="word", undo=True, height=12)
+        self.editor.grid(row=1, column=0, sticky="nsew")
+        yscroll = ttk.Scrollbar(editor_block, orient="vertical", command=self.editor.yview)
+        yscroll.grid(row=1, column=1, sticky="ns")
+        self.editor.configure(yscrollcommand=yscroll.set, state="disabled")
+
+        # Footer: live statistics, save status, analysis and add buttons
+        footer = ttk.Frame(self)
+        footer.grid(row=3, column=0, sticky="ew", pady=(8, 0))
+        footer.grid_columnconfigure(1, weight=1)
+        self.stats_var = tk.StringVar(value="")
+        ttk.Label(footer, textvariable=self.stats_var).grid(row=0, column=0, sticky="w")
+        self.save_var = tk.StringVar(value="")
+        ttk.Label(footer, textvariable=self.save_var, foreground="#666").grid(row=0, column=1, sticky="w", padx=(12, 0))
+        self.analyze_btn = ttk.Button(footer, text="Analyze", command=self._analyze, state="disabled")
+        self.analyze_btn.grid(row=0, column=2, sticky="e", padx=(0, 8))
+        self.add_btn = ttk.Button(footer, text="+ Add new item", command=self._add_item)
+        self.add_btn.grid(row=0, column=3, sticky="e")
+
+        # Editor state
+        self.text_stats = IncrementalTextStats()
+        self._item_id: Optional[int] = None
+        self._loading = False
+        self._dirty = False
+        self._autosave_job: Optional[str] = None
+        self._stats_job: Optional[str] = None
+        self._pending_save: Optional[Future] = None
+
+        # Load data and render
+        self.items = storage.load_writing_items()
+        self._render_rows()
+
+    # ---------- Navigation ----------
+
+    def _go_back(self):
+        self.timer.pause()
+        timing_log.flush()
+        self._flush_draft()
+        self.on_back()
+
+    def _open_tips(self):
+        TipsPopup(self, "Writing Tips", WRITING_TIPS)
+
+    def _show_stats(self):
+        PracticeStatsPopup(self, "writing", self.items)
+
+    # ---------- Table ----------
+
+    @instrument.timed
+    def _render_rows(self):
+        # Link Number is the incremental index, not the ID
+        rows = [dict(item, index=idx) for idx, item in enumerate(self.items, start=1)]
+        self.table.set_rows(rows)
+
+    def _add_item(self):
+        new_id = storage.next_id(self.items)
+        new_item = {"id": new_id, "url": "", "day": dt.date.today().isoformat()}
+        self.items.append(new_item)
+        storage.write_writing_items(self.items)
+        self._render_rows()
+        self.table.select(new_id)
+        self.table.edit_cell(new_id, "url")
+
+    def _on_delete(self, item_id: int):
+        if not messagebox.askyesno("Confirm Delete", "Delete this prompt and its draft?"):
+            return
+        if item_id == self._item_id:
+            self._close_draft()
+        if self._pending_save is not None:
+            self._pending_save.exception()  # a queued write must not recreate the deleted draft
+        storage.delete_writing_item(item_id)
+        self.items = storage.load_writing_items()
+        self._render_rows()
+
+    def _on_cell_edited(self, item_id: int, key: str, value: str):
+        values = self.table.row_values(item_id)
+        for it in self.items:
+            if it["id"] == item_id:
+                it["url"] = values["url"].strip()
+                it["day"] = values["day"].strip()
+                storage.write_writing_items(self.items)
+                self.table.update_row(dict(it, index=values["index"]))
+                break
+
+    def _on_select(self, event=None):
+        selected = self.table.selected_id()
+        if selected is None or selected == self._item_id:
+            return
+        if self.timer.running:
+            self.timer.split()  # attributes the time so far to the previous essay
+        self._open_draft(selected)
+
+    def _on_timer_segment(self, start: float, seconds: float):
+        timing_log.record("writing", self._item_id, start, seconds)
+
+    # ---------- Editor ----------
+
+    def _open_draft(self, item_id: int):
+        self._flush_draft()
+        if self._pending_save is not None:
+            self._pending_save.exception()  # read back what was just queued
+        self._item_id = item_id
+        text = storage.load_writing_draft(item_id)
+        self._loading = True
+        try:
+            self.editor.configure(state="normal")
+            self.editor.delete("1.0", "end")
+            self.editor.insert("1.0", text)
+            self.editor.edit_reset()
+        finally:
+            self._loading = False
+        self.text_stats.reset(text)
+        index = next((i for i, it in enumerate(self.items, start=1) if it["id"] == item_id), item_id)
+        self.editor_title.configure(text=f"Essay for Link Number {index}")
+        self.analyze_btn.configure(state="normal")
+        self.save_var.set("")
+        self._refresh_stats()
+        self.editor.focus_set()
+
+    def _close_draft(self):
+        self._flush_draft()
+        self._item_id = None
+        self._loading = True
+        try:
+            self.editor.delete("1.0", "end")
+            self.editor.configure(state="disabled")
+        finally:
+            self._loading = False
+        self.text_stats.reset("")
+        self.editor_title.configure(text="Select a prompt to start writing")
+        self.analyze_btn.configure(state="disabled")
+        self.stats_var.set("")
+        self.save_var.set("")
+
+    def _on_text_changed(self, first: int, last: int, lines: List[str]):
+        if self._loading:
+            return
+        # Only the edited lines are re-tokenized; the label refresh is coalesced per idle
+        self.text_stats.replace_lines(first, last, lines)
+        if self._stats_job is None:
+            self._stats_job = self.after_idle(self._refresh_stats)
+        self._dirty = True
+        if self._autosave_job is not None:
+            self.after_cancel(self._autosave_job)
+        self._autosave_job = self.after(AUTOSAVE_DELAY_MS, self._autosave)
+        if not self.save_var.get().startswith("Unsaved"):
+            self.save_var.set("Unsaved changes")
+
+    def _refresh_stats(self):
+        self._stats_job = None
+        s = self.text_stats
+        self.stats_var.set(
+            f"Words: {s.word_count}   Sentences: {s.sentence_count}   "
+            f"Lexical diversity: {s.lexical_diversity:.2f}"
+        )
+
+    # ---------- Analysis ----------
+
+    def _analyze(self):
+        """Score the essay off the Tk thread and show the report when it is ready."""
+        if self._item_id is None:
+            return
+        title = f"{self.editor_title.cget('text')} - Analysis"
+        future = _analysis_worker.submit(essay_analysis.analyze, self.editor.get("1.0", "end-1c"))
+        self.analyze_btn.configure(state="disabled", text="Analyzing...")
+        self.after(SAVE_POLL_MS, self._check_analysis, future, title)
+
+    def _check_analysis(self, future: Future, title: str):
+        if not future.done():
+            self.after(SAVE_POLL_MS, self._check_analysis, future, title)
+            return
+        self.analyze_btn.configure(text="Analyze", state="normal" if self._item_id is not None else "disabled")
+        error = future.exception()
+        if error is not None:
+            messagebox.showerror("Analysis failed", f"Could not analyze the essay: {error}")
+            return
+        EssayAnalysisPopup(self, title, future.result())
+
+    # ---------- Autosave ----------
+
+    def _autosave(self):
+        """Snapshot the editor and hand the write to the background writer."""
+        self._autosave_job = None
+        if self._item_id is None or not self._dirty:
+            return
+        self._dirty = False
+        text = self.editor.get("1.0", "end-1c")
+        self._pending_save = _draft_writer.submit(storage.save_writing_draft, self._item_id, text)
+        self.after(SAVE_POLL_MS, self._check_saved, self._pending_save)
+
+    def _check_saved(self, future: Future):
+        if not future.done():
+            self.after(SAVE_POLL_MS, self._check_saved, future)
+            return
+        if future is not self._pending_save or self._dirty:
+            return  # a newer edit or write supersedes this status
+        error = future.exception()
+        if error is not None:
+            self.save_var.set(f"Autosave failed: {error}")
+        else:
+            self.save_var.set(f"Draft saved {time.strftime('%H:%M:%S')}")
+
+    def _flush_draft(self):
+        """Queue any pending edit immediately (leaving the screen or the essay)."""
+        if self._autosave_job is not None:
+            self.after_cancel(self._autosave_job)
+            self._autosave_job = None
+        self._autosave()
+
+    def destroy(self):
+        self._flush_draft()
+        if self._pending_save is not None:
+            self._pending_save.exception()  # the draft must land in this profile's root
+        super().destroy()
@@ -0,0 +1,56 @@
+"""Per-profile preferences stored in ``settings.json`` in the data root.
+
+Values are plain JSON. The file is read once per profile and rewritten
+atomically on every change.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from typing import Any, Dict, Optional
+
+import paths
+
+
+_values: Optional[Dict[str, Any]] = None
+_lock = threading.Lock()
+
+
+def _load() -> Dict[str, Any]:
+    global _values
+    if _values is None:
+        try:
+            with open(paths.current().settings_json, encoding="utf-8") as f:
+                loaded = json.load(f)
+        except (OSError, ValueError):
+            loaded = {}
+        _values = loaded if isinstance(loaded, dict) else {}
+    return _values
+
+
+def get(key: str, default: Any = None) -> Any:
+    with _lock:
+        return _load().get(key, default)
+
+
+def update(**changes: Any) -> None:
+    with _lock:
+        values = _load()
+        values.update(changes)
+        registry = paths.current()
+        registry.ensure_dir(registry.root)
+        tmp = registry.settings_json + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(values, f, indent=1)
+        os.replace(tmp, registry.settings_json)
+
+
+def _release() -> None:
+    global _values
+    with _lock:
+        _values = None
+
+
+paths.on_release(_release)
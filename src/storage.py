@@ -3,37 +3,42 @@
 Stores Reading section items as CSV with columns:
 id,url,right_answers,day
 
-File path: data/reading.csv relative to the project root.
+File locations come from the path registry (see paths.py); by default
+data/reading.csv relative to the project root.
 """
 
 from __future__ import annotations
 
 import csv
 import os
-from typing import List, Dict
+from typing import Dict, Iterator, List
 
+import instrument
+import paths
 
-DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
-READING_CSV = os.path.join(DATA_DIR, "reading.csv")
-LISTENING_CSV = os.path.join(DATA_DIR, "listening.csv")
-SPEAKING_CSV = os.path.join(DATA_DIR, "speaking.csv")
-SPEAKING_AUDIO_DIR = os.path.join(DATA_DIR, "speaking_recordings")
 
+SECTIONS = ("reading", "listening", "speaking", "writing")
+SECTION_FIELDS = {
+    "reading": ["id", "url", "right_answers", "day"],
+    "listening": ["id", "url", "right_answers", "day"],
+    "speaking": ["id", "url", "day"],
+    "writing": ["id", "url", "day"],
+}
 
-def ensure_data_dir() -> None:
-    os.makedirs(DATA_DIR, exist_ok=True)
-    os.makedirs(SPEAKING_AUDIO_DIR, exist_ok=True)
 
-def _ensure_data_dir():
-    os.makedirs(DATA_DIR, exist_ok=True)
+def ensure_data_dir() -> None:
+    registry = paths.current()
+    registry.ensure_dir(registry.root)
 
 
+@instrument.timed
 def load_reading_items() -> List[Dict]:
     ensure_data_dir()
+    path = paths.current().reading_csv
     items: List[Dict] = []
-    if not os.path.exists(READING_CSV):
+    if not os.path.exists(path):
         return items
-    with open(READING_CSV, newline="", encoding="utf-8") as f:
+    with open(path, newline="", encoding="utf-8") as f:
         reader = csv.DictReader(f)
         for row in reader:
             try:
@@ -53,10 +58,11 @@ def load_reading_items() -> List[Dict]:
     return items
 
 
+@instrument.timed
 def save_reading_items(items: List[Dict]) -> None:
     ensure_data_dir()
     fieldnames = ["id", "url", "right_answers", "day"]
-    with open(READING_CSV, "w", newline="", encoding="utf-8") as f:
+    with open(paths.current().reading_csv, "w", newline="", encoding="utf-8") as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
         for it in sorted(items, key=lambda x: x["id"]):
@@ -70,12 +76,107 @@ def save_reading_items(items: List[Dict]) -> None:
             )
 
 
+class ItemValidationError(ValueError):
+    """Raised when item fields entered by the user are not valid.
+
+    ``title`` is a short caption suitable for an error dialog.
+    """
+
+    def __init__(self, title: str, message: str):
+        super().__init__(message)
+        self.title = title
+
+
+def validate_scored_item(item_id, url, right_answers, day) -> Dict:
+    """Validate a Reading/Listening item and return it with normalized types."""
+    url = str(url or "").strip()
+    day_str = str(day or "").strip()
+    try:
+        right = int(str(right_answers).strip())
+        if right < 0:
+            raise ValueError
+    except Exception:
+        raise ItemValidationError("Invalid value", "Right Answers must be a non-negative integer.")
+
+    if not day_str:
+        raise ItemValidationError("Missing value", "Day cannot be empty. Use YYYY-MM-DD.")
+
+    if not url:
+        raise ItemValidationError("Missing value", "Questions Link cannot be empty.")
+
+    return {
+        "id": int(item_id),
+        "url": url,
+        "right_answers": right,
+        "day": day_str,
+    }
+
+
+def validate_speaking_item(item_id, url, day) -> Dict:
+    """Validate a Speaking/Writing item; link and day may be left empty."""
+    try:
+        item_id = int(item_id)
+    except Exception:
+        raise ItemValidationError("Invalid value", "Link Number must be an integer.")
+    return {"id": item_id, "url": str(url or "").strip(), "day": str(day or "").strip()}
+
+
+def validate_item(section: str, item_id, row: Dict) -> Dict:
+    """Validate a raw record of any section with the same rules as the UI."""
+    if section in ("speaking", "writing"):
+        return validate_speaking_item(item_id, row.get("url"), row.get("day"))
+    return validate_scored_item(item_id, row.get("url"), row.get("right_answers"), row.get("day"))
+
+
+def section_csv(section: str) -> str:
+    return paths.current().section_csv(section)
+
+
+def iter_items(section: str) -> Iterator[Dict]:
+    """Stream the stored items of a section in file order.
+
+    Unlike load_*_items this does not build or sort the full list.
+    """
+    path = section_csv(section)
+    if not os.path.exists(path):
+        return
+    fields = SECTION_FIELDS[section]
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            try:
+                item = {"id": int(row.get("id", "0") or 0)}
+                for key in fields[1:]:
+                    if key == "right_answers":
+                        item[key] = int(row.get(key, "0") or 0)
+                    else:
+                        item[key] = row.get(key, "")
+            except Exception:
+                continue
+            yield item
+
+
+@instrument.timed
+def append_items(section: str, items: List[Dict]) -> None:
+    """Append a batch of already validated items to a section file."""
+    ensure_data_dir()
+    path = section_csv(section)
+    fields = SECTION_FIELDS[section]
+    new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+    with open(path, "a", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        if new_file:
+            writer.writeheader()
+        for it in items:
+            writer.writerow({key: it.get(key, "") for key in fields})
+
+
 def next_id(items: List[Dict]) -> int:
     if not items:
         return 1
     return max(i.get("id", 0) for i in items) + 1
 
 
+@instrument.timed
 def delete_reading_item(item_id: int) -> None:
     """Delete a reading item by id from the CSV storage.
 
@@ -87,12 +188,14 @@ def delete_reading_item(item_id: int) -> None:
 
 
 # Listening section storage
+@instrument.timed
 def load_listening_items() -> List[Dict]:
     ensure_data_dir()
+    path = paths.current().listening_csv
     items: List[Dict] = []
-    if not os.path.exists(LISTENING_CSV):
+    if not os.path.exists(path):
         return items
-    with open(LISTENING_CSV, newline="", encoding="utf-8") as f:
+    with open(path, newline="", encoding="utf-8") as f:
         reader = csv.DictReader(f)
         for row in reader:
             try:
@@ -110,10 +213,11 @@ def load_listening_items() -> List[Dict]:
     return items
 
 
+@instrument.timed
 def save_listening_items(items: List[Dict]) -> None:
     ensure_data_dir()
     fieldnames = ["id", "url", "right_answers", "day"]
-    with open(LISTENING_CSV, "w", newline="", encoding="utf-8") as f:
+    with open(paths.current().listening_csv, "w", newline="", encoding="utf-8") as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
         for it in sorted(items, key=lambda x: x["id"]):
@@ -127,6 +231,7 @@ def save_listening_items(items: List[Dict]) -> None:
             )
 
 
+@instrument.timed
 def delete_listening_item(item_id: int) -> None:
     items = load_listening_items()
     filtered = [it for it in items if it.get("id") != item_id]
@@ -134,12 +239,14 @@ def delete_listening_item(item_id: int) -> None:
 
 
 # Speaking section storage (no right_answers column)
+@instrument.timed
 def load_speaking_items() -> List[Dict]:
     ensure_data_dir()
+    path = paths.current().speaking_csv
     items: List[Dict] = []
-    if not os.path.exists(SPEAKING_CSV):
+    if not os.path.exists(path):
         return items
-    with open(SPEAKING_CSV, newline="", encoding="utf-8") as f:
+    with open(path, newline="", encoding="utf-8") as f:
         reader = csv.DictReader(f)
         for row in reader:
             try:
@@ -156,10 +263,11 @@ def load_speaking_items() -> List[Dict]:
     return items
 
 
+@instrument.timed
 def save_speaking_items(items: List[Dict]) -> None:
     ensure_data_dir()
     fieldnames = ["id", "url", "day"]
-    with open(SPEAKING_CSV, "w", newline="", encoding="utf-8") as f:
+    with open(paths.current().speaking_csv, "w", newline="", encoding="utf-8") as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
         for it in sorted(items, key=lambda x: x["id"]):
@@ -171,16 +279,18 @@ def save_speaking_items(items: List[Dict]) -> None:
                 }
             )
             
+@instrument.timed
 def write_speaking_items(items: List[Dict]) -> None:
-    _ensure_data_dir()
+    ensure_data_dir()
     fieldnames = ["id", "url", "day"]
-    with open(SPEAKING_CSV, "w", newline="", encoding="utf-8") as f:
+    with open(paths.current().speaking_csv, "w", newline="", encoding="utf-8") as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
         for it in sorted(items, key=lambda r: r["id"]):
             writer.writerow({"id": int(it["id"]), "url": it.get("url", ""), "day": it.get("day", "")})
 
 
+@instrument.timed
 def delete_speaking_item(item_id: int) -> None:
     items = load_speaking_items()
     filtered = [it for it in items if it.get("id") != item_id]
@@ -189,10 +299,65 @@ def delete_speaking_item(item_id: int) -> None:
 
 def speaking_audio_dir() -> str:
     """Return path to the directory where speaking recordings are stored."""
-    ensure_data_dir()
-    return SPEAKING_AUDIO_DIR
+    registry = paths.current()
+    return registry.ensure_dir(registry.speaking_audio_dir)
 
 def next_speaking_id(items: List[Dict]) -> int:
     if not items:
         return 1
-    return max(int(it["id"]) for it in items) + 1
\ No newline at end of file
+    return max(int(it["id"]) for it in items) + 1
+
+
+# Writing section storage: prompts in writing.csv, one draft file per item
+@instrument.timed
+def load_writing_items() -> List[Dict]:
+    ensure_data_dir()
+    items = list(iter_items("writing"))
+    items.sort(key=lambda x: x["id"])
+    return items
+
+
+@instrument.timed
+def write_writing_items(items: List[Dict]) -> None:
+    ensure_data_dir()
+    fieldnames = SECTION_FIELDS["writing"]
+    with open(paths.current().writing_csv, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for it in sorted(items, key=lambda x: x["id"]):
+            writer.writerow({"id": int(it["id"]), "url": it.get("url", ""), "day": it.get("day", "")})
+
+
+def delete_writing_item(item_id: int) -> None:
+    items = load_writing_items()
+    filtered = [it for it in items if it.get("id") != item_id]
+    write_writing_items(filtered)
+    try:
+        os.remove(writing_draft_path(item_id))
+    except FileNotFoundError:
+        pass
+
+
+def writing_draft_path(item_id: int) -> str:
+    registry = paths.current()
+    return os.path.join(registry.writing_drafts_dir, f"essay_{int(item_id)}.txt")
+
+
+def load_writing_draft(item_id: int) -> str:
+    try:
+        with open(writing_draft_path(item_id), encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        return ""
+
+
+@instrument.timed
+def save_writing_draft(item_id: int, text: str) -> None:
+    """Write a draft atomically (temp file + rename) so a crash never truncates it."""
+    registry = paths.current()
+    registry.ensure_dir(registry.writing_drafts_dir)
+    path = writing_draft_path(item_id)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
@@ -0,0 +1,253 @@
+"""Compare two takes of the same Speaking item.
+
+Each take is decimated to ``FEATURE_RATE`` and cut into 20 ms frames. A
+frame is described by MFCC-like coefficients (the DCT of log mel band
+energies from one NumPy FFT over all frames) plus its normalized log energy.
+Frames far below the take's loudest level are marked as pauses.
+
+The two feature sequences are aligned with dynamic time warping restricted
+to a Sakoe-Chiba band around the rescaled diagonal. Only the band is stored,
+as float32 (an N x (2w+1) array instead of N x M). Aligning 3000 against 3300
+frames (60 and 66 seconds) peaks at about 12 MB instead of the roughly 40 MB
+a full float32 matrix would take. Each row is solved in one vectorized
+step: the horizontal-step dependency within a row becomes a running minimum
+(``np.minimum.accumulate``) over cumulative costs.
+
+The warping path shows where the second take was slower or faster than the
+first (sustained slope changes) and which pauses appear, disappear or
+change length between them.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+import pitch
+import recordings
+
+
+FEATURE_RATE = 16000
+HOP_S = 0.020
+FRAME_S = 0.032
+MEL_BANDS = 24
+CEPSTRA = 12
+PAUSE_DB = -35.0  # below the take's loud (95th percentile) level
+MIN_PAUSE_S = 0.3
+BAND_FRACTION = 0.15  # band half-width as a share of the longer take
+MIN_BAND = 25  # frames
+PACE_WINDOW_S = 2.0
+PACE_THRESHOLD = 0.25  # report stretches at least 25% slower or faster
+MIN_PACE_S = 1.5
+PAUSE_CHANGE_S = 0.3
+
+
+# ----- Features -----
+
+
+def _mel_filterbank(samplerate: int, n_fft: int) -> np.ndarray:
+    def hz_to_mel(hz):
+        return 2595.0 * np.log10(1.0 + np.asarray(hz) / 700.0)
+
+    edges_mel = np.linspace(hz_to_mel(60.0), hz_to_mel(min(7600.0, samplerate / 2)), MEL_BANDS + 2)
+    edges_hz = 700.0 * (10.0 ** (edges_mel / 2595.0) - 1.0)
+    bins = np.fft.rfftfreq(n_fft, 1.0 / samplerate)
+    low, mid, high = edges_hz[:-2, None], edges_hz[1:-1, None], edges_hz[2:, None]
+    rising = (bins - low) / (mid - low)
+    falling = (high - bins) / (high - mid)
+    return np.maximum(0.0, np.minimum(rising, falling)).astype(np.float32)  # (bands, bins)
+
+
+def features(x: np.ndarray, samplerate: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-frame feature matrix (frames x CEPSTRA+1) and pause mask of a mono signal."""
+    from scipy import fft
+
+    x, samplerate = pitch.decimate(np.asarray(x, dtype=np.float32), samplerate, FEATURE_RATE)
+    hop = int(HOP_S * samplerate)
+    size = int(FRAME_S * samplerate)
+    if len(x) < size:
+        return np.zeros((0, CEPSTRA + 1), np.float32), np.zeros(0, bool)
+    frames = np.lib.stride_tricks.sliding_window_view(x, size)[::hop] * np.hanning(size).astype(np.float32)
+    n_fft = 1 << int(np.ceil(np.log2(size)))
+    power = np.square(np.abs(fft.rfft(frames, n_fft)))
+    bands = np.log(power @ _mel_filterbank(samplerate, n_fft).T + 1e-10)
+    cepstra = fft.dct(bands, type=2, norm="ortho", axis=1)[:, 1 : CEPSTRA + 1]
+
+    level = 10.0 * np.log10(power.sum(axis=1) + 1e-12)
+    pause = level < np.percentile(level, 95) + PAUSE_DB
+    feats = np.column_stack([cepstra, level / 10.0])
+    # Per-take normalization so microphone and loudness differences do not dominate
+    feats = (feats - feats.mean(axis=0)) / (feats.std(axis=0) + 1e-6)
+    return feats.astype(np.float32), pause
+
+
+def load_features(path: str) -> Tuple[np.ndarray, np.ndarray]:
+    clip = recordings.open_recording(path)
+    try:
+        data = clip.read(0, clip.frames)
+        return features(data.mean(axis=1), clip.samplerate)
+    finally:
+        clip.close()
+
+
+# ----- Banded DTW -----
+
+
+def band_limits(n: int, m: int, radius: int) -> Tuple[np.ndarray, np.ndarray]:
+    """First and last column (inclusive) of the band in each row."""
+    centre = np.round(np.arange(n) * ((m - 1) / max(1, n - 1))).astype(np.int64)
+    radius = max(radius, int(np.ceil(m / max(1, n))) + 1)  # consecutive rows must overlap
+    return np.maximum(0, centre - radius), np.minimum(m - 1, centre + radius)
+
+
+def dtw(a: np.ndarray, b: np.ndarray, radius: int) -> Tuple[np.ndarray, float]:
+    """Align feature sequences ``a`` (n x d) and ``b`` (m x d) within a band.
+
+    Returns the warping path as an (L x 2) array of (i, j) pairs and the
+    path cost divided by its length.
+    """
+    n, m = len(a), len(b)
+    lo, hi = band_limits(n, m, radius)
+    width = int((hi - lo).max()) + 1
+    # Rows are computed in float64 (prev holds the last one); only the stored band is float32
+    acc = np.full((n, width), np.inf, dtype=np.float32)  # acc[i, j - lo[i]]
+
+    prev = None
+    for i in range(n):
+        count = hi[i] - lo[i] + 1
+        cost = np.sqrt(np.square(b[lo[i] : hi[i] + 1] - a[i]).sum(axis=1))
+        if prev is None:
+            row = np.cumsum(cost)  # first row: horizontal steps only
+        else:
+            p_lo, p_row = prev
+            # Previous row over columns lo-1 .. hi; diagonal predecessors are
+            # ext[:-1], vertical ones ext[1:]
+            ext = np.full(count + 1, np.inf)
+            start, end = max(p_lo, lo[i] - 1), min(p_lo + len(p_row), hi[i] + 1)
+            ext[start - lo[i] + 1 : end - lo[i] + 1] = p_row[start - p_lo : end - p_lo]
+            entry = np.minimum(ext[:-1], ext[1:])
+            # Horizontal steps: row[j] = min_k<=j (entry[k] + cost[k..j]) as a running minimum
+            csum = np.cumsum(cost)
+            row = csum + np.minimum.accumulate(entry - (csum - cost))
+        acc[i, :count] = row
+        prev = (lo[i], row)
+
+    path = _backtrack(acc, lo, hi)
+    return path, float(prev[1][-1] / len(path))
+
+
+def _backtrack(acc: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    def value(i: int, j: int) -> float:
+        if i < 0 or j < lo[i] or j > hi[i]:
+            return np.inf
+        return acc[i, j - lo[i]]
+
+    i, j = len(acc) - 1, int(hi[-1])
+    path = [(i, j)]
+    while i > 0 or j > 0:
+        steps = ((value(i - 1, j - 1), i - 1, j - 1), (value(i - 1, j), i - 1, j), (value(i, j - 1), i, j - 1))
+        _, i, j = min(steps, key=lambda s: s[0])
+        path.append((i, j))
+    return np.array(path[::-1], dtype=np.int64)
+
+
+# ----- Report -----
+
+
+def _runs(mask: np.ndarray, min_frames: int) -> List[Tuple[int, int]]:
+    """[start, end) of True runs at least ``min_frames`` long."""
+    edges = np.flatnonzero(np.diff(np.concatenate([[0], mask.astype(np.int8), [0]])))
+    return [(int(s), int(e)) for s, e in zip(edges[::2], edges[1::2]) if e - s >= min_frames]
+
+
+def _summary(feats: np.ndarray, pause: np.ndarray) -> Dict:
+    pauses = _runs(pause, int(MIN_PAUSE_S / HOP_S))
+    # Leading/trailing silence is not a pause in the answer
+    pauses = [(s, e) for s, e in pauses if s > 0 and e < len(pause)]
+    paused = sum(e - s for s, e in pauses) * HOP_S
+    return {
+        "duration_s": round(len(feats) * HOP_S, 2),
+        "speech_s": round(float((~pause).sum()) * HOP_S, 2),
+        "pauses": len(pauses),
+        "pause_s": round(paused, 2),
+        "pause_runs": pauses,
+    }
+
+
+def _pace_segments(path: np.ndarray, n: int) -> List[Dict]:
+    """Stretches where take B runs noticeably slower or faster than take A."""
+    # For each frame of A, the mean matching frame of B
+    counts = np.bincount(path[:, 0], minlength=n)
+    mapped = np.bincount(path[:, 0], weights=path[:, 1], minlength=n) / np.maximum(counts, 1)
+    half = max(1, int(PACE_WINDOW_S / HOP_S / 2))
+    if n <= 2 * half:
+        return []
+    slope = np.full(n, 1.0)
+    slope[half:-half] = (mapped[2 * half :] - mapped[: -2 * half]) / (2 * half)
+    segments = []
+    for sign, mask in (("slower", slope > 1 + PACE_THRESHOLD), ("faster", slope < 1 - PACE_THRESHOLD)):
+        for s, e in _runs(mask, int(MIN_PACE_S / HOP_S)):
+            segments.append(
+                {
+                    "kind": sign,
+                    "a_start": s * HOP_S,
+                    "a_end": e * HOP_S,
+                    "b_start": float(mapped[s]) * HOP_S,
+                    "b_end": float(mapped[e - 1]) * HOP_S,
+                    "ratio": round(float(slope[s:e].mean()), 2),
+                }
+            )
+    segments.sort(key=lambda seg: seg["a_start"])
+    return segments
+
+
+def _pause_changes(path: np.ndarray, a: Dict, b: Dict) -> List[Dict]:
+    """Pauses present in only one take, or much longer/shorter in B."""
+    a_to_b = np.zeros(path[-1, 0] + 1, dtype=np.int64)
+    a_to_b[path[:, 0]] = path[:, 1]  # last match per A frame
+    b_to_a = np.zeros(path[-1, 1] + 1, dtype=np.int64)
+    b_to_a[path[::-1, 1]] = path[::-1, 0]  # first match per B frame
+    changes = []
+    matched_b = set()
+    for s, e in a["pause_runs"]:
+        bs, be = int(a_to_b[s]), int(a_to_b[e - 1]) + 1
+        overlap = []
+        for k, (ps, pe) in enumerate(b["pause_runs"]):
+            if ps < be and pe > bs:
+                overlap.append((ps, pe))
+                matched_b.add(k)
+        a_len = (e - s) * HOP_S
+        if not overlap:
+            changes.append({"kind": "only_a", "a_time": s * HOP_S, "b_time": bs * HOP_S, "a_len": a_len, "b_len": 0.0})
+            continue
+        b_len = sum(pe - ps for ps, pe in overlap) * HOP_S
+        if abs(b_len - a_len) >= PAUSE_CHANGE_S:
+            changes.append(
+                {"kind": "longer" if b_len > a_len else "shorter", "a_time": s * HOP_S, "b_time": overlap[0][0] * HOP_S, "a_len": a_len, "b_len": b_len}
+            )
+    for k, (ps, pe) in enumerate(b["pause_runs"]):
+        if k not in matched_b:
+            changes.append({"kind": "only_b", "a_time": int(b_to_a[ps]) * HOP_S, "b_time": ps * HOP_S, "a_len": 0.0, "b_len": (pe - ps) * HOP_S})
+    changes.sort(key=lambda c: c["a_time"])
+    return changes
+
+
+def compare_features(fa: np.ndarray, pa: np.ndarray, fb: np.ndarray, pb: np.ndarray) -> Dict:
+    a, b = _summary(fa, pa), _summary(fb, pb)
+    if not len(fa) or not len(fb):
+        return {"a": a, "b": b, "distance": None, "pace": [], "pauses": []}
+    radius = max(MIN_BAND, int(BAND_FRACTION * max(len(fa), len(fb))))
+    path, distance = dtw(fa, fb, radius)
+    return {
+        "a": a,
+        "b": b,
+        "distance": round(distance, 3),
+        "pace": _pace_segments(path, len(fa)),
+        "pauses": _pause_changes(path, a, b),
+    }
+
+
+def compare(path_a: str, path_b: str) -> Dict:
+    """Align take B against take A and report pace and pause differences."""
+    return compare_features(*load_features(path_a), *load_features(path_b))
@@ -0,0 +1,86 @@
+"""Incremental word/sentence statistics for the essay editor.
+
+Statistics are kept per line. When the editor reports that lines
+``first..last`` were replaced, only those lines are re-tokenized and their
+old counts subtracted, so a keystroke costs O(length of the edited line)
+instead of O(essay).
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from typing import List, Sequence
+
+
+WORD_RE = re.compile(r"[A-Za-z0-9]+(?:['’-][A-Za-z0-9]+)*")
+SENTENCE_END_RE = re.compile(r"[.!?]+(?=[\s\"')\]”]|$)")
+
+
+class LineStats:
+    __slots__ = ("words", "terminators", "open_tail", "blank")
+
+    def __init__(self, line: str):
+        self.words = Counter(w.lower() for w in WORD_RE.findall(line))
+        ends = list(SENTENCE_END_RE.finditer(line))
+        self.terminators = len(ends)
+        tail = line[ends[-1].end():] if ends else line
+        # Words after the last terminator belong to a sentence still being written
+        self.open_tail = WORD_RE.search(tail) is not None
+        self.blank = not line.strip()
+
+
+class IncrementalTextStats:
+    def __init__(self, text: str = ""):
+        self.reset(text)
+
+    def reset(self, text: str) -> None:
+        self._lines: List[LineStats] = []
+        self._vocab: Counter = Counter()
+        self.word_count = 0
+        self.terminators = 0
+        self.replace_lines(0, -1, text.split("\n"))
+
+    def replace_lines(self, first: int, last: int, new_lines: Sequence[str]) -> None:
+        """Replace lines ``first..last`` (0-based, inclusive) with ``new_lines``.
+
+        ``last = first - 1`` inserts without removing anything.
+        """
+        removed = set()
+        for old in self._lines[first:last + 1]:
+            self._vocab.subtract(old.words)
+            removed.update(old.words)
+            self.word_count -= sum(old.words.values())
+            self.terminators -= old.terminators
+        fresh = [LineStats(line) for line in new_lines]
+        for new in fresh:
+            self._vocab.update(new.words)
+            self.word_count += sum(new.words.values())
+            self.terminators += new.terminators
+        self._lines[first:last + 1] = fresh
+        # Counter.subtract leaves zero entries behind; prune only the words touched here
+        for word in removed:
+            if self._vocab[word] <= 0:
+                del self._vocab[word]
+
+    @property
+    def line_count(self) -> int:
+        return len(self._lines)
+
+    @property
+    def unique_words(self) -> int:
+        return len(self._vocab)
+
+    @property
+    def sentence_count(self) -> int:
+        # An unterminated final sentence still counts
+        for line in reversed(self._lines):
+            if line.blank:
+                continue
+            return self.terminators + (1 if line.open_tail else 0)
+        return self.terminators
+
+    @property
+    def lexical_diversity(self) -> float:
+        """Type/token ratio: distinct words over total words."""
+        return self.unique_words / self.word_count if self.word_count else 0.0
@@ -0,0 +1,78 @@
+"""Append-only log of timed practice segments.
+
+Each line of ``practice_timing.jsonl`` in the data root is one segment:
+
+    {"section": "reading", "item_id": 3, "start": "2025-09-01T10:02:11", "seconds": 1043.2}
+
+Segments are buffered in memory and appended in one write when the buffer
+fills, when a screen is left, or at exit.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import threading
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+import paths
+
+
+FLUSH_EVERY = 20
+MIN_SEGMENT_SECONDS = 1.0
+
+
+class TimingLog:
+    def __init__(self, flush_every: int = FLUSH_EVERY):
+        self.flush_every = flush_every
+        self._pending: List[Dict] = []
+        self._lock = threading.Lock()
+
+    def record(self, section: str, item_id: Optional[int], start: float, seconds: float) -> None:
+        """Buffer one segment; ``start`` is a wall-clock timestamp."""
+        if seconds < MIN_SEGMENT_SECONDS:
+            return
+        entry = {
+            "section": section,
+            "item_id": item_id,
+            "start": datetime.fromtimestamp(start).isoformat(timespec="seconds"),
+            "seconds": round(seconds, 1),
+        }
+        with self._lock:
+            self._pending.append(entry)
+            full = len(self._pending) >= self.flush_every
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return
+        registry = paths.current()
+        registry.ensure_dir(registry.root)
+        with open(registry.timing_log, "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(e) + "\n" for e in pending))
+
+
+def iter_segments(section: Optional[str] = None) -> Iterator[Dict]:
+    """Stream logged segments (flushed ones only), optionally for one section."""
+    try:
+        f = open(paths.current().timing_log, encoding="utf-8")
+    except FileNotFoundError:
+        return
+    with f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if section is None or entry.get("section") == section:
+                yield entry
+
+
+# App-wide log shared by the section screens
+timing_log = TimingLog()
+atexit.register(timing_log.flush)
+paths.on_release(timing_log.flush)
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+
+"""Bulk import/export of section items.
+
+Supported formats (picked from the file extension unless --format is given):
+
+- csv:   same columns as the section files under data/
+- jsonl: one JSON object per line
+- tpcol: compact binary columnar blocks for fast reload
+
+All readers and writers stream records; imports are validated with the same
+rules as the section screens and appended to storage in batches.
+
+Usage:
+    python src/transfer.py export reading reading.jsonl
+    python src/transfer.py import listening bank.csv --batch-size 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import struct
+import sys
+import zlib
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import paths
+import profiles
+import storage
+
+
+FORMATS = ("csv", "jsonl", "tpcol")
+DEFAULT_BATCH_SIZE = 500
+
+COLUMNAR_MAGIC = b"TPCOL\x01"
+COLUMNAR_BLOCK_ROWS = 4096
+INT_FIELDS = {"id", "right_answers"}
+
+
+def detect_format(path: str) -> str:
+    lower = path.lower()
+    if lower.endswith(".csv"):
+        return "csv"
+    if lower.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    if lower.endswith(".tpcol"):
+        return "tpcol"
+    raise ValueError(f"Cannot infer format from '{path}'; use one of: {', '.join(FORMATS)}")
+
+
+class ImportInterrupted(Exception):
+    """The input broke off partway; earlier batches are already stored."""
+
+    def __init__(self, cause: Exception, imported: int, last_record: int):
+        super().__init__(str(cause))
+        self.imported = imported
+        self.last_record = last_record
+
+
+# ----- Readers: yield (record number, raw record) -----
+
+class MalformedRecord:
+    """Stands in for a record that could not be parsed; the import reports ``reason``."""
+
+    def __init__(self, reason: str):
+        self.reason = reason
+
+
+def iter_csv(path: str) -> Iterator[Tuple[int, Dict]]:
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            yield reader.line_num, row
+
+
+def iter_jsonl(path: str) -> Iterator[Tuple[int, Dict]]:
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield line_no, MalformedRecord(f"not valid JSON ({e})")
+                continue
+            if not isinstance(record, dict):
+                yield line_no, MalformedRecord(f"expected a JSON object, got {type(record).__name__}")
+                continue
+            yield line_no, record
+
+
+def iter_columnar(path: str) -> Iterator[Tuple[int, Dict]]:
+    with open(path, "rb") as f:
+        fields = _read_columnar_header(f)
+        record_no = 0
+        while True:
+            (count,) = struct.unpack("<I", _read_exact(f, 4))
+            if count == 0:
+                return
+            columns = [_read_column(f, field, count) for field in fields]
+            for values in zip(*columns):
+                record_no += 1
+                yield record_no, dict(zip(fields, values))
+
+
+def iter_records(path: str, fmt: Optional[str] = None) -> Iterator[Tuple[int, Dict]]:
+    fmt = fmt or detect_format(path)
+    if fmt == "csv":
+        return iter_csv(path)
+    if fmt == "jsonl":
+        return iter_jsonl(path)
+    if fmt == "tpcol":
+        return iter_columnar(path)
+    raise ValueError(f"Unknown format '{fmt}'")
+
+
+# ----- Writers -----
+
+def write_csv(path: str, fields: List[str], items: Iterable[Dict]) -> int:
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        for it in items:
+            writer.writerow({key: it.get(key, "") for key in fields})
+            count += 1
+    return count
+
+
+def write_jsonl(path: str, fields: List[str], items: Iterable[Dict]) -> int:
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for it in items:
+            f.write(json.dumps({key: it.get(key, "") for key in fields}, ensure_ascii=False))
+            f.write("\n")
+            count += 1
+    return count
+
+
+def write_columnar(path: str, fields: List[str], items: Iterable[Dict]) -> int:
+    """Write items as zlib-compressed column blocks of COLUMNAR_BLOCK_ROWS rows.
+
+    Layout: magic, u32 header length + JSON header, then blocks made of a u32
+    row count followed by one u32-length-prefixed compressed payload per
+    column. Integer columns are little-endian int64; text columns are u32
+    byte lengths followed by the concatenated UTF-8 data. A zero row count
+    ends the file.
+    """
+    count = 0
+    with open(path, "wb") as f:
+        header = json.dumps({"fields": fields}).encode("utf-8")
+        f.write(COLUMNAR_MAGIC)
+        f.write(struct.pack("<I", len(header)))
+        f.write(header)
+        block: List[Dict] = []
+        for it in items:
+            block.append(it)
+            if len(block) >= COLUMNAR_BLOCK_ROWS:
+                count += _write_block(f, fields, block)
+                block = []
+        if block:
+            count += _write_block(f, fields, block)
+        f.write(struct.pack("<I", 0))
+    return count
+
+
+def write_items(path: str, fields: List[str], items: Iterable[Dict], fmt: Optional[str] = None) -> int:
+    fmt = fmt or detect_format(path)
+    writer = {"csv": write_csv, "jsonl": write_jsonl, "tpcol": write_columnar}.get(fmt)
+    if writer is None:
+        raise ValueError(f"Unknown format '{fmt}'")
+    return writer(path, fields, items)
+
+
+# ----- Columnar helpers -----
+
+def _write_block(f, fields: List[str], block: List[Dict]) -> int:
+    f.write(struct.pack("<I", len(block)))
+    for field in fields:
+        if field in INT_FIELDS:
+            values = array("q", (int(it.get(field, 0) or 0) for it in block))
+            if sys.byteorder == "big":
+                values.byteswap()
+            raw = values.tobytes()
+        else:
+            encoded = [str(it.get(field, "")).encode("utf-8") for it in block]
+            lengths = array("I", (len(b) for b in encoded))
+            if sys.byteorder == "big":
+                lengths.byteswap()
+            raw = lengths.tobytes() + b"".join(encoded)
+        payload = zlib.compress(raw, 6)
+        f.write(struct.pack("<I", len(payload)))
+        f.write(payload)
+    return len(block)
+
+
+def _read_columnar_header(f) -> List[str]:
+    if _read_exact(f, len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+        raise ValueError("Not a TOEFL Prep columnar file")
+    (size,) = struct.unpack("<I", _read_exact(f, 4))
+    header = json.loads(_read_exact(f, size).decode("utf-8"))
+    if not isinstance(header, dict) or not isinstance(header.get("fields"), list):
+        raise ValueError("Corrupt columnar file header")
+    return list(header["fields"])
+
+
+def _read_column(f, field: str, count: int) -> list:
+    (size,) = struct.unpack("<I", _read_exact(f, 4))
+    raw = zlib.decompress(_read_exact(f, size))
+    if field in INT_FIELDS:
+        values = array("q")
+        values.frombytes(raw)
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values.tolist()
+    lengths = array("I")
+    lengths.frombytes(raw[: 4 * count])
+    if sys.byteorder == "big":
+        lengths.byteswap()
+    out = []
+    pos = 4 * count
+    for n in lengths:
+        out.append(raw[pos : pos + n].decode("utf-8"))
+        pos += n
+    return out
+
+
+def _read_exact(f, n: int) -> bytes:
+    data = f.read(n)
+    if len(data) != n:
+        raise ValueError("Truncated columnar file")
+    return data
+
+
+# ----- Commands -----
+
+def export_section(section: str, path: str, fmt: Optional[str] = None) -> int:
+    """Stream all stored items of a section to a file. Returns the row count."""
+    return write_items(path, storage.SECTION_FIELDS[section], storage.iter_items(section), fmt)
+
+
+def import_section(
+    section: str,
+    path: str,
+    fmt: Optional[str] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Tuple[int, List[Tuple[int, str]]]:
+    """Validate and append records from a file to a section.
+
+    Records keep their id unless it is missing or already used, in which
+    case they get the next free id. Returns (imported count, [(record
+    number, error message), ...]).
+
+    Batches are committed as they fill, so if the file turns out to be
+    corrupt further on, ``ImportInterrupted`` reports how many items were
+    already stored.
+    """
+    used_ids = {it["id"] for it in storage.iter_items(section)}
+    next_free = max(used_ids, default=0) + 1
+    imported = 0
+    errors: List[Tuple[int, str]] = []
+    batch: List[Dict] = []
+    record_no = 0
+
+    try:
+        for record_no, raw in iter_records(path, fmt):
+            if isinstance(raw, MalformedRecord):
+                errors.append((record_no, raw.reason))
+                continue
+            try:
+                item_id = int(str(raw.get("id", "")).strip() or 0)
+            except ValueError:
+                item_id = 0
+            if item_id <= 0 or item_id in used_ids:
+                item_id = next_free
+            try:
+                item = storage.validate_item(section, item_id, raw)
+            except storage.ItemValidationError as e:
+                errors.append((record_no, str(e)))
+                continue
+            used_ids.add(item_id)
+            next_free = max(next_free, item_id + 1)
+            batch.append(item)
+            if len(batch) >= batch_size:
+                storage.append_items(section, batch)
+                imported += len(batch)
+                batch = []
+    except (ValueError, struct.error, zlib.error) as e:
+        if imported:
+            raise ImportInterrupted(e, imported, record_no) from e
+        raise
+
+    if batch:
+        storage.append_items(section, batch)
+        imported += len(batch)
+    return imported, errors
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Import or export TOEFL Prep section items.")
+    parser.add_argument("--data-dir", default=None, help="data root directory")
+    parser.add_argument("--user", default=None, help="profile to read or write (default: the base data root)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    for name in ("import", "export"):
+        cmd = sub.add_parser(name)
+        cmd.add_argument("section", choices=storage.SECTIONS)
+        cmd.add_argument("path")
+        cmd.add_argument("--format", choices=FORMATS, default=None)
+        if name == "import":
+            cmd.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args(argv)
+    paths.configure(args.data_dir)
+    if args.user:
+        if args.user not in profiles.list_profiles():
+            parser.error(f"unknown profile '{args.user}'")
+        paths.configure(profiles.profile_root(args.user))
+
+    try:
+        if args.command == "export":
+            count = export_section(args.section, args.path, args.format)
+            print(f"Exported {count} {args.section} items to {args.path}")
+            return 0
+        imported, errors = import_section(args.section, args.path, args.format, args.batch_size)
+    except ImportInterrupted as e:
+        print(
+            f"Error after record {e.last_record}: {e}\n"
+            f"{e.imported} {args.section} items read before the error were already imported and kept.",
+            file=sys.stderr,
+        )
+        return 1
+    except (OSError, ValueError, struct.error, zlib.error) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    for record_no, message in errors:
+        print(f"Skipped record {record_no}: {message}", file=sys.stderr)
+    print(f"Imported {imported} {args.section} items from {args.path} ({len(errors)} skipped)")
+    return 0 if not errors else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,239 @@
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import tkinter as tk
+from tkinter import ttk
+
+
+class GridColumn:
+    """Describe one column of an EditableGrid.
+
+    editor is None for read-only columns, "entry" for free text or
+    "spinbox" for non-negative integers.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        title: str,
+        width: int = 100,
+        editor: Optional[str] = None,
+        stretch: bool = False,
+        anchor: str = "w",
+    ):
+        self.key = key
+        self.title = title
+        self.width = width
+        self.editor = editor
+        self.stretch = stretch
+        self.anchor = anchor
+
+
+_MODIFIERS = ("Control-", "Alt-", "Command-", "Meta-", "Option-")
+
+
+def _has_modifier(sequence: str) -> bool:
+    return any(m in sequence for m in _MODIFIERS)
+
+
+class EditableGrid(ttk.Frame):
+    """Editable table on a single ttk.Treeview.
+
+    Cells are edited in place through one overlay editor placed over the
+    active cell, so the widget count stays the same whatever the number of
+    rows. Row actions (Save, Delete, ...) are buttons and optional keyboard
+    shortcuts acting on the selected row.
+    """
+
+    def __init__(
+        self,
+        parent: tk.Widget,
+        columns: Sequence[GridColumn],
+        actions: Sequence[Tuple[str, Callable[[int], None], Optional[str]]] = (),
+        on_edit: Optional[Callable[[int, str, str], None]] = None,
+        height: int = 12,
+    ):
+        super().__init__(parent)
+        self.columns = list(columns)
+        self.on_edit = on_edit
+        self._by_key = {c.key: c for c in self.columns}
+        self._editing: Optional[Tuple[str, str]] = None  # (iid, column key)
+        self._editor: Optional[ttk.Entry] = None
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        self.tree = ttk.Treeview(
+            self,
+            columns=[c.key for c in self.columns],
+            show="headings",
+            selectmode="browse",
+            height=height,
+        )
+        for col in self.columns:
+            self.tree.heading(col.key, text=col.title, anchor="w")
+            self.tree.column(col.key, width=col.width, stretch=col.stretch, anchor=col.anchor)
+        self.tree.tag_configure("dirty", background="#fff4d6")
+
+        scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        scrollbar.grid(row=0, column=1, sticky="ns")
+
+        # Shared overlay editors; only one is placed at a time
+        self._entry = ttk.Entry(self.tree)
+        self._spinbox = ttk.Spinbox(self.tree, from_=0, to=999)
+        for editor in (self._entry, self._spinbox):
+            editor.bind("<Return>", lambda e: self._commit_edit())
+            editor.bind("<KP_Enter>", lambda e: self._commit_edit())
+            editor.bind("<Escape>", lambda e: self._cancel_edit())
+            editor.bind("<FocusOut>", lambda e: self._commit_edit())
+            editor.bind("<Tab>", self._on_tab)
+
+        self.tree.bind("<Double-1>", self._on_double_click)
+        self.tree.bind("<Return>", lambda e: self._edit_selected())
+        self.tree.bind("<F2>", lambda e: self._edit_selected())
+        self.tree.bind("<Configure>", lambda e: self._commit_edit())
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(seq, lambda e: self._commit_edit(), add="+")
+
+        # Action bar
+        if actions:
+            bar = ttk.Frame(self)
+            bar.grid(row=1, column=0, columnspan=2, sticky="e", pady=(6, 0))
+            for i, (label, callback, shortcut) in enumerate(actions):
+                btn = ttk.Button(bar, text=label, command=lambda cb=callback: self._run_action(cb))
+                btn.grid(row=0, column=i, padx=4)
+                if shortcut:
+                    # Plain keys (e.g. <Delete>) keep their editing meaning inside the cell editors
+                    widgets = (self.tree, self._entry, self._spinbox) if _has_modifier(shortcut) else (self.tree,)
+                    for widget in widgets:
+                        widget.bind(shortcut, lambda e, cb=callback: self._run_action(cb) or "break")
+
+    # ----- Rows -----
+
+    def set_rows(self, rows: List[Dict]) -> None:
+        """Replace all rows. Each row needs an "id" plus one value per column."""
+        self._cancel_edit()
+        self.tree.delete(*self.tree.get_children())
+        for row in rows:
+            self.tree.insert("", "end", iid=str(row["id"]), values=self._values(row))
+
+    def insert_row(self, row: Dict) -> None:
+        self.tree.insert("", "end", iid=str(row["id"]), values=self._values(row))
+
+    def update_row(self, row: Dict) -> None:
+        """Show the stored values of a row and clear its unsaved marker."""
+        iid = str(row["id"])
+        if self.tree.exists(iid):
+            self.tree.item(iid, values=self._values(row), tags=())
+
+    def delete_row(self, row_id: int) -> None:
+        iid = str(row_id)
+        if self._editing is not None and self._editing[0] == iid:
+            self._cancel_edit()
+        if self.tree.exists(iid):
+            self.tree.delete(iid)
+
+    def row_values(self, row_id: int) -> Dict[str, str]:
+        """Return the currently displayed (possibly edited) values of a row."""
+        return {key: str(value) for key, value in self.tree.set(str(row_id)).items()}
+
+    def selected_id(self) -> Optional[int]:
+        sel = self.tree.selection()
+        return int(sel[0]) if sel else None
+
+    def select(self, row_id: int) -> None:
+        iid = str(row_id)
+        self.tree.selection_set(iid)
+        self.tree.focus(iid)
+        self.tree.see(iid)
+
+    def edit_cell(self, row_id: int, key: str) -> None:
+        """Open the overlay editor on a cell."""
+        self._begin_edit(str(row_id), key)
+
+    def _values(self, row: Dict) -> Tuple:
+        return tuple(row.get(c.key, "") for c in self.columns)
+
+    # ----- In-place editing -----
+
+    def _on_double_click(self, event):
+        iid = self.tree.identify_row(event.y)
+        col_id = self.tree.identify_column(event.x)
+        if not iid or not col_id:
+            return
+        index = int(col_id.lstrip("#")) - 1
+        if 0 <= index < len(self.columns):
+            self._begin_edit(iid, self.columns[index].key)
+
+    def _edit_selected(self):
+        sel = self.tree.selection()
+        editable = [c for c in self.columns if c.editor]
+        if sel and editable:
+            self._begin_edit(sel[0], editable[0].key)
+        return "break"
+
+    def _begin_edit(self, iid: str, key: str) -> None:
+        self._commit_edit()
+        column = self._by_key.get(key)
+        if column is None or not column.editor:
+            return
+        self.tree.see(iid)
+        self.tree.update_idletasks()
+        bbox = self.tree.bbox(iid, key)
+        if not bbox:
+            return
+        x, y, w, h = bbox
+        editor = self._spinbox if column.editor == "spinbox" else self._entry
+        editor.delete(0, "end")
+        editor.insert(0, self.tree.set(iid, key))
+        editor.place(x=x, y=y, width=w, height=h)
+        editor.focus_set()
+        editor.select_range(0, "end")
+        self._editor = editor
+        self._editing = (iid, key)
+
+    def _commit_edit(self) -> None:
+        if self._editing is None or self._editor is None:
+            return
+        iid, key = self._editing
+        value = self._editor.get()
+        self._hide_editor()
+        if not self.tree.exists(iid) or self.tree.set(iid, key) == value:
+            return
+        self.tree.set(iid, key, value)
+        self.tree.item(iid, tags=("dirty",))
+        if self.on_edit is not None:
+            self.on_edit(int(iid), key, value)
+
+    def _cancel_edit(self) -> None:
+        self._hide_editor()
+
+    def _hide_editor(self) -> None:
+        editor = self._editor
+        self._editing = None
+        self._editor = None
+        if editor is not None:
+            had_focus = str(editor) == str(editor.tk.call("focus"))
+            editor.place_forget()
+            if had_focus:
+                self.tree.focus_set()
+
+    def _on_tab(self, event):
+        if self._editing is None:
+            return "break"
+        iid, key = self._editing
+        editable = [c.key for c in self.columns if c.editor]
+        self._commit_edit()
+        nxt = editable[(editable.index(key) + 1) % len(editable)]
+        self._begin_edit(iid, nxt)
+        return "break"
+
+    def _on_yview(self, *args):
+        self._commit_edit()
+        self.tree.yview(*args)
+
+    def _run_action(self, callback: Callable[[int], None]) -> None:
+        self._commit_edit()
+        row_id = self.selected_id()
+        if row_id is not None:
+            callback(row_id)
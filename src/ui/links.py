@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import pathlib
+import tkinter as tk
+import webbrowser
+from tkinter import messagebox
+from typing import Dict, Iterable
+
+import content_cache
+
+
+POLL_MS = 100
+PREFETCH_DUE = 5
+
+
+def open_link(widget: tk.Misc, url: str) -> None:
+    """Open a question link from the offline cache, downloading it first if needed.
+
+    The download runs on the cache's worker pool; when it fails the link is
+    handed to the browser as-is. An outdated copy is opened right away and
+    re-fetched in the background for next time.
+    """
+    url = (url or "").strip()
+    if not url:
+        messagebox.showinfo("Open Link", "This item has no link yet.", parent=widget)
+        return
+    cache = content_cache.cache()
+    local = cache.local_file(url)
+    if local is not None:
+        if cache.is_stale(url):
+            cache.fetch_async(url)
+        webbrowser.open(pathlib.Path(local).as_uri())
+        return
+    if not content_cache.fetchable(url):
+        webbrowser.open(url)
+        return
+    future = cache.fetch_async(url)
+
+    def check():
+        if not future.done():
+            widget.after(POLL_MS, check)
+            return
+        path = cache.local_file(url) if future.exception() is None else None
+        problem = cache.link_error(url) if path is None else None
+        if problem is not None:
+            messagebox.showwarning("Open Link", f"The link could not be downloaded ({problem}).", parent=widget)
+        webbrowser.open(pathlib.Path(path).as_uri() if path else url)
+
+    widget.after(POLL_MS, check)
+
+
+def prefetch_due(due_ids: Iterable[int], items: Iterable[Dict]) -> None:
+    """Download the links of the next few due items in the background."""
+    wanted = set(list(due_ids)[:PREFETCH_DUE])
+    if wanted:
+        content_cache.cache().prefetch(it.get("url", "") for it in items if it["id"] in wanted)
@@ -1,14 +1,79 @@
-from typing import Optional
+from typing import Callable, Optional, Set
+import sys
+import time
 import tkinter as tk
 from tkinter import ttk
 
 
+TICK_MS = 100
+
+
+class TimerService:
+    """Single shared ``after`` tick driving every active timer display.
+
+    Subscribers are callables taking the current ``time.monotonic()`` value.
+    The tick only runs while at least one subscriber is registered. A
+    subscriber that raises is reported and dropped; the others keep ticking.
+    """
+
+    def __init__(self, root: tk.Misc):
+        self.root = root
+        self._subscribers: Set[Callable[[float], None]] = set()
+        self._job: Optional[str] = None
+
+    def add(self, callback: Callable[[float], None]) -> None:
+        self._subscribers.add(callback)
+        if self._job is None:
+            self._job = self.root.after(TICK_MS, self._tick)
+
+    def remove(self, callback: Callable[[float], None]) -> None:
+        self._subscribers.discard(callback)
+        if not self._subscribers and self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+
+    def _tick(self) -> None:
+        self._job = None
+        now = time.monotonic()
+        for callback in list(self._subscribers):
+            if callback in self._subscribers:
+                try:
+                    callback(now)
+                except Exception:
+                    self._subscribers.discard(callback)
+                    self.root.report_callback_exception(*sys.exc_info())
+        if self._subscribers and self._job is None:
+            self._job = self.root.after(TICK_MS, self._tick)
+
+
+def timer_service(widget: tk.Misc) -> TimerService:
+    """Return the TimerService shared by all widgets of ``widget``'s Tk root."""
+    root = widget.nametowidget(".")
+    service = getattr(root, "_timer_service", None)
+    if service is None:
+        service = TimerService(root)
+        root._timer_service = service
+    return service
+
+
 class TimerWidget(ttk.Frame):
-    def __init__(self, parent: tk.Widget):
+    """Start/Pause/Reset stopwatch.
+
+    Elapsed time is computed from ``time.monotonic()`` rather than counted
+    per tick, so it never drifts; the label is only refreshed while visible.
+
+    ``on_segment(start, seconds)`` is called with the wall-clock start and
+    length of every running stretch when it ends (pause, reset or split).
+    """
+
+    def __init__(self, parent: tk.Widget, on_segment: Optional[Callable[[float, float], None]] = None):
         super().__init__(parent)
-        self.elapsed_seconds: int = 0
+        self.on_segment = on_segment
         self.running = False
-        self._tick_job: Optional[str] = None
+        self._accumulated = 0.0
+        self._started_at: Optional[float] = None
+        self._started_wall = 0.0
+        self._shown = ""
 
         self.time_label = ttk.Label(self, text=self._format_time(), font=("Segoe UI", 12, "bold"))
         self.time_label.grid(row=0, column=0, padx=(0, 6))
@@ -21,30 +86,71 @@ class TimerWidget(ttk.Frame):
         self.pause_btn.grid(row=0, column=2, padx=2)
         self.reset_btn.grid(row=0, column=3, padx=2)
 
-    def _format_time(self) -> str:
-        hrs = self.elapsed_seconds // 3600
-        mins = (self.elapsed_seconds % 3600) // 60
-        secs = self.elapsed_seconds % 60
+    def elapsed(self, now: Optional[float] = None) -> float:
+        """Return elapsed seconds, including the currently running stretch."""
+        if self._started_at is None:
+            return self._accumulated
+        return self._accumulated + ((now if now is not None else time.monotonic()) - self._started_at)
+
+    @property
+    def elapsed_seconds(self) -> int:
+        return int(self.elapsed())
+
+    def _format_time(self, now: Optional[float] = None) -> str:
+        total = int(self.elapsed(now))
+        hrs = total // 3600
+        mins = (total % 3600) // 60
+        secs = total % 60
         return f"{hrs:02d}:{mins:02d}:{secs:02d}"
 
-    def _tick(self):
-        if self.running:
-            self.elapsed_seconds += 1
-            self.time_label.configure(text=self._format_time())
-            self._tick_job = self.after(1000, self._tick)
+    def _refresh(self, now: Optional[float] = None) -> None:
+        text = self._format_time(now)
+        if text != self._shown:
+            self._shown = text
+            self.time_label.configure(text=text)
+
+    def _on_tick(self, now: float) -> None:
+        # Hidden screens keep counting but skip label updates; they catch up
+        # on the first tick after being shown again
+        if self.winfo_viewable():
+            self._refresh(now)
 
     def start(self):
         if not self.running:
             self.running = True
-            self._tick()
+            self._started_at = time.monotonic()
+            self._started_wall = time.time()
+            timer_service(self).add(self._on_tick)
 
     def pause(self):
-        self.running = False
-        if self._tick_job is not None:
-            self.after_cancel(self._tick_job)
-            self._tick_job = None
+        if self.running:
+            now = time.monotonic()
+            self._emit_segment(now)
+            self._accumulated = self.elapsed(now)
+            self._started_at = None
+            self.running = False
+            timer_service(self).remove(self._on_tick)
+        self._refresh()
+
+    def split(self):
+        """End the current segment and start a new one without stopping."""
+        if self.running:
+            now = time.monotonic()
+            self._emit_segment(now)
+            self._accumulated = self.elapsed(now)
+            self._started_at = now
+            self._started_wall = time.time()
+
+    def _emit_segment(self, now: float) -> None:
+        if self.on_segment is not None and self._started_at is not None:
+            self.on_segment(self._started_wall, now - self._started_at)
 
     def reset(self):
         self.pause()
-        self.elapsed_seconds = 0
-        self.time_label.configure(text=self._format_time())
+        self._accumulated = 0.0
+        self._refresh()
+
+    def destroy(self):
+        if self.running:
+            timer_service(self).remove(self._on_tick)
+        super().destroy()
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import tkinter as tk
+from typing import Callable, List, Optional
+
+
+class TrackedText(tk.Text):
+    """Text widget reporting which lines each edit replaced.
+
+    The widget's Tcl command is renamed and proxied, so every insert, delete
+    and replace (typing, paste, undo, programmatic edits) is seen. After each
+    change ``on_change(first, last, new_lines)`` is called with the 0-based
+    range of old lines that was replaced and the text of the lines now there.
+    """
+
+    EDIT_COMMANDS = ("insert", "delete", "replace")
+
+    def __init__(self, parent: tk.Widget, on_change: Optional[Callable[[int, int, List[str]], None]] = None, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.on_change = on_change
+        self._orig = self._w + "_orig"
+        self.tk.call("rename", self._w, self._orig)
+        self.tk.createcommand(self._w, self._proxy)
+
+    def _proxy(self, command, *args):
+        if command not in self.EDIT_COMMANDS or self.on_change is None:
+            return self.tk.call((self._orig, command) + args)
+
+        # Resolve the affected range in old coordinates before the edit runs
+        first = self._line(args[0])
+        if command == "insert":
+            last = first
+        elif command == "delete" and len(args) == 1:
+            last = self._line(f"{args[0]}+1c")
+        else:
+            last = self._line(args[1])
+        before = self._line("end-1c")
+
+        result = self.tk.call((self._orig, command) + args)
+
+        new_last = last + self._line("end-1c") - before
+        text = self.tk.call(self._orig, "get", f"{first}.0", f"{new_last}.end")
+        self.on_change(first - 1, last - 1, text.split("\n"))
+        return result
+
+    def _line(self, index: str) -> int:
+        return int(str(self.tk.call(self._orig, "index", index)).split(".")[0])
+
+    def destroy(self):
+        super().destroy()
+        try:
+            self.tk.deletecommand(self._w)
+        except tk.TclError:
+            pass
@@ -0,0 +1,146 @@
+"""Tk event-loop latency monitor.
+
+A probe is scheduled with ``after`` every few milliseconds and measures how
+late it fires. A sampling thread watches the probe heartbeat; once the loop
+has been blocked for longer than the threshold it captures the main thread's
+stack with ``sys._current_frames()``, so each stall is attributed to the
+handler that was running (e.g. ``_on_row_changed`` or ``_stop_record``).
+
+Enabled with ``main.py --watch-latency`` or TOEFL_PREP_WATCHDOG=1.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+from typing import Deque, Dict, Optional
+
+import instrument
+
+
+WATCHDOG_ENV = "TOEFL_PREP_WATCHDOG"
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+MAX_STALLS = 200
+
+
+class LatencyMonitor:
+    def __init__(self, root, interval_ms: int = 20, threshold_ms: int = 100, sample_ms: int = 10):
+        self.root = root
+        self.interval = interval_ms / 1000.0
+        self.threshold = threshold_ms / 1000.0
+        self.sample_interval = sample_ms / 1000.0
+        self.stalls: Deque[Dict] = deque(maxlen=MAX_STALLS)
+        self.probes = 0
+        self.max_lateness = 0.0
+
+        self._main_ident = threading.main_thread().ident
+        self._expected = 0.0
+        self._last_beat = 0.0
+        self._stack: Optional[traceback.StackSummary] = None  # captured during the current stall
+        self._job: Optional[str] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        now = time.monotonic()
+        self._last_beat = now
+        self._expected = now + self.interval
+        self._job = self.root.after(int(self.interval * 1000), self._probe)
+        self._thread = threading.Thread(target=self._sample_loop, name="tk-latency-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._job is not None:
+            try:
+                self.root.after_cancel(self._job)
+            except Exception:
+                pass
+            self._job = None
+
+    # ----- Tk side -----
+
+    def _probe(self) -> None:
+        now = time.monotonic()
+        lateness = max(0.0, now - self._expected)
+        self.probes += 1
+        self.max_lateness = max(self.max_lateness, lateness)
+        if instrument.enabled:
+            instrument.record("tk.event_loop_lateness", lateness)
+        if lateness >= self.threshold:
+            self._record_stall(lateness)
+        self._stack = None
+        self._last_beat = now
+        self._expected = now + self.interval
+        self._job = self.root.after(int(self.interval * 1000), self._probe)
+
+    def _record_stall(self, lateness: float) -> None:
+        stack = self._stack or traceback.StackSummary()
+        stall = {
+            "at": time.strftime("%H:%M:%S"),
+            "ms": lateness * 1000.0,
+            "culprit": _culprit(stack),
+            "stack": stack,
+        }
+        self.stalls.append(stall)
+        sys.stderr.write(f"[watchdog] Tk loop stalled {stall['ms']:.0f} ms in {stall['culprit']}\n")
+
+    # ----- Sampler thread -----
+
+    def _sample_loop(self) -> None:
+        while not self._stop.wait(self.sample_interval):
+            blocked = time.monotonic() - self._last_beat - self.interval
+            if blocked < self.threshold or self._stack is not None:
+                continue
+            frame = sys._current_frames().get(self._main_ident)
+            if frame is not None:
+                self._stack = traceback.extract_stack(frame)
+
+    # ----- Reporting -----
+
+    def report(self) -> str:
+        if not self.probes:
+            return ""
+        lines = [
+            f"Tk event loop: {self.probes} probes, max lateness {self.max_lateness * 1000:.0f} ms, "
+            f"{len(self.stalls)} stalls >= {self.threshold * 1000:.0f} ms"
+        ]
+        by_culprit = Counter()
+        worst: Dict[str, Dict] = {}
+        for stall in self.stalls:
+            by_culprit[stall["culprit"]] += 1
+            if stall["culprit"] not in worst or stall["ms"] > worst[stall["culprit"]]["ms"]:
+                worst[stall["culprit"]] = stall
+        for culprit, n in by_culprit.most_common(10):
+            stall = worst[culprit]
+            lines.append(f"  {n:>4}x  worst {stall['ms']:>7.0f} ms  {culprit}")
+            tail = traceback.StackSummary.from_list(stall["stack"][-6:])
+            lines.extend("        " + line.rstrip() for line in "".join(tail.format()).splitlines())
+        return "\n".join(lines)
+
+
+def _culprit(stack: traceback.StackSummary) -> str:
+    """Innermost frame from the app's own sources, else the innermost frame."""
+    if not stack:
+        return "<no sample>"
+    frame = next((f for f in reversed(stack) if f.filename.startswith(SRC_DIR)), stack[-1])
+    if frame.filename.startswith(SRC_DIR):
+        where = os.path.relpath(frame.filename, SRC_DIR)
+    else:
+        where = os.path.basename(frame.filename)
+    return f"{where}:{frame.lineno} {frame.name}"
+
+
+def install(root, threshold_ms: int = 100) -> LatencyMonitor:
+    """Start a monitor on ``root`` and include it in the instrumentation report."""
+    monitor = LatencyMonitor(root, threshold_ms=threshold_ms)
+    monitor.start()
+    instrument.add_report_section(monitor.report)
+    if not instrument.enabled:
+        atexit.register(lambda: sys.stderr.write(monitor.report() + "\n"))
+    return monitor